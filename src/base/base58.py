@@ -1,46 +1,183 @@
+from crypto.sha256 import SHA256
+
+# O alfabeto Base58 utilizado em Bitcoin (exclui 0, O, I, l)
+ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+
+# Tabela de decodificação: código do caractere (0-255) -> valor, ou -1 se inválido
+_DECODE_TABLE = [-1] * 256
+for _index, _char in enumerate(ALPHABET):
+    _DECODE_TABLE[ord(_char)] = _index
+_DECODE_TABLE = tuple(_DECODE_TABLE)
+
+# A conversão trabalha com "limbs" de 10 dígitos: 58^10 < 2^64 cabe numa palavra de máquina,
+# então só há uma operação de inteiro grande a cada 10 caracteres.
+_CHUNK_DIGITS = 10
+_CHUNK_BASE = 58 ** _CHUNK_DIGITS
+
+# Pares de dígitos pré-calculados: 0 .. 58^2 - 1 <-> 2 caracteres
+_PAIRS = tuple(a + b for a in ALPHABET for b in ALPHABET)
+_PAIR_VALUES = {pair: value for value, pair in enumerate(_PAIRS)}
+_PAIR_BASE = 58 * 58
+
+
+def _limb_to_str(limb):
+    """Converte um limb (< 58^10) em exatamente 10 caracteres Base58."""
+    limb, r0 = divmod(limb, _PAIR_BASE)
+    limb, r1 = divmod(limb, _PAIR_BASE)
+    limb, r2 = divmod(limb, _PAIR_BASE)
+    r4, r3 = divmod(limb, _PAIR_BASE)
+    return _PAIRS[r4] + _PAIRS[r3] + _PAIRS[r2] + _PAIRS[r1] + _PAIRS[r0]
+
+
+def encode(input_bytes):
+    """Codifica uma sequência de bytes em Base58."""
+    input_bytes = bytes(input_bytes)
+    stripped = input_bytes.lstrip(b'\x00')
+    # Cada byte zero no início vira um '1'
+    leading_zeros = len(input_bytes) - len(stripped)
+
+    n = int.from_bytes(stripped, 'big')
+    limbs = []
+    while n:
+        n, limb = divmod(n, _CHUNK_BASE)
+        limbs.append(limb)
+    if not limbs:
+        return '1' * leading_zeros or '1'
+
+    encoded = _limb_to_str(limbs[-1]).lstrip('1')
+    encoded += ''.join(_limb_to_str(limb) for limb in reversed(limbs[:-1]))
+    return '1' * leading_zeros + encoded
+
+
+def decode(base58_str):
+    """Decodifica uma string Base58 de volta para bytes."""
+    table = _DECODE_TABLE
+    pairs = _PAIR_VALUES
+    stripped = base58_str.lstrip('1')
+    # Cada '1' no início representa um byte zero
+    leading_zeros = len(base58_str) - len(stripped)
+
+    # Primeiro os dígitos que sobram da divisão em limbs, depois um limb de 10 dígitos
+    # (5 pares) por vez, com uma única operação de inteiro grande por limb
+    first = len(stripped) % _CHUNK_DIGITS
+    n = 0
+    try:
+        for char in stripped[:first]:
+            digit = table[ord(char)]
+            if digit < 0:
+                raise KeyError(char)
+            n = n * 58 + digit
+        for i in range(first, len(stripped), _CHUNK_DIGITS):
+            n = n * _CHUNK_BASE + ((((
+                pairs[stripped[i:i + 2]] * _PAIR_BASE
+                + pairs[stripped[i + 2:i + 4]]) * _PAIR_BASE
+                + pairs[stripped[i + 4:i + 6]]) * _PAIR_BASE
+                + pairs[stripped[i + 6:i + 8]]) * _PAIR_BASE
+                + pairs[stripped[i + 8:i + 10]])
+    except (KeyError, IndexError):
+        invalid = next(char for char in stripped if char not in ALPHABET)
+        raise ValueError(f"Caractere inválido em Base58: {invalid!r}")
+
+    decoded_bytes = n.to_bytes((n.bit_length() + 7) // 8, 'big')
+    return b'\x00' * leading_zeros + decoded_bytes
+
+
+def encode_check(payload):
+    """Base58Check: codifica payload || checksum (4 bytes do SHA256 duplo)."""
+    payload = bytes(payload)
+    return encode(payload + SHA256.checksum4(payload))
+
+
+def decode_check(base58_str):
+    """Decodifica Base58Check, valida o checksum e retorna apenas o payload."""
+    decoded = decode(base58_str)
+    if len(decoded) < 4:
+        raise ValueError("Dados Base58Check curtos demais para conter o checksum.")
+    payload, checksum = decoded[:-4], decoded[-4:]
+    if SHA256.checksum4(payload) != checksum:
+        raise ValueError("Checksum Base58Check inválido.")
+    return payload
+
+
+def encode_many(payloads):
+    """Codifica uma lista de sequências de bytes em Base58, na ordem de entrada."""
+    return [encode(payload) for payload in payloads]
+
+
+def decode_many(strings):
+    """Decodifica uma lista de strings Base58, na ordem de entrada."""
+    return [decode(string) for string in strings]
+
+
+def encode_check_many(payloads):
+    """Versão em lote de encode_check, com os checksums calculados juntos."""
+    payloads = [bytes(payload) for payload in payloads]
+    checksums = SHA256.checksum4_many(payloads)
+    return [encode(payload + checksum) for payload, checksum in zip(payloads, checksums)]
+
+
+def decode_check_many(strings, strict=True):
+    """
+    Versão em lote de decode_check. Com strict=False, entradas inválidas (caracteres
+    fora do alfabeto ou checksum errado) viram None em vez de levantar ValueError.
+    """
+    results = []
+    decoded_list = []
+    for string in strings:
+        try:
+            decoded = decode(string)
+            if len(decoded) < 4:
+                raise ValueError("Dados Base58Check curtos demais para conter o checksum.")
+        except ValueError:
+            if strict:
+                raise
+            decoded = None
+        decoded_list.append(decoded)
+    valid = [decoded for decoded in decoded_list if decoded is not None]
+    checksums = iter(SHA256.checksum4_many(decoded[:-4] for decoded in valid))
+    for decoded in decoded_list:
+        if decoded is None:
+            results.append(None)
+        elif next(checksums) == decoded[-4:]:
+            results.append(decoded[:-4])
+        elif strict:
+            raise ValueError("Checksum Base58Check inválido.")
+        else:
+            results.append(None)
+    return results
+
+
 class Base58:
 
-    def __init__(self):
-        # O alfabeto Base58 utilizado em Bitcoin (exclui 0, O, I, l)
-        self.ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+    ALPHABET = ALPHABET
 
     def encode(self, input_bytes):
         """Codifica uma sequência de bytes em Base58."""
-        # Conta o número de bytes zero no início
-        leading_zeros = len(input_bytes) - len(input_bytes.lstrip(b'\x00'))
-        
-        # Converte os bytes restantes para um número inteiro
-        n = int.from_bytes(input_bytes, 'big')
-        encoded = []
-
-        # Realiza a codificação para Base58
-        while n > 0:
-            n, rem = divmod(n, 58)
-            encoded.append(self.ALPHABET[rem])
-
-        # Adiciona os zeros à esquerda na forma de '1'
-        return '1' * leading_zeros + ''.join(reversed(encoded)) or '1'
+        return encode(input_bytes)
 
     def decode(self, base58_str):
         """Decodifica uma string Base58 de volta para bytes."""
-        base58_map = {char: index for index, char in enumerate(self.ALPHABET)}
+        return decode(base58_str)
+
+    def encode_check(self, payload):
+        """Codifica em Base58Check (payload + checksum de 4 bytes)."""
+        return encode_check(payload)
 
-        n = 0
-        for char in base58_str:
-            n *= 58
-            n += base58_map[char]
+    def decode_check(self, base58_str):
+        """Decodifica Base58Check, validando o checksum."""
+        return decode_check(base58_str)
 
-        # Calcula o número de bytes necessário para armazenar o valor
-        byte_length = (n.bit_length() + 7) // 8
+    def encode_many(self, payloads):
+        return encode_many(payloads)
 
-        # Converte o número de volta para bytes
-        decoded_bytes = n.to_bytes(byte_length, 'big')
+    def decode_many(self, strings):
+        return decode_many(strings)
 
-        # Conta o número de 1s à esquerda no endereço Base58
-        leading_zeros = len(base58_str) - len(base58_str.lstrip('1'))
+    def encode_check_many(self, payloads):
+        return encode_check_many(payloads)
 
-        # Adiciona os zeros à esquerda para refletir a quantidade de '1' no início do endereço Base58
-        return b'\x00' * leading_zeros + decoded_bytes
+    def decode_check_many(self, strings, strict=True):
+        return decode_check_many(strings, strict)
 
 
 if __name__ == "__main__":
@@ -54,3 +191,4 @@ if __name__ == "__main__":
 
     print(f"Wallet:         {wallet}")
     print(f"Wallet Encoded: {wallet_encode}")
+    print(f"Payload:        {base58.decode_check(wallet).hex()}")
@@ -0,0 +1,135 @@
+CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+
+_CHARSET_MAP = {char: value for value, char in enumerate(CHARSET)}
+
+# Constantes do checksum: bech32 (BIP173, testemunha v0) e bech32m (BIP350, v1 em diante)
+BECH32 = 1
+BECH32M = 0x2BC830A3
+
+_GENERATOR = (0x3B6A57B2, 0x26508E6D, 0x1EA119FA, 0x3D4233DD, 0x2A1462B3)
+
+
+def _polymod(values):
+    checksum = 1
+    for value in values:
+        top = checksum >> 25
+        checksum = (checksum & 0x1FFFFFF) << 5 ^ value
+        for i in range(5):
+            if (top >> i) & 1:
+                checksum ^= _GENERATOR[i]
+    return checksum
+
+
+def _hrp_expand(hrp):
+    return [ord(char) >> 5 for char in hrp] + [0] + [ord(char) & 31 for char in hrp]
+
+
+def _create_checksum(hrp, data, spec):
+    polymod = _polymod(_hrp_expand(hrp) + list(data) + [0] * 6) ^ spec
+    return [(polymod >> 5 * (5 - i)) & 31 for i in range(6)]
+
+
+def convertbits(data, from_bits, to_bits, pad=True):
+    """Reagrupa uma sequência de valores de from_bits bits em valores de to_bits bits."""
+    acc = 0
+    bits = 0
+    result = []
+    max_value = (1 << to_bits) - 1
+    for value in data:
+        if value < 0 or value >> from_bits:
+            raise ValueError("Valor fora do intervalo na conversão de bits.")
+        acc = (acc << from_bits) | value
+        bits += from_bits
+        while bits >= to_bits:
+            bits -= to_bits
+            result.append((acc >> bits) & max_value)
+    if pad:
+        if bits:
+            result.append((acc << (to_bits - bits)) & max_value)
+    elif bits >= from_bits or ((acc << (to_bits - bits)) & max_value):
+        raise ValueError("Preenchimento inválido na conversão de bits.")
+    return result
+
+
+def encode(hrp, data, spec=BECH32):
+    """Codifica o hrp e os valores de 5 bits em bech32 (ou bech32m com spec=BECH32M)."""
+    combined = list(data) + _create_checksum(hrp, data, spec)
+    return hrp + "1" + "".join(CHARSET[value] for value in combined)
+
+
+def decode(bech):
+    """
+    Decodifica uma string bech32/bech32m e retorna (hrp, valores de 5 bits, spec).
+    Rejeita maiúsculas e minúsculas misturadas, caracteres inválidos e checksum errado.
+    """
+    if any(ord(char) < 33 or ord(char) > 126 for char in bech):
+        raise ValueError("Caractere inválido em bech32.")
+    if bech.lower() != bech and bech.upper() != bech:
+        raise ValueError("Bech32 não pode misturar maiúsculas e minúsculas.")
+    bech = bech.lower()
+    position = bech.rfind("1")
+    if position < 1 or position + 7 > len(bech) or len(bech) > 90:
+        raise ValueError("Tamanho ou separador bech32 inválido.")
+    hrp = bech[:position]
+    try:
+        data = [_CHARSET_MAP[char] for char in bech[position + 1:]]
+    except KeyError:
+        raise ValueError("Caractere fora do alfabeto bech32.")
+    spec = _polymod(_hrp_expand(hrp) + data)
+    if spec not in (BECH32, BECH32M):
+        raise ValueError("Checksum bech32 inválido.")
+    return hrp, data[:-6], spec
+
+
+def encode_segwit(hrp, witness_version, witness_program):
+    """Endereço SegWit: bech32 para a versão 0 e bech32m para as demais (BIP350)."""
+    spec = BECH32 if witness_version == 0 else BECH32M
+    return encode(hrp, [witness_version] + convertbits(witness_program, 8, 5), spec)
+
+
+def decode_segwit(hrp, address):
+    """Decodifica um endereço SegWit do hrp esperado e retorna (versão, programa)."""
+    decoded_hrp, data, spec = decode(address)
+    if decoded_hrp != hrp:
+        raise ValueError(f"Prefixo (hrp) inesperado: {decoded_hrp!r}")
+    if not data or data[0] > 16:
+        raise ValueError("Versão de testemunha inválida.")
+    witness_version = data[0]
+    program = bytes(convertbits(data[1:], 5, 8, False))
+    if not 2 <= len(program) <= 40:
+        raise ValueError("Tamanho do programa de testemunha inválido.")
+    if witness_version == 0 and len(program) not in (20, 32):
+        raise ValueError("Programa de testemunha v0 deve ter 20 ou 32 bytes.")
+    if spec != (BECH32 if witness_version == 0 else BECH32M):
+        raise ValueError("Checksum incompatível com a versão de testemunha.")
+    return witness_version, program
+
+
+class Bech32:
+
+    CHARSET = CHARSET
+
+    def encode(self, hrp, data, spec=BECH32):
+        """Codifica valores de 5 bits em bech32."""
+        return encode(hrp, data, spec)
+
+    def decode(self, bech):
+        """Decodifica bech32/bech32m em (hrp, valores de 5 bits, spec)."""
+        return decode(bech)
+
+    def encode_segwit(self, hrp, witness_version, witness_program):
+        """Codifica um endereço SegWit (bc/tb)."""
+        return encode_segwit(hrp, witness_version, witness_program)
+
+    def decode_segwit(self, hrp, address):
+        """Decodifica um endereço SegWit, validando hrp, versão e programa."""
+        return decode_segwit(hrp, address)
+
+
+if __name__ == "__main__":
+    bech32 = Bech32()
+
+    address = "bc1qw508d6qejxtdg4y5r3zarvary0c5xw7kv8f3t4"
+    version, program = bech32.decode_segwit("bc", address)
+    print(version, program.hex())
+    print(f"Valid? {bech32.encode_segwit('bc', version, program) == address}")
@@ -0,0 +1,334 @@
+import argparse
+import hashlib
+import json
+import platform
+import sys
+import time
+from collections import namedtuple
+
+from base.base58 import Base58
+from bitcoin.address import Address
+from bitcoin.secp256k1 import Secp256k1
+from bitcoin.wif import WIF
+from crypto.ripemd160 import Ripemd160, _numpy
+from crypto.sha256 import SHA256
+from ecc.field import available_backends, self_test
+
+# Um caso de benchmark: func() é uma chamada que processa `ops` itens
+Case = namedtuple("Case", ["name", "params", "func", "ops"])
+
+# Tamanhos de entrada (bytes) dos hashes e tamanhos de lote das APIs *_many
+INPUT_SIZES = (32, 64, 1024, 16384)
+BATCH_SIZES = (1, 64, 1024)
+QUICK_INPUT_SIZES = (32, 1024)
+QUICK_BATCH_SIZES = (1, 64)
+
+# Vetores conhecidos (chave privada 1)
+KNOWN_ADDRESS = "1BgGZ9tcN4rm9KBzDn7KprQz87SZ26SAMH"
+KNOWN_WIF = "KwDiBf89QgGbjEhKnhXJuH7LrciVrZi3qYjgd9M7rFU73sVHnoWn"
+KNOWN_PUBLIC_KEY = "0279be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798"
+KNOWN_HASH160 = "751e76e8199196d454941c45d1b3a323f1433bd6"
+KNOWN_RIPEMD160 = {b"": "9c1185a5c5e9fc54612808977ee8f548b2258d31",
+                   b"abc": "8eb208f7e05d987a9b044a8e98c6b087f15a0bfc"}
+
+
+def _message(size, seed=0):
+    """Mensagem determinística de `size` bytes."""
+    return bytes((seed + i * 7) & 0xFF for i in range(size))
+
+
+def _ripemd160_reference(data):
+    """RIPEMD-160 do hashlib, ou None se o OpenSSL do sistema não o oferece."""
+    try:
+        return hashlib.new("ripemd160", data).digest()
+    except ValueError:
+        return None
+
+
+def check_correctness():
+    """
+    Confere cada primitiva contra o hashlib (quando disponível) e vetores conhecidos.
+    Retorna uma lista de dicts {"name", "ok", "detail"}.
+    """
+    secp256k1 = Secp256k1()
+    ecc = secp256k1.ecc
+    address = Address()
+    wif = WIF()
+    base58 = Base58()
+    ripemd160 = Ripemd160()
+    checks = []
+
+    def check(name, ok, detail=""):
+        checks.append({"name": name, "ok": bool(ok), "detail": detail})
+
+    sizes = (0, 1, 55, 56, 63, 64, 65, 1000)
+    messages = [_message(size, size) for size in sizes]
+    check("sha256 x hashlib", all(SHA256.sha256(m) == hashlib.sha256(m).digest() for m in messages))
+    check("sha256_many x hashlib", SHA256.sha256_many(messages * 8) == [hashlib.sha256(m).digest() for m in messages * 8])
+    check("hash256 x hashlib", all(SHA256.hash256(m) == hashlib.sha256(hashlib.sha256(m).digest()).digest() for m in messages))
+
+    if _ripemd160_reference(b"") is not None:
+        check("ripemd160 x hashlib", all(ripemd160.digest(m) == _ripemd160_reference(m) for m in messages))
+    else:
+        check("ripemd160 x hashlib", True, "ripemd160 indisponível no hashlib; usados só os vetores conhecidos")
+    check("ripemd160 vetores", all(ripemd160.digest(m).hex() == h for m, h in KNOWN_RIPEMD160.items()))
+
+    payloads = [b"\x00\x00\x01", _message(21), _message(38, 3)]
+    check("base58 ida e volta", all(base58.decode(base58.encode(p)) == p for p in payloads))
+    payloads.append(b"")
+    check("base58check ida e volta", all(base58.decode_check(base58.encode_check(p)) == p for p in payloads))
+
+    g = (ecc.Gx, ecc.Gy)
+    check("eccnP(1) == G", ecc.eccnP(1) == g)
+    check("doublep(G) == eccnP(2)", ecc.doublep(*g) == ecc.eccnP(2))
+    check("addp(G, 2G) == eccnP(3)", ecc.addp(*g, *ecc.eccnP(2)) == ecc.eccnP(3))
+    check("eccnP(n - 1) == -G", ecc.eccnP(ecc.n_order - 1) == (ecc.Gx, ecc.p - ecc.Gy))
+    value = int.from_bytes(_message(32, 9), "big") % ecc.p
+    check("inverse", value * ecc.inverse(value, ecc.p) % ecc.p == 1)
+    for field in available_backends(ecc.p):
+        check(f"field[{field.name}] self-test", self_test(field))
+
+    check("wif vetor", wif.private_key_to_WIF(1, compressed=True) == KNOWN_WIF)
+    check("wif ida e volta", all(
+        wif.WIF_to_privatekey(wif.private_key_to_WIF(k, c), integer=True) == (k, c)
+        for k in (1, 2 ** 128 + 1, ecc.n_order - 1) for c in (True, False)
+    ))
+
+    public_key = address.private_to_public(1)
+    check("chave pública vetor", public_key == KNOWN_PUBLIC_KEY)
+    check("hash160 vetor", address.public_to_hash160(public_key).hex() == KNOWN_HASH160)
+    check("endereço vetor", address.public_to_address(public_key) == KNOWN_ADDRESS)
+    return checks
+
+
+def build_cases(input_sizes=INPUT_SIZES, batch_sizes=BATCH_SIZES):
+    """Monta todos os casos de benchmark para os tamanhos de entrada e de lote informados."""
+    secp256k1 = Secp256k1()
+    ecc = secp256k1.ecc
+    address = Address()
+    wif = WIF()
+    base58 = Base58()
+    ripemd160 = Ripemd160()
+    cases = []
+
+    # Hashes: uma mensagem por chamada, em vários tamanhos
+    for size in input_sizes:
+        message = _message(size)
+        cases.append(Case("sha256", {"size": size}, lambda m=message: SHA256.sha256(m), 1))
+        cases.append(Case("ripemd160", {"size": size}, lambda m=message: ripemd160.digest(m), 1))
+
+    # APIs em lote: `batch` mensagens por chamada (ops/s conta mensagens)
+    for batch in batch_sizes:
+        keys = [_message(33, i) for i in range(batch)]
+        digests = [_message(32, i) for i in range(batch)]
+        payloads = [b"\x00" + _message(20, i) for i in range(batch)]
+        encoded = base58.encode_check_many(payloads)
+        private_keys = [int.from_bytes(_message(32, i), "big") % (ecc.n_order - 1) + 1 for i in range(batch)]
+        cases.append(Case("sha256_many", {"size": 33, "batch": batch}, lambda m=keys: SHA256.sha256_many(m), batch))
+        cases.append(Case("ripemd160_many", {"size": 32, "batch": batch}, lambda m=digests: ripemd160.digest_many(m), batch))
+        cases.append(Case("hash160_many", {"size": 33, "batch": batch}, lambda m=keys: Ripemd160.hash160_many(m), batch))
+        cases.append(Case("base58.encode_check_many", {"batch": batch}, lambda p=payloads: base58.encode_check_many(p), batch))
+        cases.append(Case("base58.decode_check_many", {"batch": batch}, lambda s=encoded: base58.decode_check_many(s), batch))
+        cases.append(Case("eccnP_batch", {"batch": batch}, lambda k=private_keys: ecc.eccnP_batch(k), batch))
+
+    for size in (21, 25, 38):
+        payload = _message(size)
+        encoded = base58.encode(payload)
+        cases.append(Case("base58.encode", {"size": size}, lambda p=payload: base58.encode(p), 1))
+        cases.append(Case("base58.decode", {"size": size}, lambda s=encoded: base58.decode(s), 1))
+
+    # Curva elíptica
+    private_key = int.from_bytes(_message(32, 5), "big") % ecc.n_order
+    x1, y1 = ecc.eccnP(private_key)
+    x2, y2 = ecc.eccnP(private_key + 1)
+    cases.append(Case("eccnP", {}, lambda: ecc.eccnP(private_key), 1))
+    cases.append(Case("addp", {}, lambda: ecc.addp(x1, y1, x2, y2), 1))
+    cases.append(Case("doublep", {}, lambda: ecc.doublep(x1, y1), 1))
+    cases.append(Case("inverse", {}, lambda: ecc.inverse(x1, ecc.p), 1))
+
+    # Backends de F_p (ecc.field): a escolha na importação é fixa, as medições ficam aqui
+    for field in available_backends(ecc.p):
+        cases.append(Case("field.inverse", {"backend": field.name}, lambda f=field: f.inverse(x1), 1))
+        cases.append(Case("field.sqrt", {"backend": field.name}, lambda f=field: f.sqrt(x1), 1))
+
+    # WIF e derivação de endereço de ponta a ponta
+    wif_string = wif.private_key_to_WIF(private_key, compressed=True)
+    cases.append(Case("wif.encode", {}, lambda: wif.private_key_to_WIF(private_key, compressed=True), 1))
+    cases.append(Case("wif.decode", {}, lambda: wif.WIF_to_privatekey(wif_string, integer=True), 1))
+    cases.append(Case("wif.round_trip", {}, lambda: wif.WIF_to_privatekey(
+        wif.private_key_to_WIF(private_key, compressed=True), integer=True), 1))
+    cases.append(Case("address.derive", {}, lambda: address.public_to_address(address.private_to_public(private_key)), 1))
+    return cases
+
+
+def _percentile(sorted_values, fraction):
+    """Percentil por posição mais próxima de uma lista já ordenada."""
+    index = min(len(sorted_values) - 1, max(0, round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def measure(case, samples=20, min_sample_time=0.005):
+    """
+    Mede um caso: calibra quantas chamadas cabem em min_sample_time e coleta
+    `samples` amostras. A latência por chamada de cada amostra alimenta os percentis.
+    """
+    func = case.func
+    func()  # Aquecimento (tabelas, caches)
+
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_sample_time or calls >= 1 << 20:
+            break
+        calls *= 2
+
+    latencies = []
+    total = 0.0
+    for _ in range(samples):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        elapsed = time.perf_counter() - start
+        total += elapsed
+        latencies.append(elapsed / calls)
+    latencies.sort()
+
+    return {
+        "name": case.name,
+        "params": case.params,
+        "calls": calls * samples,
+        "ops_per_sec": case.ops * calls * samples / total,
+        "latency": {
+            "min": latencies[0],
+            "p50": _percentile(latencies, 0.50),
+            "p90": _percentile(latencies, 0.90),
+            "p99": _percentile(latencies, 0.99),
+            "max": latencies[-1],
+        },
+    }
+
+
+def case_key(result):
+    """Identificador estável de um resultado (nome + parâmetros), usado na comparação."""
+    params = ",".join(f"{k}={v}" for k, v in sorted(result["params"].items()))
+    return f"{result['name']}[{params}]" if params else result["name"]
+
+
+def run(quick=False, name_filter=None, samples=None, stream=None):
+    """Executa as conferências e os benchmarks e retorna o relatório (dict serializável em JSON)."""
+    if quick:
+        cases = build_cases(QUICK_INPUT_SIZES, QUICK_BATCH_SIZES)
+    else:
+        cases = build_cases()
+    if name_filter:
+        cases = [case for case in cases if name_filter in case.name]
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "numpy": getattr(_numpy(), "__version__", None),
+            "field": Secp256k1().ecc.field.name,
+            "quick": quick,
+        },
+        "checks": check_correctness(),
+        "results": [],
+    }
+    for case in cases:
+        result = measure(case, samples or (5 if quick else 20))
+        report["results"].append(result)
+        if stream is not None:
+            stream.write(f"{case_key(result):<45} {result['ops_per_sec']:>14,.1f} ops/s  "
+                         f"p50 {result['latency']['p50'] * 1e6:>10.2f} µs\n")
+            stream.flush()
+    return report
+
+
+def compare(baseline, current, threshold=0.10):
+    """
+    Compara dois relatórios. Um caso é regressão quando ops/s caiu mais que
+    `threshold` (fração) em relação à baseline. Retorna uma lista de dicts
+    {"case", "baseline", "current", "change", "status"}.
+    """
+    baseline_results = {case_key(result): result for result in baseline["results"]}
+    rows = []
+    for result in current["results"]:
+        key = case_key(result)
+        previous = baseline_results.get(key)
+        if previous is None:
+            rows.append({"case": key, "baseline": None, "current": result["ops_per_sec"],
+                         "change": None, "status": "new"})
+            continue
+        change = result["ops_per_sec"] / previous["ops_per_sec"] - 1
+        if change < -threshold:
+            status = "regression"
+        elif change > threshold:
+            status = "improvement"
+        else:
+            status = "unchanged"
+        rows.append({"case": key, "baseline": previous["ops_per_sec"], "current": result["ops_per_sec"],
+                     "change": change, "status": status})
+    return rows
+
+
+def _print_comparison(rows, stream):
+    for row in rows:
+        change = "" if row["change"] is None else f"{row['change'] * 100:+.1f}%"
+        stream.write(f"{row['case']:<45} {change:>9}  {row['status']}\n")
+
+
+def _load(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks e conferências das primitivas do PureCryptoTools.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Executa os benchmarks e grava o relatório em JSON.")
+    run_parser.add_argument("-o", "--output", help="Arquivo JSON de saída (padrão: stdout).")
+    run_parser.add_argument("--quick", action="store_true", help="Menos tamanhos e amostras.")
+    run_parser.add_argument("--filter", help="Executa só os casos cujo nome contém este texto.")
+    run_parser.add_argument("--samples", type=int, help="Amostras por caso.")
+    run_parser.add_argument("--baseline", help="Relatório JSON anterior para comparar ao final.")
+    run_parser.add_argument("--threshold", type=float, default=0.10, help="Queda de ops/s considerada regressão (fração).")
+
+    compare_parser = subparsers.add_parser("compare", help="Compara um relatório com uma baseline.")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.10, help="Queda de ops/s considerada regressão (fração).")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        report = run(args.quick, args.filter, args.samples, stream=sys.stderr)
+        failed = [check["name"] for check in report["checks"] if not check["ok"]]
+        for name in failed:
+            sys.stderr.write(f"FALHA na conferência: {name}\n")
+        text = json.dumps(report, indent=2, ensure_ascii=False)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                f.write(text + "\n")
+        else:
+            print(text)
+        if failed:
+            return 2
+        if not args.baseline:
+            return 0
+        baseline, current = _load(args.baseline), report
+    else:
+        baseline, current = _load(args.baseline), _load(args.current)
+
+    rows = compare(baseline, current, args.threshold)
+    _print_comparison(rows, sys.stderr)
+    return 1 if any(row["status"] == "regression" for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+import functools
+import time
+from contextlib import contextmanager
+
+import crypto.ripemd160 as ripemd160_module
+import crypto.sha256 as sha256_module
+from bitcoin.address import Address
+from ecc.elliptic_curve_cryptography import EllipticCurveCryptography
+
+# Métodos de EllipticCurveCryptography contados, por contador (multiplicações em F_p
+# não têm método próprio e não são contadas; ver Instrumentation)
+ECC_COUNTERS = {
+    "inverse": "inversions",
+    "batch_inverse": "batch_inversions",
+    "addp": "point_additions",
+    "jacobian_add_mixed": "point_additions",
+    "jacobian_add": "point_additions",
+    "doublep": "point_doublings",
+    "jacobian_double": "point_doublings",
+    "eccnP_jacobian": "scalar_multiplications",
+    "multiply_jacobian": "scalar_multiplications",
+}
+
+# Etapas de Address.private_to_public / public_to_address com cronômetro próprio
+ADDRESS_STAGES = {
+    "private_to_public": "private_to_public",
+    "public_to_address": "public_to_address",
+    "private_key_to_public_key_points": "scalar_multiplication",
+    "public_key_points_to_public_bytes": "serialization",
+    "public_bytes_to_hash160": "hash160",
+    "hash160_to_address": "base58check",
+}
+
+COUNTERS = (
+    "inversions",
+    "batch_inversions",
+    "point_additions",
+    "point_doublings",
+    "scalar_multiplications",
+    "sha256_blocks",
+    "ripemd160_blocks",
+)
+
+
+def _blocks(length):
+    """Número de blocos de 64 bytes de uma mensagem de `length` bytes após o padding."""
+    return (length + 72) // 64
+
+
+class Instrumentation:
+    """
+    Contadores de operações e cronômetros por etapa, opcionais.
+
+    Desativada, não existe nenhum código extra no caminho das primitivas: enable()
+    troca os métodos/funções por versões que contam ou medem, e disable() devolve
+    os originais. Os contadores refletem chamadas de método; somas afins feitas em
+    linha nos caminhos em lote (eccnP_batch, SequentialKeyIterator) não são contadas
+    individualmente, mas as inversões em lote e as multiplicações escalares são.
+
+    Não há contador de multiplicações em F_p: elas são feitas em linha (`a * b % p`)
+    nas fórmulas da curva, sem um método que possa ser trocado, e contá-las exigiria
+    instrumentar cada operação do caminho quente. As somas e duplicações de pontos
+    (com número fixo de multiplicações por fórmula) servem de aproximação; o contador
+    scalar_multiplications é um acréscimo, não um substituto para elas.
+    """
+
+    def __init__(self):
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.timers = {}
+        self._originals = []
+        self._depth = 0
+
+    @property
+    def enabled(self):
+        return bool(self._originals)
+
+    def reset(self):
+        # Zera no lugar: os wrappers instalados guardam referência a estes dicts
+        for counter in self.counters:
+            self.counters[counter] = 0
+        self.timers.clear()
+
+    def snapshot(self):
+        """Cópia dos contadores e dos cronômetros ({etapa: {"calls", "seconds"}})."""
+        return {
+            "counters": dict(self.counters),
+            "timers": {stage: dict(timer) for stage, timer in self.timers.items()},
+        }
+
+    def _patch(self, owner, name, wrapper):
+        original = getattr(owner, name)
+        self._originals.append((owner, name, original))
+        setattr(owner, name, functools.wraps(original)(wrapper(original)))
+
+    def _counting(self, counter, amount=None):
+        counters = self.counters
+
+        def wrapper(original):
+            def counted(*args, **kwargs):
+                counters[counter] += 1 if amount is None else amount(*args, **kwargs)
+                return original(*args, **kwargs)
+            return counted
+        return wrapper
+
+    def _timing(self, stage):
+        def wrapper(original):
+            def timed(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return original(*args, **kwargs)
+                finally:
+                    timer = self.timers.setdefault(stage, {"calls": 0, "seconds": 0.0})
+                    timer["calls"] += 1
+                    timer["seconds"] += time.perf_counter() - start
+            return timed
+        return wrapper
+
+    def enable(self):
+        """Instala os contadores e cronômetros (chamadas aninhadas só contam uma vez)."""
+        self._depth += 1
+        if self.enabled:
+            return self
+        for name, counter in ECC_COUNTERS.items():
+            self._patch(EllipticCurveCryptography, name, self._counting(counter))
+        self._patch(EllipticCurveCryptography, "eccnP_batch",
+                    self._counting("scalar_multiplications", lambda ecc, keys: len(keys)))
+        self._patch(sha256_module, "_compress", self._counting("sha256_blocks"))
+        self._patch(sha256_module, "_sha256_lanes",
+                    self._counting("sha256_blocks", lambda messages, length: len(messages) * _blocks(length)))
+        self._patch(ripemd160_module, "_compress", self._counting("ripemd160_blocks"))
+        self._patch(ripemd160_module, "_ripemd160_lanes",
+                    self._counting("ripemd160_blocks", lambda messages, length: len(messages) * _blocks(length)))
+        for name, stage in ADDRESS_STAGES.items():
+            self._patch(Address, name, self._timing(stage))
+        return self
+
+    def disable(self):
+        """Restaura as implementações originais quando o último enable() é desfeito."""
+        self._depth = max(0, self._depth - 1)
+        if self._depth:
+            return
+        while self._originals:
+            owner, name, original = self._originals.pop()
+            setattr(owner, name, original)
+
+
+# Instância do processo
+instrumentation = Instrumentation()
+
+
+def enable():
+    return instrumentation.enable()
+
+
+def disable():
+    instrumentation.disable()
+
+
+def reset():
+    instrumentation.reset()
+
+
+def snapshot():
+    return instrumentation.snapshot()
+
+
+@contextmanager
+def profile(reset_stats=True):
+    """
+    Ativa a instrumentação dentro do bloco with e retorna a instância, cujo
+    snapshot() pode ser lido dentro ou depois do bloco.
+    """
+    if reset_stats:
+        instrumentation.reset()
+    instrumentation.enable()
+    try:
+        yield instrumentation
+    finally:
+        instrumentation.disable()
+
+
+if __name__ == "__main__":
+    import json
+
+    address = Address()
+
+    with profile() as stats:
+        for private_key in range(1, 11):
+            address.public_to_address(address.private_to_public(private_key))
+        address.private_key_to_public_key_points_many(range(11, 21))
+
+    print(json.dumps(stats.snapshot(), indent=2))
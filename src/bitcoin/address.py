@@ -1,11 +1,45 @@
+from functools import partial
+
+from bitcoin.derivation_cache import DerivationCache
+from bitcoin.parallel import map_numbered_chunks
+from bitcoin.public_key import PublicKey
 from bitcoin.secp256k1 import Secp256k1
+from bitcoin.wif import STATUS_OK, WIF
 from crypto.ripemd160 import Ripemd160
 from crypto.sha256 import SHA256
 from base.base58 import Base58
+from base.bech32 import Bech32
+
+# Formatos de endereço de point_to_addresses(), na ordem dos registros em lote
+ADDRESS_FORMATS = ("p2pkh_compressed", "p2pkh_uncompressed", "p2wpkh", "p2sh_p2wpkh")
+
+# Rede -> (versão P2PKH, versão P2SH, hrp bech32)
+ADDRESS_NETWORKS = {
+    "mainnet": (b'\x00', b'\x05', "bc"),
+    "testnet": (b'\x6f', b'\xc4', "tb"),
+}
+
+# Status de addresses_many para chaves públicas inválidas (formato, tamanho ou fora da curva)
+STATUS_INVALID_PUBLIC_KEY = "invalid_public_key"
+
+# Instância de Address de cada processo de trabalho de addresses_many()
+_worker = {}
+
+
+def p2wpkh_script(hash160):
+    """Script de testemunha v0 (OP_0 <20 bytes>): redeem script do P2SH-P2WPKH."""
+    return b'\x00\x14' + bytes(hash160)
+
+
+def _addresses_chunk(public_keys, testnet=False):
+    """Calcula os endereços de um bloco de chaves públicas em um processo de trabalho."""
+    if "address" not in _worker:
+        _worker["address"] = Address()
+    return _worker["address"].public_keys_to_addresses(public_keys, testnet)
 
 
 class Address:
-    def __init__(self):
+    def __init__(self, cache_size=0):
         # Instanciar secp256k1
         self.secp256k1 = Secp256k1()
 
@@ -18,21 +52,75 @@ class Address:
         # Instanciar Ripemd160
         self.ripemd160 = Ripemd160()
 
+        # Instanciar Bech32
+        self.bech32 = Bech32()
+
+        # Instanciar WIF
+        self.wif = WIF()
+
+        # Instanciar PublicKey (leitura e validação de chaves SEC1)
+        self.public_key = PublicKey(secp256k1=self.secp256k1)
+
+        # Cache LRU opcional de pontos, hash160 e endereços (ver DerivationCache)
+        self.cache = DerivationCache(cache_size) if cache_size else None
+
     def private_key_to_public_key_points(self, private_key):
         # Calculate public key point
+        cache = self.cache
+        if cache is not None:
+            point = cache.points.get(private_key)
+            if point is not None:
+                return point
+
         public_key_x, public_key_y = self.secp256k1.ecc.eccnP(private_key)
 
+        # Validado sempre, com ou sem cache: quem recebe o ponto não precisa repetir in_curve
+        if not self.secp256k1.ecc.in_curve(public_key_x, public_key_y):
+            raise ValueError("A chave pública gerada não está na curva.")
+
+        if cache is not None:
+            cache.points.put(private_key, (public_key_x, public_key_y))
+
         return public_key_x, public_key_y
 
+    def private_key_to_public_key_points_many(self, private_keys):
+        """
+        Calcula os pontos das chaves públicas de várias chaves privadas de uma vez,
+        compartilhando as inversões modulares entre o lote. Mantém a ordem de entrada.
+        """
+        return self.secp256k1.ecc.eccnP_batch(list(private_keys))
+
     def private_to_public(self, private_key, compressed=True):
         """
         Converte uma chave privada para chave pública usando a curva secp256k1.
         """
-        public_key_x, public_key_y = self.private_key_to_public_key_points(private_key)
-        
+        return self.private_to_public_bytes(private_key, compressed).hex()
+
+    def private_to_public_many(self, private_keys, compressed=True):
+        """
+        Versão em lote de private_to_public: retorna as chaves públicas (hex) na ordem de entrada.
+        """
+        return [
+            self.public_key_points_to_public(public_key_x, public_key_y, compressed)
+            for public_key_x, public_key_y in self.private_key_to_public_key_points_many(private_keys)
+        ]
+
+    def public_key_points_to_public(self, public_key_x, public_key_y, compressed=True):
+        """
+        Serializa o ponto (x, y) da chave pública no formato SEC1 (hex).
+        """
+        return self.public_key_points_to_public_bytes(public_key_x, public_key_y, compressed).hex()
+
+    def public_key_points_to_public_bytes(self, public_key_x, public_key_y, compressed=True):
+        """
+        Serializa o ponto (x, y) da chave pública no formato SEC1 (bytes).
+        """
         if not self.secp256k1.ecc.in_curve(public_key_x, public_key_y):
             raise ValueError("A chave pública gerada não está na curva.")
-        
+
+        return self._serialize_point(public_key_x, public_key_y, compressed)
+
+    def _serialize_point(self, public_key_x, public_key_y, compressed=True):
         if compressed:
             # Formato comprimido: 0x02 se y é par, 0x03 se y é ímpar
             prefix = b'\x02' if public_key_y % 2 == 0 else b'\x03'
@@ -45,35 +133,211 @@ class Address:
                 + public_key_y.to_bytes(32, byteorder='big')
             )
         
-        return public_key.hex()
-    
+        return public_key
+
+    def private_to_public_bytes(self, private_key, compressed=True):
+        """
+        Versão de private_to_public que retorna a chave pública em bytes, sem passar por hex.
+        """
+        # O ponto já foi validado na curva por private_key_to_public_key_points
+        public_key_x, public_key_y = self.private_key_to_public_key_points(private_key)
+        return self._serialize_point(public_key_x, public_key_y, compressed)
+
+    def public_to_hash160(self, public_key):
+        """
+        Calcula RIPEMD160(SHA256(chave pública)) a partir da chave pública em hex.
+        """
+        return self.public_bytes_to_hash160(bytes.fromhex(public_key))
+
+    def public_bytes_to_hash160(self, public_key_bytes):
+        """
+        Calcula RIPEMD160(SHA256(chave pública)) a partir da chave pública em bytes.
+        """
+        cache = self.cache
+        if cache is None:
+            return self.ripemd160.hash160(public_key_bytes)
+        public_key_bytes = bytes(public_key_bytes)
+        hash160 = cache.hash160s.get(public_key_bytes)
+        if hash160 is None:
+            hash160 = self.ripemd160.hash160(public_key_bytes)
+            cache.hash160s.put(public_key_bytes, hash160)
+        return hash160
+
+    def hash160_to_address(self, hash160, version=b'\x00'):
+        """
+        Codifica um hash160 em endereço Base58Check (prefixo 0x00 para endereço padrão).
+        """
+        return self.base58.encode_check(version + bytes(hash160))
+
     def public_to_address(self, public_key):
         """
         Converte a chave pública em um endereço compatível com BitAiir.
         """
-        public_key_bytes = bytes.fromhex(public_key)
-        sha256_bpk = self.sha256.sha256(public_key_bytes)
-        ripemd160_bpk = self.ripemd160.digest(sha256_bpk)
-        prefixed_bpk = b'\x00' + ripemd160_bpk  # Prefixo 0x00 para endereço padrão
-        
-        checksum = self.sha256.sha256(self.sha256.sha256(prefixed_bpk))[:4]
-        address = self.base58.encode(prefixed_bpk + checksum)
+        return self.public_bytes_to_address(bytes.fromhex(public_key))
+
+    def public_bytes_to_address(self, public_key_bytes, version=b'\x00'):
+        """
+        Versão de public_to_address que recebe a chave pública em bytes.
+        """
+        cache = self.cache
+        if cache is None:
+            ripemd160_bpk = self.public_bytes_to_hash160(public_key_bytes)
+            return self.hash160_to_address(ripemd160_bpk, version)
+
+        public_key_bytes = bytes(public_key_bytes)
+        addresses = cache.addresses.get(public_key_bytes)
+        if addresses is None:
+            addresses = {}
+            cache.addresses.put(public_key_bytes, addresses)
+        address = addresses.get(version)
+        if address is None:
+            ripemd160_bpk = self.public_bytes_to_hash160(public_key_bytes)
+            address = addresses[version] = self.hash160_to_address(ripemd160_bpk, version)
         return address
 
+    def public_keys_to_addresses(self, public_keys, testnet=False):
+        """
+        Endereços P2PKH de uma lista de chaves públicas SEC1 (hex ou bytes), validadas
+        na curva, com os hash160 e os checksums do lote calculados juntos.
+
+        Returns:
+            list: (endereço, status) por chave, na ordem de entrada; o endereço é None
+            quando a chave é inválida (STATUS_INVALID_PUBLIC_KEY).
+        """
+        points = self.public_key.parse_many(public_keys, strict=False)
+        # A chave é serializada de novo na forma recebida: 33 bytes (66 em hex) é a comprimida
+        public_keys_bytes = [
+            self._serialize_point(*point, len(public_key) in (33, 66))
+            for public_key, point in zip(public_keys, points) if point is not None
+        ]
+        version = b'\x6f' if testnet else b'\x00'
+        addresses = iter(self.base58.encode_check_many(
+            version + hash160 for hash160 in self.ripemd160.hash160_many(public_keys_bytes)
+        ))
+        return [(next(addresses), STATUS_OK) if point is not None else (None, STATUS_INVALID_PUBLIC_KEY)
+                for point in points]
+
+    def addresses_many(self, public_keys, testnet=False, errors=None, batch_size=4096, jobs=1):
+        """
+        Versão de public_keys_to_addresses para um fluxo (ex.: as linhas de um arquivo),
+        em lotes e opcionalmente em vários processos, como WIF.decode_many: valores em
+        branco são ignorados e as chaves inválidas não interrompem o fluxo.
+
+        Args:
+            errors (file): Opcional. Recebe uma linha "número<TAB>status<TAB>valor" por chave
+                inválida, com o número da linha na entrada (contando as linhas em branco).
+
+        Yields:
+            tuple: (endereço, status), na ordem de entrada.
+        """
+        if jobs == 1:
+            batch = partial(self.public_keys_to_addresses, testnet=testnet)
+        else:
+            batch = partial(_addresses_chunk, testnet=testnet)
+        for numbers, chunk, results in map_numbered_chunks(batch, public_keys, jobs, batch_size):
+            for line_number, value, result in zip(numbers, chunk, results):
+                if result[1] != STATUS_OK and errors is not None:
+                    errors.write(f"{line_number}\t{result[1]}\t{value}\n")
+                yield result
+
+    def hash160_to_p2wpkh(self, hash160, testnet=False):
+        """
+        Endereço SegWit nativo (P2WPKH, bech32) de um hash160 de chave pública comprimida.
+        """
+        return self.bech32.encode_segwit("tb" if testnet else "bc", 0, bytes(hash160))
+
+    def hash160_to_p2sh_p2wpkh(self, hash160, testnet=False):
+        """
+        Endereço SegWit aninhado (P2SH-P2WPKH): hash160 do script de testemunha em Base58Check.
+        """
+        script_hash = self.ripemd160.hash160(p2wpkh_script(hash160))
+        return self.hash160_to_address(script_hash, b'\xc4' if testnet else b'\x05')
+
+    def hash160s_to_addresses(self, hash160_compressed, hash160_uncompressed, network="mainnet", script_hash=None):
+        """
+        Todos os formatos de endereço (ver ADDRESS_FORMATS) de uma rede a partir dos
+        hash160 das chaves comprimida e não comprimida. SegWit só usa a comprimida.
+        """
+        version, script_version, hrp = ADDRESS_NETWORKS[network]
+        if script_hash is None:
+            script_hash = self.ripemd160.hash160(p2wpkh_script(hash160_compressed))
+        return {
+            "p2pkh_compressed": self.hash160_to_address(hash160_compressed, version),
+            "p2pkh_uncompressed": self.hash160_to_address(hash160_uncompressed, version),
+            "p2wpkh": self.bech32.encode_segwit(hrp, 0, bytes(hash160_compressed)),
+            "p2sh_p2wpkh": self.hash160_to_address(script_hash, script_version),
+        }
+
+    def point_to_addresses(self, public_key_x, public_key_y, networks=("mainnet", "testnet")):
+        """
+        Endereços legados (P2PKH), SegWit nativos (P2WPKH) e aninhados (P2SH-P2WPKH) de um
+        ponto já derivado, para cada rede: {rede: {formato: endereço}}.
+
+        O hash160 é calculado uma vez para a chave comprimida, uma para a não comprimida
+        e uma para o script P2WPKH, e reaproveitado por todos os formatos e redes.
+        """
+        if not self.secp256k1.ecc.in_curve(public_key_x, public_key_y):
+            raise ValueError("A chave pública gerada não está na curva.")
+        hash160_compressed = self.public_bytes_to_hash160(self._serialize_point(public_key_x, public_key_y, True))
+        hash160_uncompressed = self.public_bytes_to_hash160(self._serialize_point(public_key_x, public_key_y, False))
+        script_hash = self.ripemd160.hash160(p2wpkh_script(hash160_compressed))
+        return {
+            network: self.hash160s_to_addresses(hash160_compressed, hash160_uncompressed, network, script_hash)
+            for network in networks
+        }
+
+    def private_to_addresses(self, private_key, networks=("mainnet", "testnet")):
+        """Versão de point_to_addresses que parte da chave privada."""
+        return self.point_to_addresses(*self.private_key_to_public_key_points(private_key), networks=networks)
+
+    def derive_all(self, private_key, testnet=False):
+        """
+        Todas as representações de uma chave privada a partir de um único cálculo do ponto.
+
+        Returns:
+            dict: private_key (hex), x, y, public_key_compressed, public_key_uncompressed
+            (hex), address_compressed, address_uncompressed, wif_compressed e wif_uncompressed.
+        """
+        public_key_x, public_key_y = self.private_key_to_public_key_points(private_key)
+        compressed = self._serialize_point(public_key_x, public_key_y, True)
+        uncompressed = self._serialize_point(public_key_x, public_key_y, False)
+        version = b'\x6f' if testnet else b'\x00'
+        private_key_bytes = private_key.to_bytes(32, byteorder='big')
+        wif = self.wif
+        return {
+            "private_key": private_key_bytes.hex(),
+            "x": public_key_x,
+            "y": public_key_y,
+            "public_key_compressed": compressed.hex(),
+            "public_key_uncompressed": uncompressed.hex(),
+            "address_compressed": self.public_bytes_to_address(compressed, version),
+            "address_uncompressed": self.public_bytes_to_address(uncompressed, version),
+            "wif_compressed": wif.private_key_bytes_to_WIF(private_key_bytes, compressed=True, testnet=testnet),
+            "wif_uncompressed": wif.private_key_bytes_to_WIF(private_key_bytes, compressed=False, testnet=testnet),
+        }
+
+    def cache_stats(self):
+        """Estatísticas do cache de derivação, ou None se o cache está desativado."""
+        return self.cache.stats() if self.cache is not None else None
+
+    def invalidate_cache(self, private_key=None, public_key=None):
+        """Remove entradas específicas do cache; sem argumentos, esvazia o cache inteiro."""
+        if self.cache is None:
+            return
+        if private_key is None and public_key is None:
+            self.cache.clear()
+        else:
+            self.cache.invalidate(private_key, public_key)
+
     def private_key_to_WIF(self, private_key, compressed=False):
         """
         Converte uma chave privada para o formato WIF, com suporte para formato comprimido.
         """
-        private_key_hex = f"{private_key:064x}"  
-        extended_key = b'\x80' + bytes.fromhex(private_key_hex)  # Prefixo 'fe' para BitAiir
+        extended_key = b'\x80' + private_key.to_bytes(32, byteorder='big')  # Prefixo 'fe' para BitAiir
         if compressed:
             extended_key += b'\x01'  # Byte adicional para WIF comprimido
 
-        first_sha256 = self.sha256.sha256(extended_key)
-        second_sha256 = self.sha256.sha256(first_sha256)
-        checksum = second_sha256[:4]
-        final_key = extended_key + checksum
-        return self.base58.encode(final_key)
+        return self.base58.encode_check(extended_key)
 
 
 if __name__ == "__main__":
@@ -123,3 +387,8 @@ if __name__ == "__main__":
     print(f"Address (Compressed):       {address_compressed}")
     print(f"WIF (Uncompressed):         {wif_uncompressed}")
     print(f"WIF (Compressed):           {wif_compressed}")
+
+    # Todos os formatos (P2PKH, P2WPKH, P2SH-P2WPKH) das duas redes a partir de um único ponto
+    for network, addresses in address.point_to_addresses(public_key_x, public_key_y).items():
+        for address_format, value in addresses.items():
+            print(f"{network + ' ' + address_format + ':':<28}{value}")
@@ -0,0 +1,425 @@
+from base.base58 import Base58
+from bitcoin.lru_cache import LRUCache
+from bitcoin.parallel import ordered_map
+from bitcoin.public_key import PublicKey
+from bitcoin.secp256k1 import Secp256k1
+from crypto.hmac import HMAC
+from crypto.ripemd160 import Ripemd160
+from crypto.sha512 import SHA512
+
+# Índices a partir de 2^31 são filhos endurecidos (hardened)
+HARDENED = 0x80000000
+
+# Versões da serialização estendida (4 bytes): xprv/xpub na mainnet, tprv/tpub na testnet
+MAINNET_PRIVATE = bytes.fromhex("0488ade4")
+MAINNET_PUBLIC = bytes.fromhex("0488b21e")
+TESTNET_PRIVATE = bytes.fromhex("04358394")
+TESTNET_PUBLIC = bytes.fromhex("043587cf")
+
+# versão -> (testnet, privada)
+VERSIONS = {
+    MAINNET_PRIVATE: (False, True),
+    MAINNET_PUBLIC: (False, False),
+    TESTNET_PRIVATE: (True, True),
+    TESTNET_PUBLIC: (True, False),
+}
+
+# Chave do HMAC-SHA512 que gera o nó mestre a partir da seed
+MASTER_KEY = b"Bitcoin seed"
+
+# Estado de cada processo de trabalho, criado uma única vez em _worker_init()
+_worker = {}
+
+
+class HDNode:
+    """
+    Nó de uma árvore BIP32: chave privada (None em nós públicos), ponto da chave
+    pública, chain code e os metadados da serialização estendida.
+    """
+
+    def __init__(self, private_key, point, chain_code, depth=0, parent_fingerprint=b"\x00\x00\x00\x00", index=0,
+                 testnet=False):
+        self.private_key = private_key
+        self.point = point
+        self.chain_code = chain_code
+        self.depth = depth
+        self.parent_fingerprint = parent_fingerprint
+        self.index = index
+        self.testnet = testnet
+        self._public_key = None
+        self._mac = None
+
+    def __getstate__(self):
+        # O HMAC pré-calculado é refeito sob demanda; não precisa ir para outro processo
+        state = dict(self.__dict__)
+        state["_mac"] = None
+        return state
+
+    def __repr__(self):
+        kind = "privado" if self.is_private else "público"
+        return f"HDNode({kind}, depth={self.depth}, index={self.index})"
+
+    @property
+    def is_private(self):
+        return self.private_key is not None
+
+    @property
+    def is_hardened(self):
+        return self.index >= HARDENED
+
+    @property
+    def public_key(self):
+        """Chave pública comprimida (SEC1, 33 bytes)."""
+        if self._public_key is None:
+            x, y = self.point
+            self._public_key = (b"\x03" if y & 1 else b"\x02") + x.to_bytes(32, "big")
+        return self._public_key
+
+    @property
+    def identifier(self):
+        """hash160 da chave pública comprimida."""
+        return Ripemd160.hash160(self.public_key)
+
+    @property
+    def fingerprint(self):
+        return self.identifier[:4]
+
+    @property
+    def private_key_bytes(self):
+        if self.private_key is None:
+            raise ValueError("Nó público não tem chave privada.")
+        return self.private_key.to_bytes(32, "big")
+
+    @property
+    def cache_id(self):
+        """
+        Identidade do nó nas chaves do cache de derivação: tudo o que vai para a
+        serialização estendida (rede e metadados inclusive), pois os filhos herdam.
+        """
+        return (
+            self.testnet, self.depth, self.parent_fingerprint, self.index, self.chain_code,
+            self.private_key if self.is_private else self.point,
+        )
+
+    def mac(self):
+        """HMAC-SHA512 com o chain code já absorvido; cada filho usa uma cópia."""
+        if self._mac is None:
+            self._mac = HMAC(self.chain_code, hash_class=SHA512)
+        return self._mac
+
+    def neuter(self):
+        """Versão pública do nó (sem a chave privada)."""
+        node = HDNode(None, self.point, self.chain_code, self.depth, self.parent_fingerprint, self.index,
+                      self.testnet)
+        node._public_key = self._public_key
+        return node
+
+    def serialize(self, private=None):
+        """
+        Serialização estendida (78 bytes) em Base58Check: xprv/xpub (tprv/tpub na testnet).
+        Por padrão, nós privados saem como xprv; private=False força o xpub.
+        """
+        if private is None:
+            private = self.is_private
+        if private and not self.is_private:
+            raise ValueError("Nó público não pode ser serializado como chave privada.")
+        if private:
+            version = TESTNET_PRIVATE if self.testnet else MAINNET_PRIVATE
+            key_data = b"\x00" + self.private_key_bytes
+        else:
+            version = TESTNET_PUBLIC if self.testnet else MAINNET_PUBLIC
+            key_data = self.public_key
+        payload = (
+            version
+            + bytes([self.depth])
+            + self.parent_fingerprint
+            + self.index.to_bytes(4, "big")
+            + self.chain_code
+            + key_data
+        )
+        return Base58().encode_check(payload)
+
+    def serialize_private(self):
+        return self.serialize(private=True)
+
+    def serialize_public(self):
+        return self.serialize(private=False)
+
+
+def format_index(index):
+    """Índice de filho no formato de caminho (44' para endurecidos)."""
+    return f"{index - HARDENED}'" if index >= HARDENED else str(index)
+
+
+def _parse_index(component):
+    text = component.strip()
+    hardened = text[-1:] in ("'", "h", "H")
+    if hardened:
+        text = text[:-1]
+    if not text.isdigit():
+        raise ValueError(f"Componente de caminho inválido: {component!r}")
+    index = int(text)
+    if index >= HARDENED:
+        raise ValueError(f"Índice fora do intervalo (0 a 2^31 - 1): {component!r}")
+    return index + HARDENED if hardened else index
+
+
+def parse_path(path):
+    """
+    Converte "m/44'/0'/0'/0/5" em (44 + 2^31, 2^31, 2^31, 0, 5). Aceita ' ou h para
+    índices endurecidos; o prefixo "m/" (ou "M/") é opcional.
+    """
+    components = [component for component in path.strip().split("/")]
+    if components and components[0] in ("m", "M"):
+        components = components[1:]
+    if components == [""]:
+        components = []
+    return tuple(_parse_index(component) for component in components)
+
+
+def parse_range(path):
+    """
+    Separa um caminho com intervalo no último componente, como "m/44'/0'/0'/0/0..99",
+    em (caminho do pai, primeiro índice, último índice), com o intervalo inclusivo.
+    Para filhos endurecidos, marque um ou os dois extremos: "0'..99'" ou "0..99'".
+    """
+    head, _, last = path.strip().rpartition("/")
+    start, separator, stop = last.partition("..")
+    if not separator:
+        raise ValueError(f"O último componente deve ser um intervalo a..b: {path!r}")
+    hardened = any(text.strip()[-1:] in ("'", "h", "H") for text in (start, stop))
+    start = _parse_index(start) & ~HARDENED
+    stop = _parse_index(stop) & ~HARDENED
+    if start > stop:
+        raise ValueError(f"Intervalo vazio: {last!r}")
+    offset = HARDENED if hardened else 0
+    return parse_path(head), start + offset, stop + offset
+
+
+def derive_children(parent, indices, ecc, n_order):
+    """
+    Deriva os filhos de `parent` nos índices dados, na ordem, em lote.
+
+    Cada filho custa uma cópia do HMAC do pai (os blocos da chave já absorvidos). Com
+    pai privado, os pontos saem de um único eccnP_batch; com pai público, os pontos
+    IL·G saem do eccnP_batch e as somas com o ponto do pai compartilham uma inversão.
+    Índices cujo filho é inválido (IL >= n ou chave nula, probabilidade ~2^-127) são
+    pulados, como manda o BIP32.
+    """
+    mac = parent.mac()
+    fingerprint = parent.fingerprint
+    depth = parent.depth + 1
+    if depth > 255:
+        raise ValueError("Profundidade máxima (255) excedida.")
+    private = parent.is_private
+    if private:
+        prefix_hardened = b"\x00" + parent.private_key_bytes
+    prefix_normal = parent.public_key
+
+    tweaks = []
+    chain_codes = []
+    valid = []
+    for index in indices:
+        if index >= HARDENED:
+            if not private:
+                raise ValueError("Filhos endurecidos não podem ser derivados de um nó público.")
+            data = prefix_hardened + index.to_bytes(4, "big")
+        else:
+            data = prefix_normal + index.to_bytes(4, "big")
+        h = mac.copy()
+        h.update(data)
+        digest = h.digest()
+        tweak = int.from_bytes(digest[:32], "big")
+        if tweak >= n_order:
+            continue
+        if private:
+            tweak = (tweak + parent.private_key) % n_order
+            if tweak == 0:
+                continue
+        elif tweak == 0:
+            continue
+        tweaks.append(tweak)
+        chain_codes.append(digest[32:])
+        valid.append(index)
+
+    points = ecc.eccnP_batch(tweaks)
+    keys = tweaks if private else [None] * len(tweaks)
+    if not private:
+        points = _add_point(ecc, points, parent.point)
+
+    children = []
+    for key, point, chain_code, index in zip(keys, points, chain_codes, valid):
+        if point == ecc.pointNULL:
+            continue
+        children.append(HDNode(key, point, chain_code, depth, fingerprint, index, parent.testnet))
+    return children
+
+
+def _add_point(ecc, points, point):
+    """Soma `point` a cada ponto da lista (afins), com uma única inversão para o lote."""
+    p = ecc.p
+    x2, y2 = point
+    pending = [i for i, (x1, _) in enumerate(points) if x1 != x2]
+    inverses = ecc.batch_inverse([x2 - points[i][0] for i in pending])
+    result = list(points)
+    for i, inv in zip(pending, inverses):
+        x1, y1 = points[i]
+        m = (y2 - y1) * inv % p
+        x3 = (m * m - x1 - x2) % p
+        result[i] = (x3, (m * (x1 - x3) - y1) % p)
+    for i, (x1, y1) in enumerate(points):
+        if x1 == x2:
+            # P + P ou P + (-P): caso raro, resolvido fora do lote
+            result[i] = ecc.addp(x1, y1, x2, y2)
+    return result
+
+
+def _worker_init(table_path=None):
+    """Prepara Secp256k1 e a tabela de G uma vez por processo."""
+    Secp256k1.prepare_generator_table(table_path)
+    _worker["secp256k1"] = Secp256k1()
+
+
+def _derive_children(chunk):
+    """Deriva um bloco (pai, índices) de filhos no processo de trabalho, na ordem."""
+    parent, indices = chunk
+    if not _worker:
+        _worker_init()
+    secp256k1 = _worker["secp256k1"]
+    return derive_children(parent, indices, secp256k1.ecc, secp256k1.n_order)
+
+
+class BIP32:
+    """
+    Derivação hierárquica determinística (BIP32): nó mestre a partir da seed,
+    filhos privados (CKDpriv) e públicos (CKDpub) e serialização xprv/xpub.
+
+    Os nós intermediários de derive() ficam num cache LRU indexado por (nó de
+    origem, prefixo do caminho): caminhos irmãos, como m/44'/0'/0'/0/0 e
+    m/44'/0'/0'/0/1, derivam os pais uma única vez e reaproveitam o HMAC deles.
+    """
+
+    def __init__(self, cache_size=1024):
+        self.secp256k1 = Secp256k1()
+        self.ecc = self.secp256k1.ecc
+        self.n_order = self.secp256k1.n_order
+        self.public_key = PublicKey(secp256k1=self.secp256k1)
+        self.cache = LRUCache(cache_size) if cache_size else None
+
+    def master_from_seed(self, seed, testnet=False):
+        """Nó mestre (m) a partir de uma seed de 16 a 64 bytes (bytes ou hex)."""
+        if isinstance(seed, str):
+            seed = bytes.fromhex(seed)
+        if not 16 <= len(seed) <= 64:
+            raise ValueError("A seed deve ter entre 16 e 64 bytes.")
+        digest = HMAC.hmac(MASTER_KEY, seed, SHA512)
+        private_key = int.from_bytes(digest[:32], "big")
+        if not 1 <= private_key < self.n_order:
+            raise ValueError("Seed inválida: a chave mestra está fora do intervalo.")
+        return HDNode(private_key, self.ecc.eccnP(private_key), digest[32:], testnet=testnet)
+
+    def child(self, node, index):
+        """Filho `index` do nó (endurecido se index >= 2^31)."""
+        if not 0 <= index < 2 ** 32:
+            raise ValueError("Índice de filho fora do intervalo (0 a 2^32 - 1).")
+        children = derive_children(node, (index,), self.ecc, self.n_order)
+        if not children:
+            raise ValueError(f"Filho inválido no índice {format_index(index)}; use o próximo índice.")
+        return children[0]
+
+    def derive(self, node, path):
+        """Deriva o nó no caminho (string como "m/44'/0'/0'" ou sequência de índices)."""
+        indices = parse_path(path) if isinstance(path, str) else tuple(path)
+        cache = self.cache
+        root = node.cache_id if cache is not None else None
+        for depth in range(len(indices)):
+            if cache is None:
+                node = self.child(node, indices[depth])
+                continue
+            key = (root, indices[:depth + 1])
+            child = cache.get(key)
+            if child is None:
+                child = self.child(node, indices[depth])
+                cache.put(key, child)
+            node = child
+        return node
+
+    def derive_range(self, node, path, jobs=1, batch_size=1024, max_pending=None, table_path=None):
+        """
+        Gera os filhos de um intervalo, como "m/44'/0'/0'/0/0..100000", na ordem.
+
+        O pai é derivado uma vez (via cache) e os filhos saem em blocos de batch_size
+        (ver derive_children). Com jobs > 1, os blocos vão para um pool de processos,
+        com no máximo max_pending blocos em voo, como em BulkDerivation.
+        """
+        prefix, start, stop = parse_range(path)
+        parent = self.derive(node, prefix)
+        if start >= HARDENED and not parent.is_private:
+            raise ValueError("Filhos endurecidos não podem ser derivados de um nó público.")
+        batches = (range(first, min(first + batch_size, stop + 1)) for first in range(start, stop + 1, batch_size))
+
+        if jobs == 1:
+            for indices in batches:
+                yield from derive_children(parent, indices, self.ecc, self.n_order)
+            return
+
+        chunks = ((parent, indices) for indices in batches)
+        for children in ordered_map(_derive_children, chunks, jobs, _worker_init, (table_path,), max_pending):
+            yield from children
+
+    def parse(self, extended_key):
+        """Lê uma chave estendida xprv/xpub/tprv/tpub, validando versão, chave e metadados."""
+        payload = Base58().decode_check(extended_key.strip())
+        if len(payload) != 78:
+            raise ValueError("Chave estendida deve ter 78 bytes.")
+        version = payload[:4]
+        if version not in VERSIONS:
+            raise ValueError("Versão de chave estendida desconhecida.")
+        testnet, private = VERSIONS[version]
+        depth = payload[4]
+        parent_fingerprint = payload[5:9]
+        index = int.from_bytes(payload[9:13], "big")
+        chain_code = payload[13:45]
+        key_data = payload[45:]
+        if depth == 0 and (parent_fingerprint != b"\x00\x00\x00\x00" or index != 0):
+            raise ValueError("Chave mestra com fingerprint do pai ou índice não nulos.")
+
+        if private:
+            if key_data[0] != 0:
+                raise ValueError("Chave privada estendida sem o prefixo 0x00.")
+            private_key = int.from_bytes(key_data[1:], "big")
+            if not 1 <= private_key < self.n_order:
+                raise ValueError("Chave privada estendida fora do intervalo válido.")
+            point = self.ecc.eccnP(private_key)
+        else:
+            if key_data[0] not in (2, 3):
+                raise ValueError("Chave pública estendida deve estar comprimida.")
+            private_key = None
+            point = self.public_key.parse(key_data)
+        return HDNode(private_key, point, chain_code, depth, parent_fingerprint, index, testnet)
+
+    def cache_stats(self):
+        return self.cache.stats() if self.cache is not None else None
+
+
+if __name__ == "__main__":
+    import time
+
+    from bitcoin.address import Address
+
+    bip32 = BIP32()
+    master = bip32.master_from_seed("000102030405060708090a0b0c0d0e0f")
+    print(f"m:     {master.serialize_private()}")
+    print(f"       {master.serialize_public()}")
+
+    node = bip32.derive(master, "m/0'/1/2'/2/1000000000")
+    print(f"m/0'/1/2'/2/1000000000: {node.serialize_private()}")
+    print(f"Valid? {node.serialize_private() == 'xprvA41z7zogVVwxVSgdKUHDy1SKmdb533PjDz7J6N6mV6uS3ze1ai8FHa8kmHScGpWmj4WggLyQjgPie1rFSruoUihUZREPSL39UNdE3BBDu76'}")
+
+    address = Address()
+    start = time.perf_counter()
+    children = list(bip32.derive_range(master, "m/44'/0'/0'/0/0..999", jobs=2, batch_size=250))
+    elapsed = time.perf_counter() - start
+    for child in children[:3]:
+        print(f"m/44'/0'/0'/0/{format_index(child.index)}: {address.public_bytes_to_address(child.public_key)}")
+    print(f"{len(children)} filhos em {elapsed:.2f}s; cache: {bip32.cache_stats()}")
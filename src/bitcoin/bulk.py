@@ -0,0 +1,265 @@
+import csv
+import json
+import os
+from itertools import islice
+
+from bitcoin.address import ADDRESS_FORMATS, ADDRESS_NETWORKS, Address, p2wpkh_script
+from bitcoin.keys import check_private_key
+from bitcoin.parallel import ordered_map
+from bitcoin.secp256k1 import Secp256k1
+from bitcoin.watchlist import Hash160Watchlist
+from bitcoin.wif import WIF
+from crypto.ripemd160 import Ripemd160
+
+# Estado de cada processo de trabalho, criado uma única vez em _worker_init()
+_worker = {}
+
+
+def _worker_init(table_path=None, testnet=False, watchlist_path=None, all_formats=False):
+    """Prepara Secp256k1, tabela de G, objetos de hash e watchlist uma vez por processo."""
+    Secp256k1.prepare_generator_table(table_path)
+    _worker["address"] = Address()
+    _worker["wif"] = WIF()
+    _worker["testnet"] = testnet
+    _worker["watchlist"] = Hash160Watchlist(watchlist_path) if watchlist_path else None
+    _worker["all_formats"] = all_formats
+
+
+def derive_rows(private_keys, address, wif, testnet=False, watchlist=None):
+    """
+    Deriva chaves públicas, endereços e WIFs de uma lista de chaves privadas (inteiros
+    já validados), na ordem de entrada: uma tupla por chave (ver BulkDerivation.FIELDS).
+
+    Os pontos saem de um único eccnP_batch e os hash160/checksums são calculados em
+    lote. Com uma watchlist, só as chaves com endereço conhecido são retornadas.
+    """
+    base58 = address.base58
+    version = b"\x6f" if testnet else b"\x00"
+
+    points = address.private_key_to_public_key_points_many(private_keys)
+    compressed = [address.public_key_points_to_public_bytes(x, y, True) for x, y in points]
+    uncompressed = [address.public_key_points_to_public_bytes(x, y, False) for x, y in points]
+    hashes = Ripemd160.hash160_many(compressed + uncompressed)
+    count = len(private_keys)
+
+    # Com watchlist, o teste é feito no hash160 bruto e só os acertos viram Base58
+    selected = range(count)
+    if watchlist is not None:
+        selected = [i for i in selected if hashes[i] in watchlist or hashes[count + i] in watchlist]
+        addresses = dict(zip(
+            list(selected) + [count + i for i in selected],
+            base58.encode_check_many(
+                [version + hashes[i] for i in selected] + [version + hashes[count + i] for i in selected]
+            ),
+        ))
+    else:
+        addresses = base58.encode_check_many(version + h for h in hashes)
+
+    rows = []
+    for i in selected:
+        private_key_bytes = private_keys[i].to_bytes(32, "big")
+        rows.append((
+            private_key_bytes.hex(),
+            compressed[i].hex(),
+            uncompressed[i].hex(),
+            addresses[i],
+            addresses[count + i],
+            wif.private_key_bytes_to_WIF(private_key_bytes, compressed=True, testnet=testnet),
+            wif.private_key_bytes_to_WIF(private_key_bytes, compressed=False, testnet=testnet),
+        ))
+    return rows
+
+
+def derive_rows_all_formats(private_keys, address, wif, testnet=False, watchlist=None):
+    """
+    Como derive_rows, mas cada tupla traz todos os formatos de endereço das duas redes
+    (ver BulkDerivation.ALL_FORMATS_FIELDS); os WIFs seguem `testnet`.
+
+    Por chave são só três hash160, todos em lote: chave comprimida, não comprimida e
+    script P2WPKH. Com uma watchlist, uma chave é emitida se qualquer um deles estiver nela.
+    """
+    bech32 = address.bech32
+
+    points = address.private_key_to_public_key_points_many(private_keys)
+    compressed = [address.public_key_points_to_public_bytes(x, y, True) for x, y in points]
+    uncompressed = [address.public_key_points_to_public_bytes(x, y, False) for x, y in points]
+    count = len(private_keys)
+    hashes = Ripemd160.hash160_many(compressed + uncompressed)
+    script_hashes = Ripemd160.hash160_many([p2wpkh_script(h) for h in hashes[:count]])
+
+    selected = range(count)
+    if watchlist is not None:
+        selected = [
+            i for i in selected
+            if hashes[i] in watchlist or hashes[count + i] in watchlist or script_hashes[i] in watchlist
+        ]
+
+    # Colunas de endereço por rede, na ordem de ADDRESS_FORMATS, só para as chaves selecionadas
+    columns = []
+    for version, script_version, hrp in ADDRESS_NETWORKS.values():
+        legacy = address.base58.encode_check_many(
+            [version + hashes[i] for i in selected]
+            + [version + hashes[count + i] for i in selected]
+            + [script_version + script_hashes[i] for i in selected]
+        )
+        total = len(selected)
+        columns += [
+            legacy[:total],
+            legacy[total:2 * total],
+            [bech32.encode_segwit(hrp, 0, hashes[i]) for i in selected],
+            legacy[2 * total:],
+        ]
+
+    rows = []
+    for position, i in enumerate(selected):
+        private_key_bytes = private_keys[i].to_bytes(32, "big")
+        rows.append((
+            private_key_bytes.hex(),
+            compressed[i].hex(),
+            uncompressed[i].hex(),
+            *(column[position] for column in columns),
+            wif.private_key_bytes_to_WIF(private_key_bytes, compressed=True, testnet=testnet),
+            wif.private_key_bytes_to_WIF(private_key_bytes, compressed=False, testnet=testnet),
+        ))
+    return rows
+
+
+def _derive_chunk(private_keys):
+    """Deriva um bloco de chaves no processo de trabalho, na ordem."""
+    if not _worker:
+        _worker_init()
+    derive = derive_rows_all_formats if _worker["all_formats"] else derive_rows
+    return derive(private_keys, _worker["address"], _worker["wif"], _worker["testnet"], _worker["watchlist"])
+
+
+class BulkDerivation:
+    """
+    Pipeline em lote chave privada -> chaves públicas, endereços e WIFs.
+
+    As chaves são agrupadas em blocos de chunk_size e distribuídas para um pool de
+    processos (jobs). Cada processo monta Secp256k1 e a tabela de G uma única vez.
+    Os resultados voltam na ordem de entrada e no máximo max_pending blocos ficam em
+    voo, então o uso de memória não depende do tamanho da entrada.
+
+    Chaves inválidas não interrompem a execução: são contadas em `invalid` e,
+    com um arquivo `errors`, reportadas uma por linha, como em WIF.decode_many.
+    """
+
+    FIELDS = (
+        "private_key",
+        "public_key_compressed",
+        "public_key_uncompressed",
+        "address_compressed",
+        "address_uncompressed",
+        "wif_compressed",
+        "wif_uncompressed",
+    )
+
+    # Campos com all_formats=True: todos os formatos de endereço das duas redes
+    ALL_FORMATS_FIELDS = (
+        ("private_key", "public_key_compressed", "public_key_uncompressed")
+        + tuple(f"{network}_{address_format}" for network in ADDRESS_NETWORKS for address_format in ADDRESS_FORMATS)
+        + ("wif_compressed", "wif_uncompressed")
+    )
+
+    def __init__(self, jobs=None, chunk_size=1024, max_pending=None, key_format="hex", testnet=False, table_path=None,
+                 watchlist_path=None, all_formats=False):
+        self.jobs = jobs or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.max_pending = max_pending or 2 * self.jobs
+        self.key_format = key_format
+        self.testnet = testnet
+        self.table_path = table_path
+        # Com uma watchlist (Hash160Watchlist), só as chaves com endereço conhecido são emitidas
+        self.watchlist_path = watchlist_path
+        # Com all_formats, cada registro traz P2PKH, P2WPKH e P2SH-P2WPKH de mainnet e testnet
+        self.all_formats = all_formats
+        self.fields = self.ALL_FORMATS_FIELDS if all_formats else self.FIELDS
+        self.n_order = Secp256k1().n_order
+        # Chaves rejeitadas na última chamada de derive()
+        self.invalid = 0
+
+    def _chunks(self, private_keys, errors=None):
+        """
+        Agrupa as chaves válidas em blocos. Cada valor é validado sozinho: os inválidos
+        são reportados (número do item na entrada, contando também as linhas em branco,
+        que são puladas) e o restante do bloco segue normalmente.
+        """
+        iterator = enumerate(private_keys, 1)
+        while True:
+            chunk = []
+            items = 0
+            for line_number, value in islice(iterator, self.chunk_size):
+                items += 1
+                if isinstance(value, (str, bytes)) and not value.strip():
+                    continue
+                private_key, status = check_private_key(value, self.key_format)
+                if status is not None:
+                    self.invalid += 1
+                    if errors is not None:
+                        text = value.decode("ascii", "replace") if isinstance(value, bytes) else str(value)
+                        errors.write(f"{line_number}\t{status}\t{text.strip()}\n")
+                    continue
+                chunk.append(private_key)
+            if not items:
+                return
+            if chunk:
+                yield chunk
+
+    def derive(self, private_keys, errors=None):
+        """
+        Gera uma tupla por chave válida (ver fields), na mesma ordem da entrada. Com
+        watchlist_path, gera apenas as chaves cujo endereço está na watchlist.
+
+        Chaves inválidas são puladas e contadas em self.invalid; com `errors` (arquivo
+        texto), cada uma vira uma linha "número<TAB>status<TAB>valor".
+        """
+        self.invalid = 0
+        if self.jobs == 1:
+            _worker_init(self.table_path, self.testnet, self.watchlist_path, self.all_formats)
+            for chunk in self._chunks(private_keys, errors):
+                yield from _derive_chunk(chunk)
+            return
+
+        initargs = (self.table_path, self.testnet, self.watchlist_path, self.all_formats)
+        chunks = self._chunks(private_keys, errors)
+        for rows in ordered_map(_derive_chunk, chunks, self.jobs, _worker_init, initargs, self.max_pending):
+            yield from rows
+
+    def write(self, rows, output, output_format="csv"):
+        """Escreve as linhas em CSV (com cabeçalho) ou JSONL num arquivo texto aberto."""
+        if output_format == "csv":
+            writer = csv.writer(output)
+            writer.writerow(self.fields)
+            for row in rows:
+                writer.writerow(row)
+        elif output_format == "jsonl":
+            for row in rows:
+                output.write(json.dumps(dict(zip(self.fields, row))) + "\n")
+        else:
+            raise ValueError("Formato de saída inválido (use 'csv' ou 'jsonl').")
+
+    def derive_file(self, input_path, output_path, output_format="csv", errors_path=None):
+        """
+        Lê uma chave por linha de input_path e grava os resultados em output_path. As
+        chaves inválidas (com o número da linha) vão para errors_path, se informado.
+
+        Returns:
+            int: Quantidade de chaves inválidas.
+        """
+        errors = open(errors_path, "w", encoding="utf-8") if errors_path else None
+        try:
+            with open(input_path, "r", encoding="utf-8") as source, \
+                    open(output_path, "w", encoding="utf-8", newline="") as output:
+                self.write(self.derive(source, errors), output, output_format)
+        finally:
+            if errors is not None:
+                errors.close()
+        return self.invalid
+
+
+if __name__ == "__main__":
+    import sys
+
+    bulk = BulkDerivation(jobs=2, chunk_size=4)
+    bulk.write(bulk.derive(range(1, 11)), sys.stdout, "jsonl")
@@ -0,0 +1,44 @@
+from bitcoin.lru_cache import LRUCache
+
+
+class DerivationCache:
+    """
+    Caches LRU da derivação de chaves, usados por Address(cache_size=...):
+
+    - points:    chave privada (int) -> ponto (x, y) já validado na curva
+    - hash160s:  chave pública (bytes) -> hash160
+    - addresses: chave pública (bytes) -> {versão: endereço Base58Check}
+
+    Cada cache tem no máximo maxsize entradas e estatísticas próprias.
+    """
+
+    def __init__(self, maxsize=1024):
+        self.points = LRUCache(maxsize)
+        self.hash160s = LRUCache(maxsize)
+        self.addresses = LRUCache(maxsize)
+
+    def _caches(self):
+        return {"points": self.points, "hash160s": self.hash160s, "addresses": self.addresses}
+
+    def invalidate(self, private_key=None, public_key=None):
+        """Remove as entradas de uma chave privada (ponto) e/ou de uma chave pública (bytes ou hex)."""
+        if private_key is not None:
+            self.points.invalidate(private_key)
+        if public_key is not None:
+            if isinstance(public_key, str):
+                public_key = bytes.fromhex(public_key)
+            public_key = bytes(public_key)
+            self.hash160s.invalidate(public_key)
+            self.addresses.invalidate(public_key)
+
+    def clear(self):
+        for cache in self._caches().values():
+            cache.clear()
+
+    def stats(self):
+        """Estatísticas ({"size", "maxsize", "hits", "misses", "evictions", "hit_rate"}) de cada cache."""
+        return {name: cache.stats() for name, cache in self._caches().items()}
+
+    def reset_stats(self):
+        for cache in self._caches().values():
+            cache.reset_stats()
@@ -0,0 +1,160 @@
+from bitcoin.address import Address
+
+
+class KeyRange:
+    """
+    Intervalo [start, stop) de chaves privadas, com a posição da próxima chave a processar.
+
+    Pode ser dividido em shards disjuntos (um por processo/núcleo) e salvo/retomado
+    por um token de checkpoint, para continuar uma varredura sem refazer trabalho.
+    """
+
+    def __init__(self, start, stop, next_key=None):
+        if start > stop:
+            raise ValueError("O início do intervalo deve ser menor ou igual ao fim.")
+        if next_key is None:
+            next_key = start
+        if not start <= next_key <= stop:
+            raise ValueError("A próxima chave deve estar dentro do intervalo.")
+        self.start = start
+        self.stop = stop
+        self.next_key = next_key
+
+    def __len__(self):
+        return self.stop - self.start
+
+    def __repr__(self):
+        return f"KeyRange({self.start:#x}, {self.stop:#x}, next_key={self.next_key:#x})"
+
+    def __eq__(self, other):
+        if not isinstance(other, KeyRange):
+            return NotImplemented
+        return (self.start, self.stop, self.next_key) == (other.start, other.stop, other.next_key)
+
+    @property
+    def remaining(self):
+        return self.stop - self.next_key
+
+    @property
+    def done(self):
+        return self.next_key >= self.stop
+
+    def split(self, shards):
+        """Divide as chaves restantes em até `shards` intervalos disjuntos e contíguos."""
+        if shards < 1:
+            raise ValueError("O número de shards deve ser pelo menos 1.")
+        total = self.remaining
+        shards = min(shards, total) or 1
+        size, extra = divmod(total, shards)
+        ranges = []
+        start = self.next_key
+        for i in range(shards):
+            stop = start + size + (1 if i < extra else 0)
+            ranges.append(KeyRange(start, stop))
+            start = stop
+        return ranges
+
+    def checkpoint(self):
+        """Token textual que permite retomar o intervalo de onde parou."""
+        return f"{self.start:x}:{self.stop:x}:{self.next_key:x}"
+
+    @classmethod
+    def from_checkpoint(cls, token):
+        try:
+            start, stop, next_key = (int(part, 16) for part in token.split(":"))
+        except ValueError:
+            raise ValueError("Token de checkpoint inválido.")
+        return cls(start, stop, next_key)
+
+
+class SequentialKeyIterator:
+    """
+    Percorre um KeyRange em ordem crescente somando G ao ponto anterior, sem
+    multiplicação escalar por chave.
+
+    Cada janela de W chaves parte de um ponto base B e calcula B + i*G (i = 1 .. W)
+    com somas afins cujas inversões são feitas em lote: uma inversão por janela.
+
+    Gera tuplas (chave, chave pública hex, hash160) ou, com address=True,
+    (chave, chave pública hex, endereço).
+    """
+
+    def __init__(self, key_range, compressed=True, address=False, window=256, address_instance=None):
+        self.address = address_instance or Address()
+        self.ecc = self.address.secp256k1.ecc
+        n_order = self.address.secp256k1.n_order
+        if key_range.start < 1 or key_range.stop > n_order:
+            raise ValueError("O intervalo deve conter apenas chaves privadas válidas (1 <= k < n).")
+        if window < 1:
+            raise ValueError("A janela deve ter pelo menos 1 chave.")
+        self.key_range = key_range
+        self.compressed = compressed
+        self.with_address = address
+        self.window = window
+        # Múltiplos 1*G .. W*G, reaproveitados em todas as janelas
+        self._offsets = self.ecc.eccnP_batch(range(1, window + 1))
+
+    def checkpoint(self):
+        return self.key_range.checkpoint()
+
+    def _window_points(self, base, count):
+        """Retorna [B, B + G, ..., B + count*G] usando uma única inversão."""
+        ecc = self.ecc
+        p = ecc.p
+        bx, by = base
+        points = [base] + [None] * count
+        pending = []
+        denominators = []
+        for i in range(1, count + 1):
+            ox, oy = self._offsets[i - 1]
+            if ox == bx:
+                points[i] = ecc.addp(bx, by, ox, oy)
+            else:
+                pending.append(i)
+                denominators.append(ox - bx)
+        for i, inv in zip(pending, ecc.batch_inverse(denominators)):
+            ox, oy = self._offsets[i - 1]
+            m = (oy - by) * inv % p
+            x3 = (m * m - bx - ox) % p
+            points[i] = (x3, (m * (bx - x3) - by) % p)
+        return points
+
+    def _encode(self, point):
+        public_key = self.address.public_key_points_to_public_bytes(*point, self.compressed)
+        hash160 = self.address.public_bytes_to_hash160(public_key)
+        if self.with_address:
+            return public_key.hex(), self.address.hash160_to_address(hash160)
+        return public_key.hex(), hash160
+
+    def __iter__(self):
+        key_range = self.key_range
+        key = key_range.next_key
+        if key >= key_range.stop:
+            return
+        base = self.ecc.eccnP(key)
+        while key < key_range.stop:
+            count = min(self.window, key_range.stop - key)
+            # Um ponto extra (B + count*G) vira a base da próxima janela
+            extra = 1 if key + count < key_range.stop else 0
+            points = self._window_points(base, count - 1 + extra)
+            for offset in range(count):
+                public_key, value = self._encode(points[offset])
+                key_range.next_key = key + offset + 1
+                yield key + offset, public_key, value
+            key += count
+            if extra:
+                base = points[count]
+
+
+if __name__ == "__main__":
+    key_range = KeyRange(1, 11)
+
+    # Dividir o intervalo em 2 shards (ex.: um por núcleo)
+    for shard in key_range.split(2):
+        print(f"Shard: {shard}")
+
+    iterator = SequentialKeyIterator(key_range, compressed=True, address=True)
+    for private_key, public_key, address in iterator:
+        print(f"{private_key:<4} {public_key} {address}")
+
+    print(f"Checkpoint: {iterator.checkpoint()}")
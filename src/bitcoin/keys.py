@@ -0,0 +1,43 @@
+# Ordem n do ponto gerador da secp256k1: chaves privadas válidas estão em [1, n)
+SECP256K1_ORDER = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+
+# Status das chaves privadas rejeitadas (linhas "número<TAB>status<TAB>valor" nos erros)
+STATUS_INVALID_FORMAT = "invalid_format"
+STATUS_OUT_OF_RANGE = "out_of_range"
+
+
+def parse_private_key(value, key_format="hex"):
+    """
+    Converte uma chave privada de entrada em inteiro. Assim como em
+    WIF.private_key_to_WIF, inteiros são aceitos diretamente e strings são
+    hexadecimais (key_format="int" lê strings como decimais).
+    """
+    if isinstance(value, int):
+        return value
+    if isinstance(value, bytes):
+        value = value.decode("ascii")
+    text = value.strip()
+    try:
+        if key_format == "int":
+            return int(text, 10)
+        if text[:2].lower() == "0x":
+            text = text[2:]
+        if not text or len(text) > 64:
+            raise ValueError
+        return int(text, 16)
+    except ValueError:
+        raise ValueError(f"Chave privada inválida: {value!r}")
+
+
+def check_private_key(value, key_format="hex"):
+    """
+    Versão de parse_private_key que não levanta exceção: retorna (chave, None) para
+    uma chave em [1, n) e (None, status) para as demais.
+    """
+    try:
+        private_key = parse_private_key(value, key_format)
+    except ValueError:
+        return None, STATUS_INVALID_FORMAT
+    if not 1 <= private_key < SECP256K1_ORDER:
+        return None, STATUS_OUT_OF_RANGE
+    return private_key, None
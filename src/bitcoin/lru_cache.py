@@ -0,0 +1,63 @@
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    Cache LRU limitado: ao passar de maxsize, descarta o item usado há mais tempo.
+    Conta acertos, falhas e descartes (ver stats()).
+    """
+
+    _MISSING = object()
+
+    def __init__(self, maxsize=1024):
+        if maxsize < 1:
+            raise ValueError("O tamanho máximo do cache deve ser pelo menos 1.")
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        value = self._data.get(key, self._MISSING)
+        if value is self._MISSING:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._data.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        data = self._data
+        data[key] = value
+        data.move_to_end(key)
+        if len(data) > self.maxsize:
+            data.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key):
+        """Remove uma entrada; retorna True se ela existia."""
+        return self._data.pop(key, self._MISSING) is not self._MISSING
+
+    def clear(self):
+        self._data.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def reset_stats(self):
+        self.hits = self.misses = self.evictions = 0
@@ -0,0 +1,63 @@
+from collections import deque
+from itertools import islice
+
+
+def ordered_map(func, chunks, jobs, initializer=None, initargs=(), max_pending=None):
+    """
+    Aplica func a cada bloco de chunks num pool de `jobs` processos e gera os
+    resultados na ordem de entrada.
+
+    No máximo max_pending blocos (padrão: 2 * jobs) ficam em voo: o bloco seguinte só
+    é lido de chunks depois que o mais antigo terminou, então entradas de milhões de
+    linhas não são lidas inteiras para a memória. initializer(*initargs) roda uma vez
+    em cada processo (ex.: para montar a tabela de G).
+    """
+    # Importado só aqui: a maioria dos usos roda num único processo
+    import multiprocessing
+
+    max_pending = max_pending or 2 * jobs
+    with multiprocessing.Pool(jobs, initializer=initializer, initargs=initargs) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.apply_async(func, (chunk,)))
+            # Contrapressão: espera o bloco mais antigo antes de enviar mais
+            if len(pending) >= max_pending:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+
+
+def numbered_chunks(lines, chunk_size):
+    """
+    Agrupa as linhas não vazias (sem espaços nas pontas) em blocos de até chunk_size,
+    gerando (números das linhas, linhas). Os números contam todas as linhas, inclusive
+    as em branco (puladas), para que os erros apontem a linha certa da entrada.
+    """
+    iterator = ((number, line.strip()) for number, line in enumerate(lines, 1) if line.strip())
+    return (tuple(zip(*pairs)) for pairs in iter(lambda: list(islice(iterator, chunk_size)), []))
+
+
+def map_numbered_chunks(batch, lines, jobs=1, chunk_size=4096, max_pending=None):
+    """
+    Gera (números das linhas, linhas, batch(linhas)) para cada bloco de numbered_chunks(),
+    na ordem de entrada. Com jobs > 1, batch roda no pool de ordered_map() e precisa ser
+    serializável (uma função de módulo ou um functools.partial dela).
+    """
+    chunks = numbered_chunks(lines, chunk_size)
+    if jobs == 1:
+        for numbers, chunk in chunks:
+            yield numbers, chunk, batch(chunk)
+        return
+
+    # Os resultados voltam na ordem de envio: os números e linhas de cada bloco
+    # enviado esperam aqui pelo resultado correspondente
+    submitted = deque()
+
+    def submit():
+        for numbers, chunk in chunks:
+            submitted.append((numbers, chunk))
+            yield chunk
+
+    for results in ordered_map(batch, submit(), jobs, max_pending=max_pending):
+        numbers, chunk = submitted.popleft()
+        yield numbers, chunk, results
@@ -0,0 +1,89 @@
+from bitcoin.lru_cache import LRUCache
+from bitcoin.secp256k1 import Secp256k1
+
+
+class PublicKey:
+    """
+    Leitura de chaves públicas SEC1: comprimidas (02/03 || x, 33 bytes) e não
+    comprimidas (04 || x || y, 65 bytes), em bytes ou hex.
+
+    A descompressão usa o atalho y = (x³ + 7)^((p+1)/4) mod p (p ≡ 3 mod 4).
+    Um cache LRU opcional evita repetir o trabalho para chaves recorrentes.
+    """
+
+    def __init__(self, cache_size=0, secp256k1=None):
+        self.secp256k1 = secp256k1 or Secp256k1()
+        self.cache = LRUCache(cache_size) if cache_size else None
+
+    def _to_bytes(self, public_key):
+        if isinstance(public_key, str):
+            try:
+                return bytes.fromhex(public_key)
+            except ValueError:
+                raise ValueError("A chave pública em formato string não é um hexadecimal válido.")
+        return bytes(public_key)
+
+    def _decode(self, data):
+        ecc = self.secp256k1.ecc
+        p = ecc.p
+        if len(data) == 33 and data[0] in (2, 3):
+            x = int.from_bytes(data[1:], "big")
+            return ecc.decompress(x, data[0] == 3)
+        if len(data) == 65 and data[0] == 4:
+            x = int.from_bytes(data[1:33], "big")
+            y = int.from_bytes(data[33:], "big")
+            if x >= p or y >= p or not ecc.in_curve(x, y):
+                raise ValueError("A chave pública não está na curva.")
+            return x, y
+        raise ValueError("Formato de chave pública inválido.")
+
+    def parse(self, public_key):
+        """Converte a chave pública (bytes ou hex) no ponto (x, y), validando-o na curva."""
+        data = self._to_bytes(public_key)
+        cache = self.cache
+        if cache is not None:
+            point = cache.get(data)
+            if point is not None:
+                return point
+        point = self._decode(data)
+        if cache is not None:
+            cache.put(data, point)
+        return point
+
+    def parse_many(self, public_keys, strict=True):
+        """
+        Versão de parse() para uma lista de chaves públicas, na ordem de entrada.
+
+        Cada chave passa pelo mesmo _decode() (raiz quadrada pelo backend de F_p da
+        curva) e pelo cache. Não há aritmética compartilhada entre as chaves: cada
+        raiz quadrada é uma exponenciação própria. Com strict=False, chaves inválidas
+        viram None em vez de levantar ValueError.
+        """
+        results = []
+        for public_key in public_keys:
+            try:
+                point = self.parse(public_key)
+            except ValueError:
+                if strict:
+                    raise
+                point = None
+            results.append(point)
+        return results
+
+    def serialize(self, point, compressed=True):
+        x, y = point
+        if compressed:
+            return bytes([2 | (y & 1)]) + x.to_bytes(32, "big")
+        return b"\x04" + x.to_bytes(32, "big") + y.to_bytes(32, "big")
+
+
+if __name__ == "__main__":
+    public_key = PublicKey(cache_size=1024)
+
+    compressed = "0279be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798"
+    public_key_x, public_key_y = public_key.parse(compressed)
+
+    print(f"Chave pública (x):   {public_key_x}")
+    print(f"Chave pública (y):   {public_key_y}")
+    print(f"Não comprimida:      {public_key.serialize((public_key_x, public_key_y), compressed=False).hex()}")
+    print(f"Lote:                {public_key.parse_many([compressed, '02' + '00' * 32], strict=False)}")
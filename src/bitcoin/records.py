@@ -0,0 +1,179 @@
+import mmap
+import struct
+from collections import namedtuple
+
+# Registro de tamanho fixo (118 bytes):
+#   chave privada (32) | chave pública (65; comprimida ocupa os 33 primeiros) | hash160 (20) | flags (1)
+PRIVATE_KEY_SIZE = 32
+PUBLIC_KEY_SIZE = 65
+HASH160_SIZE = 20
+RECORD_SIZE = PRIVATE_KEY_SIZE + PUBLIC_KEY_SIZE + HASH160_SIZE + 1
+
+_PUBLIC_KEY_OFFSET = PRIVATE_KEY_SIZE
+_HASH160_OFFSET = _PUBLIC_KEY_OFFSET + PUBLIC_KEY_SIZE
+_FLAGS_OFFSET = _HASH160_OFFSET + HASH160_SIZE
+
+# Flags
+FLAG_COMPRESSED = 0x01   # A chave pública está no formato comprimido (33 bytes)
+FLAG_TESTNET = 0x02      # Chave da rede de teste
+FLAG_NO_PUBLIC_KEY = 0x04  # Registro só com a chave privada (chave pública e hash160 zerados)
+FLAG_WIF_COMPRESSED = 0x08  # A chave veio de um WIF comprimido (registros sem chave pública)
+
+MAGIC = b"PCR1"
+HEADER = struct.Struct(">4sH")
+
+Record = namedtuple("Record", ["private_key", "public_key", "hash160", "flags"])
+
+
+def pack_record(private_key, public_key=b"", hash160=b"", flags=0):
+    """Monta um registro binário. private_key pode ser int ou 32 bytes."""
+    if isinstance(private_key, int):
+        private_key = private_key.to_bytes(PRIVATE_KEY_SIZE, "big")
+    if len(private_key) != PRIVATE_KEY_SIZE:
+        raise ValueError("A chave privada deve ter 32 bytes.")
+    if public_key:
+        if len(public_key) == 33:
+            flags |= FLAG_COMPRESSED
+        elif len(public_key) == 65:
+            flags &= ~FLAG_COMPRESSED
+        else:
+            raise ValueError("A chave pública deve ter 33 ou 65 bytes.")
+    else:
+        flags |= FLAG_NO_PUBLIC_KEY
+    if hash160 and len(hash160) != HASH160_SIZE:
+        raise ValueError("O hash160 deve ter 20 bytes.")
+    return (
+        bytes(private_key)
+        + bytes(public_key).ljust(PUBLIC_KEY_SIZE, b"\x00")
+        + bytes(hash160).ljust(HASH160_SIZE, b"\x00")
+        + bytes((flags,))
+    )
+
+
+class RecordWriter:
+    """Grava registros de tamanho fixo num arquivo binário (cabeçalho + registros)."""
+
+    def __init__(self, path, buffer_records=4096):
+        self._file = open(path, "wb")
+        self._file.write(HEADER.pack(MAGIC, RECORD_SIZE))
+        self._buffer = bytearray()
+        self._buffer_size = buffer_records * RECORD_SIZE
+        self.count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def write(self, private_key, public_key=b"", hash160=b"", flags=0):
+        self._buffer += pack_record(private_key, public_key, hash160, flags)
+        self.count += 1
+        if len(self._buffer) >= self._buffer_size:
+            self.flush()
+
+    def write_many(self, records):
+        for record in records:
+            self.write(*record)
+
+    def flush(self):
+        self._file.write(self._buffer)
+        self._buffer.clear()
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+
+class RecordReader:
+    """
+    Lê registros gravados por RecordWriter via mmap. Os campos são memoryviews do
+    arquivo mapeado (sem cópia nem parsing por registro); use bytes(...) para copiar.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, record_size = HEADER.unpack_from(self._mmap, 0)
+        except struct.error:
+            self._mmap.close()
+            raise ValueError("Arquivo de registros inválido.")
+        if magic != MAGIC or record_size != RECORD_SIZE or (len(self._mmap) - HEADER.size) % RECORD_SIZE:
+            self._mmap.close()
+            raise ValueError("Arquivo de registros inválido ou truncado.")
+        self._view = memoryview(self._mmap)[HEADER.size:]
+        self.count = len(self._view) // RECORD_SIZE
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("Índice de registro fora do intervalo.")
+        record = self._view[index * RECORD_SIZE:(index + 1) * RECORD_SIZE]
+        flags = record[_FLAGS_OFFSET]
+        public_key_size = 0 if flags & FLAG_NO_PUBLIC_KEY else 33 if flags & FLAG_COMPRESSED else 65
+        return Record(
+            record[:PRIVATE_KEY_SIZE],
+            record[_PUBLIC_KEY_OFFSET:_PUBLIC_KEY_OFFSET + public_key_size],
+            record[_HASH160_OFFSET:_FLAGS_OFFSET],
+            flags,
+        )
+
+    def __iter__(self):
+        for index in range(self.count):
+            yield self[index]
+
+    def private_keys(self):
+        """Itera só as chaves privadas (memoryviews de 32 bytes)."""
+        view = self._view
+        for offset in range(0, self.count * RECORD_SIZE, RECORD_SIZE):
+            yield view[offset:offset + PRIVATE_KEY_SIZE]
+
+    def hash160s(self):
+        """Itera só os hash160 (memoryviews de 20 bytes)."""
+        view = self._view
+        for offset in range(_HASH160_OFFSET, self.count * RECORD_SIZE, RECORD_SIZE):
+            yield view[offset:offset + HASH160_SIZE]
+
+    def close(self):
+        self._view.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Ainda há memoryviews de registros em uso: o mapeamento é liberado junto com elas
+            pass
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    from bitcoin.address import Address
+
+    address = Address()
+    path = os.path.join(tempfile.gettempdir(), "keys.pcr")
+
+    with RecordWriter(path) as writer:
+        for private_key in range(1, 4):
+            public_key = address.private_to_public_bytes(private_key, compressed=True)
+            writer.write(private_key, public_key, address.public_bytes_to_hash160(public_key))
+
+    with RecordReader(path) as reader:
+        for record in reader:
+            print(
+                f"{int.from_bytes(record.private_key, 'big'):<4}"
+                f" {record.public_key.hex()}"
+                f" {address.hash160_to_address(record.hash160)}"
+            )
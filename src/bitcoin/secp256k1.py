@@ -1,7 +1,16 @@
+import os
+
+from ecc.ecdsa import ECDSA
 from ecc.elliptic_curve_cryptography import EllipticCurveCryptography
+from ecc.field import SECP256K1_FIELD
+from ecc.fixed_base_table import FixedBaseTable
+from ecc.glv_endomorphism import GLVEndomorphism
 
 
 class Secp256k1:
+    # Tabela de base fixa de G, compartilhada por todas as instâncias do processo
+    _generator_table = None
+
     def __init__(self):
         # Params Bitcoin Curve (secp256k1)
         self.p = 115792089237316195423570985008687907853269984665640564039457584007908834671663         # Modulo (número primo pequeno)
@@ -13,3 +22,52 @@ class Secp256k1:
 
         # Ecc Instance
         self.ecc = EllipticCurveCryptography(self.p, self.n_order, self.Gx, self.Gy, self.A, self.B)
+
+        # Inversão e raiz quadrada em F_p pelo backend de ecc.field (gmpy2 se instalado)
+        self.ecc.field = SECP256K1_FIELD
+
+        # Endomorfismo GLV: λ·(x, y) = (β·x, y), com β³ ≡ 1 (mod p) e λ³ ≡ 1 (mod n)
+        self.beta = 0x7ae96a2b657c07106e64479eac3434e99cf0497512f58995c1396c28719501ee
+        self.lam = 0x5363ad4cc05c30e0a5261c028812645a122e22ea20816678df02967c1b23bd72
+        self.ecc.endomorphism = GLVEndomorphism(
+            self.p, self.n_order, self.beta, self.lam,
+            0x3086d221a7d46bcde86c90e49284eb15, -0xe4437ed6010e88286f547fa90abfe4c3,
+            0x114ca50f7a8e2f3f657c1108d9d44cfd8, 0x3086d221a7d46bcde86c90e49284eb15,
+        )
+
+        # eccnP passa a usar a tabela de G (construída só na primeira multiplicação)
+        self.ecc.generator_table = self.generator_table(self.ecc)
+
+        # Assinatura/verificação ECDSA (nonces RFC 6979)
+        self.ecdsa = ECDSA(self.ecc)
+
+    @classmethod
+    def generator_table(cls, ecc=None):
+        """Retorna a tabela de base fixa de G do processo, criando-a (sem construir) se preciso."""
+        if cls._generator_table is None:
+            if ecc is None:
+                # O construtor chama generator_table(self.ecc), que cria e guarda a tabela
+                cls()
+            else:
+                cls._generator_table = FixedBaseTable(ecc, ecc.Gx, ecc.Gy)
+        return cls._generator_table
+
+    @classmethod
+    def save_generator_table(cls, path):
+        """Grava a tabela de G em arquivo binário para ser reaproveitada via mmap."""
+        cls.generator_table().save(path)
+
+    @classmethod
+    def load_generator_table(cls, path):
+        """Mapeia em memória uma tabela gravada por save_generator_table()."""
+        return cls.generator_table().load(path)
+
+    @classmethod
+    def prepare_generator_table(cls, path=None):
+        """
+        Deixa a tabela de G pronta no processo: mapeia o arquivo path, se existir, ou
+        constrói a tabela. Usado na inicialização dos processos de trabalho.
+        """
+        if path and os.path.exists(path):
+            return cls.load_generator_table(path)
+        return cls.generator_table().build()
@@ -0,0 +1,161 @@
+import math
+import mmap
+import struct
+
+from base.base58 import Base58
+# NumPy é opcional e importado só em build(), onde acelera a ordenação (ver crypto.sha256._numpy)
+from crypto.sha256 import _numpy
+
+
+class Hash160Watchlist:
+    """
+    Índice de endereços conhecidos, indexado pelo hash160 (20 bytes).
+
+    O arquivo binário contém um filtro de Bloom compacto seguido dos hash160
+    ordenados. Ele é mapeado em memória (mmap): o filtro descarta quase todas as
+    consultas negativas sem busca, e as positivas são confirmadas por busca
+    binária nos registros ordenados. Assim o pipeline testa o hash160 bruto e só
+    codifica em Base58 os acertos.
+    """
+
+    MAGIC = b"H160"
+    # magic, número de funções de hash, bits do filtro, número de registros
+    HEADER = struct.Struct(">4sIQQ")
+    RECORD_SIZE = 20
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, self.hash_count, self.bloom_bits, self.count = self.HEADER.unpack_from(self._mmap, 0)
+        except struct.error:
+            self.close()
+            raise ValueError("Arquivo de watchlist inválido.")
+        self._records_offset = self.HEADER.size + (self.bloom_bits + 7) // 8
+        expected = self._records_offset + self.count * self.RECORD_SIZE
+        if magic != self.MAGIC or len(self._mmap) != expected:
+            self.close()
+            raise ValueError("Arquivo de watchlist inválido ou truncado.")
+        self._bloom = memoryview(self._mmap)[self.HEADER.size:self._records_offset]
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, hash160):
+        return self.contains(hash160)
+
+    def close(self):
+        if getattr(self, "_bloom", None) is not None:
+            self._bloom.release()
+            self._bloom = None
+        self._mmap.close()
+
+    @staticmethod
+    def _bloom_indexes(hash160, hash_count, bloom_bits):
+        # O hash160 já é uniforme: os índices saem dos próprios bytes (double hashing)
+        h1 = int.from_bytes(hash160[:8], "big")
+        h2 = int.from_bytes(hash160[8:16], "big") | 1
+        return [(h1 + i * h2) % bloom_bits for i in range(hash_count)]
+
+    def might_contain(self, hash160):
+        """Consulta só o filtro de Bloom (falsos positivos possíveis, falsos negativos não)."""
+        bloom = self._bloom
+        for index in self._bloom_indexes(hash160, self.hash_count, self.bloom_bits):
+            if not bloom[index >> 3] & (1 << (index & 7)):
+                return False
+        return True
+
+    def contains(self, hash160):
+        hash160 = bytes(hash160)
+        if len(hash160) != self.RECORD_SIZE or not self.count or not self.might_contain(hash160):
+            return False
+        mm = self._mmap
+        offset = self._records_offset
+        size = self.RECORD_SIZE
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            start = offset + middle * size
+            record = mm[start:start + size]
+            if record < hash160:
+                low = middle + 1
+            elif record > hash160:
+                high = middle
+            else:
+                return True
+        return False
+
+    def contains_address(self, address):
+        """Decodifica um endereço Base58Check e testa o seu hash160."""
+        try:
+            payload = Base58().decode_check(address)
+        except ValueError:
+            return False
+        return len(payload) == 21 and self.contains(payload[1:])
+
+    @staticmethod
+    def address_to_hash160(address):
+        payload = Base58().decode_check(address)
+        if len(payload) != 21:
+            raise ValueError(f"Endereço Base58 inválido: {address!r}")
+        return payload[1:]
+
+    @classmethod
+    def build(cls, path, hash160s=(), addresses=(), false_positive_rate=0.001):
+        """
+        Grava um índice a partir de hash160 brutos e/ou endereços Base58 (decodificados
+        uma única vez) e retorna a watchlist já mapeada em memória.
+        """
+        data = bytearray()
+        for hash160 in hash160s:
+            if len(hash160) != cls.RECORD_SIZE:
+                raise ValueError("Cada hash160 deve ter 20 bytes.")
+            data += hash160
+        for address in addresses:
+            data += cls.address_to_hash160(address.strip())
+
+        size = cls.RECORD_SIZE
+        numpy = _numpy() if data else None
+        if numpy is not None:
+            records = numpy.unique(numpy.frombuffer(bytes(data), dtype=f"S{size}")).tobytes()
+        else:
+            records = b"".join(sorted({bytes(data[i:i + size]) for i in range(0, len(data), size)}))
+        count = len(records) // size
+
+        # Tamanho ótimo do filtro: m = -n ln(p) / ln(2)^2 bits, k = (m / n) ln(2) funções
+        bloom_bits = max(8, math.ceil(-max(count, 1) * math.log(false_positive_rate) / math.log(2) ** 2))
+        hash_count = max(1, round(bloom_bits / max(count, 1) * math.log(2)))
+        bloom = bytearray((bloom_bits + 7) // 8)
+        for i in range(0, len(records), size):
+            for index in cls._bloom_indexes(records[i:i + size], hash_count, bloom_bits):
+                bloom[index >> 3] |= 1 << (index & 7)
+
+        with open(path, "wb") as f:
+            f.write(cls.HEADER.pack(cls.MAGIC, hash_count, bloom_bits, count))
+            f.write(bloom)
+            f.write(records)
+        return cls(path)
+
+    @classmethod
+    def build_from_file(cls, path, addresses_path, false_positive_rate=0.001):
+        """Constrói o índice a partir de um arquivo texto com um endereço por linha."""
+        with open(addresses_path, "r", encoding="utf-8") as f:
+            return cls.build(path, addresses=(line for line in f if line.strip()), false_positive_rate=false_positive_rate)
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    from bitcoin.address import Address
+
+    address = Address()
+    known = [address.public_to_address(address.private_to_public(k)) for k in range(1, 6)]
+
+    path = os.path.join(tempfile.gettempdir(), "watchlist.h160")
+    watchlist = Hash160Watchlist.build(path, addresses=known)
+
+    print(f"Registros:     {len(watchlist)}")
+    print(f"Chave 3 (hit): {watchlist.contains(address.public_to_hash160(address.private_to_public(3)))}")
+    print(f"Chave 9:       {watchlist.contains(address.public_to_hash160(address.private_to_public(9)))}")
+    watchlist.close()
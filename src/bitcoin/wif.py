@@ -1,5 +1,40 @@
+from functools import partial
+
 from crypto.sha256 import SHA256
 from base.base58 import Base58
+from bitcoin.records import FLAG_TESTNET, FLAG_WIF_COMPRESSED, RecordWriter
+from bitcoin.keys import SECP256K1_ORDER, check_private_key
+from bitcoin.parallel import map_numbered_chunks
+
+# Prefixo (byte de rede) do WIF -> nome da rede
+NETWORKS = {0x80: "mainnet", 0xEF: "testnet"}
+
+# Status retornados por WIF.decode_many
+STATUS_OK = "ok"
+STATUS_INVALID_BASE58 = "invalid_base58"
+STATUS_INVALID_LENGTH = "invalid_length"
+STATUS_INVALID_CHECKSUM = "invalid_checksum"
+STATUS_INVALID_NETWORK = "invalid_network"
+STATUS_INVALID_KEY = "invalid_key"
+
+# Instância de WIF de cada processo de trabalho de decode_many() e encode_many()
+_worker = {}
+
+
+def _worker_wif():
+    if "wif" not in _worker:
+        _worker["wif"] = WIF()
+    return _worker["wif"]
+
+
+def _decode_chunk(lines):
+    """Decodifica um bloco de linhas em um processo de trabalho (chaves em bytes)."""
+    return _worker_wif().decode_batch(lines)
+
+
+def _encode_chunk(values, key_format="hex", compressed=True, testnet=False):
+    """Codifica um bloco de chaves privadas em um processo de trabalho."""
+    return _worker_wif().encode_batch(values, key_format, compressed, testnet)
 
 
 class WIF:
@@ -8,6 +43,7 @@ class WIF:
         # Instances
         self.base58 = Base58()
         self.sha256 = SHA256()
+        self.n_order = SECP256K1_ORDER
 
     def private_key_to_WIF(self, private_key, compressed=False, testnet=False):
         """
@@ -23,38 +59,46 @@ class WIF:
         """
         # Verifica se a chave privada é um inteiro ou uma string hexadecimal
         if isinstance(private_key, int):
-            # Converte inteiro para hexadecimal (mínimo 32 bytes)
-            private_key_hex = f"{private_key:064x}"
+            # Converte inteiro para 32 bytes
+            private_key_bytes = private_key.to_bytes(32, byteorder='big')
         elif isinstance(private_key, str):
             # Valida se é um hexadecimal válido
             if all(c in "0123456789abcdefABCDEF" for c in private_key) and len(private_key) <= 64:
-                private_key_hex = private_key.zfill(64)  # Garante 64 caracteres preenchendo com zeros à esquerda
+                private_key_bytes = bytes.fromhex(private_key.zfill(64))  # Garante 64 caracteres preenchendo com zeros à esquerda
             else:
                 raise ValueError("A chave privada em formato string não é um hexadecimal válido.")
         else:
             raise TypeError("A chave privada deve ser um inteiro ou uma string hexadecimal.")
 
+        return self.private_key_bytes_to_WIF(private_key_bytes, compressed, testnet)
+
+    def private_key_bytes_to_WIF(self, private_key_bytes, compressed=False, testnet=False):
+        """
+        Converte uma chave privada de 32 bytes para o formato WIF, sem passar por hex.
+
+        Args:
+            private_key_bytes (bytes): A chave privada em 32 bytes big-endian.
+            compressed (bool): Indica se a chave está em formato comprimido.
+            testnet (bool): Indica se é para a rede de teste (testnet).
+
+        Returns:
+            str: A chave privada em formato WIF.
+        """
+        if len(private_key_bytes) != 32:
+            raise ValueError("A chave privada deve ter 32 bytes.")
+
         # Passo 1: Prefixo da rede
         prefix = b'\x80' if not testnet else b'\xEF'  # \x80 para mainnet, \xEF para testnet
 
         # Passo 2: Adicionar o prefixo à chave privada
-        private_key_bytes = bytes.fromhex(private_key_hex)
-        extended_key = prefix + private_key_bytes
+        extended_key = prefix + bytes(private_key_bytes)
 
         # Passo 3: Adicionar o sufixo de compressão se necessário
         if compressed:
             extended_key += b'\x01'
 
-        # Passo 4: Calcular o checksum
-        first_sha256 = self.sha256.sha256(extended_key)
-        second_sha256 = self.sha256.sha256(first_sha256)
-        checksum = second_sha256[:4]  # 4 bytes do início do hash
-
-        # Passo 5: Concatenar extended_key e checksum
-        final_key = extended_key + checksum
-
-        # Passo 6: Codificar em base58
-        wif = self.base58.encode(final_key)
+        # Passo 4: Codificar em Base58Check (extended_key + 4 bytes do SHA256 duplo)
+        wif = self.base58.encode_check(extended_key)
         return wif
 
     def WIF_to_privatekey(self, wif, integer=False):
@@ -68,37 +112,212 @@ class WIF:
         Returns:
             tuple: Uma tupla contendo a chave privada em hexadecimal (str ou int) e um booleano indicando se está em formato comprimido.
         """
+        key, compressed = self.WIF_to_private_key_bytes(wif)
+
+        # Converter a chave privada para o formato desejado
+        if integer:
+            private_key = int.from_bytes(key, byteorder='big')
+        else:
+            private_key = key.hex()
+
+        return private_key, compressed
+
+    def WIF_to_private_key_bytes(self, wif):
+        """
+        Converte uma chave privada em formato WIF para 32 bytes, sem passar por hex.
+
+        Args:
+            wif (str): A chave privada no formato WIF.
+
+        Returns:
+            tuple: Uma tupla contendo a chave privada (bytes) e um booleano indicando se está em formato comprimido.
+        """
         # Decodificar a chave WIF usando Base58
         decoded = self.base58.decode(wif)
 
+        # prefixo (1) + chave (32) [+ 0x01] + checksum (4)
+        if len(decoded) not in (37, 38):
+            raise ValueError("Tamanho inválido para a chave WIF fornecida.")
+
         # Dividir a chave nos componentes: prefixo, chave, e checksum
-        network_byte = decoded[0:1]  # Prefixo da rede
+        network_byte = decoded[0]    # Prefixo da rede
         key = decoded[1:-4]          # Chave sem o checksum
         checksum = decoded[-4:]      # Últimos 4 bytes são o checksum
 
-        # Validar o checksum
-        first_sha256 = self.sha256.sha256(decoded[:-4])
-        second_sha256 = self.sha256.sha256(first_sha256)
-        calculated_checksum = second_sha256[:4]  # Primeiros 4 bytes do segundo hash
+        # Validar o checksum (primeiros 4 bytes do SHA256 duplo)
+        calculated_checksum = self.sha256.checksum4(decoded[:-4])
         if calculated_checksum != checksum:
             raise ValueError("Checksum inválido para a chave WIF fornecida.")
 
+        # Validar o byte de rede (0x80 mainnet, 0xEF testnet)
+        if network_byte not in NETWORKS:
+            raise ValueError("Byte de rede inválido para a chave WIF fornecida.")
+
         # Verificar se a chave está em formato comprimido
         if len(key) == 33 and key[-1] == 0x01:  # Verificar se o último byte é 0x01
             key = key[:-1]
             compressed = True
-        else:
+        elif len(key) == 32:
             compressed = False
+        else:
+            raise ValueError("Tamanho inválido para a chave WIF fornecida.")
 
-        # Converter a chave privada para o formato desejado
-        private_key_hex = key.hex()
+        return key, compressed
 
-        if integer:
-            private_key = int(private_key_hex, 16)
+    def encode_batch(self, values, key_format="hex", compressed=True, testnet=False):
+        """
+        Versão em lote de private_key_to_WIF que não levanta exceção por registro: os
+        checksums do lote são calculados juntos (Base58.encode_check_many).
+
+        Returns:
+            list: (WIF, status) por valor, na ordem de entrada; WIF é None quando o
+            status não é STATUS_OK (ver bitcoin.keys.check_private_key).
+        """
+        prefix = b'\xEF' if testnet else b'\x80'
+        suffix = b'\x01' if compressed else b''
+        checked = [check_private_key(value, key_format) for value in values]
+        encoded = iter(self.base58.encode_check_many(
+            prefix + private_key.to_bytes(32, byteorder='big') + suffix
+            for private_key, status in checked if status is None
+        ))
+        return [(next(encoded), STATUS_OK) if status is None else (None, status) for _, status in checked]
+
+    def encode_many(self, values, key_format="hex", compressed=True, testnet=False, errors=None, batch_size=4096,
+                    jobs=1):
+        """
+        Codifica um fluxo de chaves privadas (ex.: as linhas de um arquivo) em WIF, em
+        lotes, como decode_many: valores em branco são ignorados e os inválidos não
+        interrompem o fluxo.
+
+        Args:
+            errors (file): Opcional. Recebe uma linha "número<TAB>status<TAB>valor" por chave
+                inválida, com o número da linha na entrada (contando as linhas em branco).
+            jobs (int): Número de processos que codificam os lotes.
+
+        Yields:
+            tuple: (WIF, status), na ordem de entrada.
+        """
+        if jobs == 1:
+            batch = partial(self.encode_batch, key_format=key_format, compressed=compressed, testnet=testnet)
         else:
-            private_key = private_key_hex
+            batch = partial(_encode_chunk, key_format=key_format, compressed=compressed, testnet=testnet)
+        for numbers, chunk, results in map_numbered_chunks(batch, values, jobs, batch_size):
+            for line_number, value, result in zip(numbers, chunk, results):
+                if result[1] != STATUS_OK and errors is not None:
+                    errors.write(f"{line_number}\t{result[1]}\t{value}\n")
+                yield result
+
+    def decode_batch(self, lines, integer=False):
+        """
+        Decodifica uma lista de WIFs sem levantar exceção por registro. Os checksums
+        do lote são calculados juntos.
 
-        return private_key, compressed
+        Args:
+            lines (list): WIFs (str), com ou sem espaços/quebra de linha.
+            integer (bool): Retorna a chave como inteiro em vez de 32 bytes.
+
+        Returns:
+            list: Tuplas (chave, compressed, network, status) na ordem de entrada. Em
+            registros inválidos a chave e compressed são None e status indica o erro.
+        """
+        decoded_list = []
+        for line in lines:
+            try:
+                decoded = self.base58.decode(line.strip())
+            except ValueError:
+                decoded_list.append(STATUS_INVALID_BASE58)
+                continue
+            # prefixo (1) + chave (32) [+ 0x01] + checksum (4)
+            decoded_list.append(decoded if len(decoded) in (37, 38) else STATUS_INVALID_LENGTH)
+
+        checksums = iter(self.sha256.checksum4_many(
+            decoded[:-4] for decoded in decoded_list if not isinstance(decoded, str)
+        ))
+        n_order = self.n_order
+        results = []
+        for decoded in decoded_list:
+            if isinstance(decoded, str):
+                results.append((None, None, None, decoded))
+                continue
+            if next(checksums) != decoded[-4:]:
+                results.append((None, None, None, STATUS_INVALID_CHECKSUM))
+                continue
+            network = NETWORKS.get(decoded[0])
+            if network is None:
+                results.append((None, None, None, STATUS_INVALID_NETWORK))
+                continue
+            compressed = len(decoded) == 38
+            if compressed and decoded[33] != 0x01:
+                results.append((None, None, network, STATUS_INVALID_LENGTH))
+                continue
+            key = decoded[1:33]
+            key_int = int.from_bytes(key, byteorder='big')
+            if not 1 <= key_int < n_order:
+                results.append((None, None, network, STATUS_INVALID_KEY))
+                continue
+            results.append((key_int if integer else key, compressed, network, STATUS_OK))
+        return results
+
+    def decode_many(self, lines, integer=False, errors=None, batch_size=4096, jobs=1):
+        """
+        Decodifica um fluxo de WIFs (ex.: as linhas de um arquivo) em lotes, sem
+        carregar tudo em memória e sem levantar exceção por registro.
+
+        Args:
+            lines (iterable): WIFs (str), um por item; linhas em branco são ignoradas.
+            integer (bool): Retorna a chave como inteiro em vez de 32 bytes.
+            errors (file): Opcional. Recebe uma linha "número<TAB>status<TAB>WIF" por registro
+                inválido, com o número da linha na entrada (contando as linhas em branco).
+            batch_size (int): Quantidade de WIFs validados por lote.
+            jobs (int): Número de processos que decodificam os lotes.
+
+        Yields:
+            tuple: (chave, compressed, network, status), na ordem de entrada.
+        """
+        batch = self.decode_batch if jobs == 1 else _decode_chunk
+        for numbers, chunk, results in map_numbered_chunks(batch, lines, jobs, batch_size):
+            for line_number, line, result in zip(numbers, chunk, results):
+                key, compressed, network, status = result
+                if status != STATUS_OK:
+                    if errors is not None:
+                        errors.write(f"{line_number}\t{status}\t{line}\n")
+                elif integer:
+                    result = int.from_bytes(key, byteorder='big'), compressed, network, status
+                yield result
+
+    def decode_file(self, input_path, output_path, errors_path=None, jobs=1, chunk_size=4096):
+        """
+        Converte um arquivo texto de WIFs (um por linha) em um arquivo binário de
+        registros (bitcoin.records) só com as chaves privadas válidas. Os registros
+        inválidos vão para errors_path, se informado, com o número da linha no arquivo
+        de entrada. Com jobs > 1 os lotes são decodificados em vários processos e
+        gravados na ordem de entrada. Chaves de WIFs comprimidos levam
+        FLAG_WIF_COMPRESSED (os registros não têm chave pública).
+
+        Returns:
+            tuple: (registros gravados, registros inválidos).
+        """
+        written = invalid = 0
+        errors = open(errors_path, "w", encoding="utf-8") if errors_path else None
+        try:
+            with open(input_path, "r", encoding="utf-8") as source, RecordWriter(output_path) as writer:
+                batch = self.decode_batch if jobs == 1 else _decode_chunk
+                for numbers, chunk, results in map_numbered_chunks(batch, source, jobs, chunk_size):
+                    for line_number, line, (key, compressed, network, status) in zip(numbers, chunk, results):
+                        if status != STATUS_OK:
+                            invalid += 1
+                            if errors is not None:
+                                errors.write(f"{line_number}\t{status}\t{line}\n")
+                            continue
+                        flags = FLAG_WIF_COMPRESSED if compressed else 0
+                        if network == "testnet":
+                            flags |= FLAG_TESTNET
+                        writer.write(key, flags=flags)
+                        written += 1
+        finally:
+            if errors is not None:
+                errors.close()
+        return written, invalid
 
 
 if __name__ == "__main__":
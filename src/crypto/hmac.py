@@ -0,0 +1,51 @@
+from crypto.sha256 import SHA256
+
+
+class HMAC:
+    """HMAC (RFC 2104) sobre as funções de hash puras deste pacote (padrão: SHA256)."""
+
+    def __init__(self, key, message=None, hash_class=SHA256):
+        self.hash_class = hash_class
+        block_size = hash_class.block_size
+        if len(key) > block_size:
+            key = hash_class(key).digest()
+        key = key.ljust(block_size, b"\x00")
+        # Estados já com o bloco da chave absorvido: copy() reaproveita os dois
+        self._inner = hash_class(bytes(b ^ 0x36 for b in key))
+        self._outer = hash_class(bytes(b ^ 0x5C for b in key))
+        if message:
+            self.update(message)
+
+    def update(self, message):
+        self._inner.update(message)
+
+    def digest(self):
+        outer = self._outer.copy()
+        outer.update(self._inner.digest())
+        return outer.digest()
+
+    def hexdigest(self):
+        return self.digest().hex()
+
+    def copy(self):
+        """
+        Cópia independente do estado atual. Com uma chave fixa (ex.: o chain code do
+        BIP32), copiar um HMAC pronto evita recomprimir os blocos da chave a cada mensagem.
+        """
+        clone = HMAC.__new__(HMAC)
+        clone.hash_class = self.hash_class
+        clone._inner = self._inner.copy()
+        # O estado externo nunca é alterado (digest() trabalha numa cópia)
+        clone._outer = self._outer
+        return clone
+
+    @staticmethod
+    def hmac(key, message, hash_class=SHA256):
+        """Método estático para retornar o HMAC diretamente."""
+        return HMAC(key, message, hash_class).digest()
+
+
+if __name__ == "__main__":
+    mac = HMAC.hmac(b"key", b"The quick brown fox jumps over the lazy dog")
+    print(mac.hex())
+    print(f"Valid? {mac.hex() == 'f7bc83f430538424b13298e6aa6fb143ef4d59a14946175997479dbc2d1a3cd8'}")
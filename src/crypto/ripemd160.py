@@ -1,86 +1,167 @@
 import struct
 
+# NumPy é opcional e importado só no primeiro lote (ver crypto.sha256._numpy)
+from crypto.sha256 import SHA256, _numpy
+
+# The permutation ρ
+_RHO = (7, 4, 13, 1, 10, 6, 15, 3, 12, 0, 9, 5, 2, 14, 11, 8)
+
+# The permutation π(i) = 9i + 5  (mod 16)
+_PI = tuple((9*i + 5) % 16 for i in range(16))
+
+
+def _round_permutations(first):
+    """[first, ρ·first, ρ²·first, ρ³·first, ρ⁴·first]"""
+    permutations = [tuple(first)]
+    for _ in range(4):
+        permutations.append(tuple(_RHO[j] for j in permutations[-1]))
+    return tuple(permutations)
+
+
+# Round permutation r (left line) e r' (right line)
+_RL = _round_permutations(range(16))
+_RR = _round_permutations(_PI)
+
+# Shifts
+_SHIFTS = (
+    (11, 14, 15, 12, 5, 8, 7, 9, 11, 13, 14, 15, 6, 7, 9, 8),
+    (12, 13, 11, 15, 6, 9, 9, 7, 12, 15, 11, 13, 7, 8, 7, 7),
+    (13, 15, 14, 11, 7, 7, 6, 8, 13, 14, 13, 12, 5, 5, 6, 9),
+    (14, 11, 12, 14, 8, 6, 5, 5, 15, 12, 15, 14, 9, 9, 8, 6),
+    (15, 12, 13, 13, 9, 5, 8, 6, 14, 11, 12, 11, 8, 6, 5, 5),
+)
+_SL = tuple(tuple(_SHIFTS[i][r] for r in _RL[i]) for i in range(5))
+_SR = tuple(tuple(_SHIFTS[i][r] for r in _RR[i]) for i in range(5))
+
+# Pares (índice da palavra, rotação) de cada passo, por ronda
+_LEFT = tuple(tuple(zip(_RL[i], _SL[i])) for i in range(5))
+_RIGHT = tuple(tuple(zip(_RR[i], _SR[i])) for i in range(5))
+
+# Constants: 2**30 * sqrt(2, 3, 5, 7) (left line) e 2**30 * cubert(2, 3, 5, 7) (right line)
+_KL = (0, 0x5A827999, 0x6ED9EBA1, 0x8F1BBCDC, 0xA953FD4E)
+_KR = (0x50A28BE6, 0x5C4DD124, 0x6D703EF3, 0x7A6D76E9, 0)
+
+# Initial value
+_INITIAL_H = tuple(struct.unpack("<5L", bytes.fromhex("0123456789ABCDEFFEDCBA9876543210F0E1D2C3")))
+
+_unpack_block = struct.Struct("<16L").unpack_from
+_pack_state = struct.Struct("<5L").pack
+
+# Padding de uma mensagem de 32 bytes (saída do SHA256): cabe num único bloco
+_DIGEST_PADDING = b"\x80" + b"\x00" * 23 + struct.pack("<Q", 32 * 8)
+
+
+def _compress(h, data, offset=0):
+    """
+    Função de compressão do RIPEMD-160 sobre o bloco data[offset:offset + 64].
+    As funções booleanas de cada ronda estão escritas diretamente no laço.
+    """
+    x = _unpack_block(data, offset)
+    al = ar = h[0]
+    bl = br = h[1]
+    cl = cr = h[2]
+    dl = dr = h[3]
+    el = er = h[4]
+
+    # Ronda 1: linha esquerda, depois linha direita
+    for r, s in _LEFT[0]:
+        t = (al + (bl ^ cl ^ dl) + x[r]) & 0xFFFFFFFF
+        al, bl, cl, dl, el = el, ((((t << s) | (t >> (32 - s))) & 0xFFFFFFFF) + el) & 0xFFFFFFFF, bl, ((cl << 10) | (cl >> 22)) & 0xFFFFFFFF, dl
+    for r, s in _RIGHT[0]:
+        t = (ar + (br ^ (cr | (dr ^ 0xFFFFFFFF))) + x[r] + 0x50A28BE6) & 0xFFFFFFFF
+        ar, br, cr, dr, er = er, ((((t << s) | (t >> (32 - s))) & 0xFFFFFFFF) + er) & 0xFFFFFFFF, br, ((cr << 10) | (cr >> 22)) & 0xFFFFFFFF, dr
+    # Ronda 2: linha esquerda, depois linha direita
+    for r, s in _LEFT[1]:
+        t = (al + (dl ^ (bl & (cl ^ dl))) + x[r] + 0x5A827999) & 0xFFFFFFFF
+        al, bl, cl, dl, el = el, ((((t << s) | (t >> (32 - s))) & 0xFFFFFFFF) + el) & 0xFFFFFFFF, bl, ((cl << 10) | (cl >> 22)) & 0xFFFFFFFF, dl
+    for r, s in _RIGHT[1]:
+        t = (ar + (cr ^ (dr & (br ^ cr))) + x[r] + 0x5C4DD124) & 0xFFFFFFFF
+        ar, br, cr, dr, er = er, ((((t << s) | (t >> (32 - s))) & 0xFFFFFFFF) + er) & 0xFFFFFFFF, br, ((cr << 10) | (cr >> 22)) & 0xFFFFFFFF, dr
+    # Ronda 3: linha esquerda, depois linha direita
+    for r, s in _LEFT[2]:
+        t = (al + ((bl | (cl ^ 0xFFFFFFFF)) ^ dl) + x[r] + 0x6ED9EBA1) & 0xFFFFFFFF
+        al, bl, cl, dl, el = el, ((((t << s) | (t >> (32 - s))) & 0xFFFFFFFF) + el) & 0xFFFFFFFF, bl, ((cl << 10) | (cl >> 22)) & 0xFFFFFFFF, dl
+    for r, s in _RIGHT[2]:
+        t = (ar + ((br | (cr ^ 0xFFFFFFFF)) ^ dr) + x[r] + 0x6D703EF3) & 0xFFFFFFFF
+        ar, br, cr, dr, er = er, ((((t << s) | (t >> (32 - s))) & 0xFFFFFFFF) + er) & 0xFFFFFFFF, br, ((cr << 10) | (cr >> 22)) & 0xFFFFFFFF, dr
+    # Ronda 4: linha esquerda, depois linha direita
+    for r, s in _LEFT[3]:
+        t = (al + (cl ^ (dl & (bl ^ cl))) + x[r] + 0x8F1BBCDC) & 0xFFFFFFFF
+        al, bl, cl, dl, el = el, ((((t << s) | (t >> (32 - s))) & 0xFFFFFFFF) + el) & 0xFFFFFFFF, bl, ((cl << 10) | (cl >> 22)) & 0xFFFFFFFF, dl
+    for r, s in _RIGHT[3]:
+        t = (ar + (dr ^ (br & (cr ^ dr))) + x[r] + 0x7A6D76E9) & 0xFFFFFFFF
+        ar, br, cr, dr, er = er, ((((t << s) | (t >> (32 - s))) & 0xFFFFFFFF) + er) & 0xFFFFFFFF, br, ((cr << 10) | (cr >> 22)) & 0xFFFFFFFF, dr
+    # Ronda 5: linha esquerda, depois linha direita
+    for r, s in _LEFT[4]:
+        t = (al + (bl ^ (cl | (dl ^ 0xFFFFFFFF))) + x[r] + 0xA953FD4E) & 0xFFFFFFFF
+        al, bl, cl, dl, el = el, ((((t << s) | (t >> (32 - s))) & 0xFFFFFFFF) + el) & 0xFFFFFFFF, bl, ((cl << 10) | (cl >> 22)) & 0xFFFFFFFF, dl
+    for r, s in _RIGHT[4]:
+        t = (ar + (br ^ cr ^ dr) + x[r]) & 0xFFFFFFFF
+        ar, br, cr, dr, er = er, ((((t << s) | (t >> (32 - s))) & 0xFFFFFFFF) + er) & 0xFFFFFFFF, br, ((cr << 10) | (cr >> 22)) & 0xFFFFFFFF, dr
+
+    # Mix the two pipelines together
+    return (
+        (h[1] + cl + dr) & 0xFFFFFFFF,
+        (h[2] + dl + er) & 0xFFFFFFFF,
+        (h[3] + el + ar) & 0xFFFFFFFF,
+        (h[4] + al + br) & 0xFFFFFFFF,
+        (h[0] + bl + cr) & 0xFFFFFFFF,
+    )
+
+
+def _ripemd160_lanes(messages, length):
+    """
+    RIPEMD-160 de N mensagens de mesmo tamanho em paralelo (NumPy): as linhas
+    esquerda e direita rodam sobre vetores uint32 com uma posição por mensagem.
+    """
+    np = _numpy()
+    count = len(messages)
+    padding = b"\x80" + b"\x00" * ((55 - length) % 64) + struct.pack("<Q", length * 8)
+    padded = b"".join(message + padding for message in messages)
+    # Leitura little-endian das palavras numa única view vetorizada: (palavras, mensagens)
+    words = np.frombuffer(padded, dtype="<u4").reshape(count, -1).astype(np.uint32).T
+
+    functions = (
+        lambda x, y, z: x ^ y ^ z,
+        lambda x, y, z: z ^ (x & (y ^ z)),
+        lambda x, y, z: (x | ~y) ^ z,
+        lambda x, y, z: y ^ (z & (x ^ y)),
+        lambda x, y, z: x ^ (y | ~z),
+    )
+    ten = np.uint32(10)
+    twenty_two = np.uint32(22)
+
+    def line(h, x, steps, constants, order):
+        a, b, c, d, e = h
+        for round in range(5):
+            f = functions[order[round]]
+            k = np.uint32(constants[round])
+            for r, s in steps[round]:
+                t = a + f(b, c, d) + x[r] + k
+                t = (t << np.uint32(s)) | (t >> np.uint32(32 - s))
+                a, b, c, d, e = e, t + e, b, (c << ten) | (c >> twenty_two), d
+        return a, b, c, d, e
+
+    h = tuple(np.full(count, v, dtype=np.uint32) for v in _INITIAL_H)
+    with np.errstate(over="ignore"):
+        for block in range(0, words.shape[0], 16):
+            x = words[block:block + 16]
+            al, bl, cl, dl, el = line(h, x, _LEFT, _KL, (0, 1, 2, 3, 4))
+            ar, br, cr, dr, er = line(h, x, _RIGHT, _KR, (4, 3, 2, 1, 0))
+            h = (h[1] + cl + dr, h[2] + dl + er, h[3] + el + ar, h[4] + al + br, h[0] + bl + cr)
+    digests = np.stack(h, axis=1).astype("<u4").tobytes()
+    return [digests[i:i + 20] for i in range(0, 20 * count, 20)]
+
 
 class Ripemd160:
-    
-    def __init__(self):    
-        # The permutation ρ
-        rho = [7, 4, 13, 1, 10, 6, 15, 3, 12, 0, 9, 5, 2, 14, 11, 8]
-
-        # The permutation π(i) = 9i + 5  (mod 16)
-        pi = [(9*i + 5) % 16 for i in range(16)]
-
-        # Round permutation r (left line)
-        self.rl = [list(range(16))]  # id
-        self.rl += [[rho[j] for j in self.rl[-1]]]  # ρ
-        self.rl += [[rho[j] for j in self.rl[-1]]]  # ρ^2
-        self.rl += [[rho[j] for j in self.rl[-1]]]  # ρ^3
-        self.rl += [[rho[j] for j in self.rl[-1]]]  # ρ^4
-
-        # r' (right line)
-        self.rr = [list(pi)]  # π
-        self.rr += [[rho[j] for j in self.rr[-1]]]  # ρπ
-        self.rr += [[rho[j] for j in self.rr[-1]]]  # ρ^2 π
-        self.rr += [[rho[j] for j in self.rr[-1]]]  # ρ^3 π
-        self.rr += [[rho[j] for j in self.rr[-1]]]  # ρ^4 π
-
-        # Boolean functions
-        f1 = lambda x, y, z: x ^ y ^ z
-        f2 = lambda x, y, z: (x & y) | (~x & z)
-        f3 = lambda x, y, z: (x | ~y) ^ z
-        f4 = lambda x, y, z: (x & z) | (y & ~z)
-        f5 = lambda x, y, z: x ^ (y | ~z)
-
-        # boolean functions (left line)
-        self.fl = [f1, f2, f3, f4, f5]
-
-        # boolean functions (right line)
-        self.fr = [f5, f4, f3, f2, f1]
-
-        # Shifts
-        _shift1 = [11, 14, 15, 12, 5, 8, 7, 9, 11, 13, 14, 15, 6, 7, 9, 8]
-        _shift2 = [12, 13, 11, 15, 6, 9, 9, 7, 12, 15, 11, 13, 7, 8, 7, 7]
-        _shift3 = [13, 15, 14, 11, 7, 7, 6, 8, 13, 14, 13, 12, 5, 5, 6, 9]
-        _shift4 = [14, 11, 12, 14, 8, 6, 5, 5, 15, 12, 15, 14, 9, 9, 8, 6]
-        _shift5 = [15, 12, 13, 13, 9, 5, 8, 6, 14, 11, 12, 11, 8, 6, 5, 5]
-
-        # shifts (left line)
-        self.sl = [[_shift1[self.rl[0][i]] for i in range(16)]]
-        self.sl.append([_shift2[self.rl[1][i]] for i in range(16)])
-        self.sl.append([_shift3[self.rl[2][i]] for i in range(16)])
-        self.sl.append([_shift4[self.rl[3][i]] for i in range(16)])
-        self.sl.append([_shift5[self.rl[4][i]] for i in range(16)])
-
-        # shifts (right line)
-        self.sr = [[_shift1[self.rr[0][i]] for i in range(16)]]
-        self.sr.append([_shift2[self.rr[1][i]] for i in range(16)])
-        self.sr.append([_shift3[self.rr[2][i]] for i in range(16)])
-        self.sr.append([_shift4[self.rr[3][i]] for i in range(16)])
-        self.sr.append([_shift5[self.rr[4][i]] for i in range(16)])
-
-        # Constants
-        self._kg = lambda x, y: int(2**30 * (y ** (1.0 / x)))
-
-        # constants (left line)
-        self.KL = [
-            0,          # Round 1: 0
-            self._kg(2, 2),  # Round 2: 2**30 * sqrt(2)
-            self._kg(2, 3),  # Round 3: 2**30 * sqrt(3)
-            self._kg(2, 5),  # Round 4: 2**30 * sqrt(5)
-            self._kg(2, 7),  # Round 5: 2**30 * sqrt(7)
-        ]
-
-        # constants (right line)
-        self.KR = [
-            self._kg(3, 2),  # Round 1: 2**30 * cubert(2)
-            self._kg(3, 3),  # Round 2: 2**30 * cubert(3)
-            self._kg(3, 5),  # Round 3: 2**30 * cubert(5)
-            self._kg(3, 7),  # Round 4: 2**30 * cubert(7)
-            0,          # Round 5: 0
-        ]
-
-        # Initial value
-        self.initial_h = tuple(struct.unpack("<5L", bytes.fromhex("0123456789ABCDEFFEDCBA9876543210F0E1D2C3")))
+    # Tabelas compartilhadas (calculadas uma única vez, no import do módulo)
+    rl = _RL
+    rr = _RR
+    sl = _SL
+    sr = _SR
+    KL = _KL
+    KR = _KR
+    initial_h = _INITIAL_H
 
     # Rather than writing & 0xffffffff every time (and risking typographical
     # errors each time), we use this function.
@@ -90,68 +171,75 @@ class Ripemd160:
 
     # cyclic rotate
     def rol(self, s, n):
-        assert 0 <= s <= 31
-        assert 0 <= n <= 0xFFFFFFFF
-        return self.u32((n << s) | (n >> (32-s)))
-
-    def box(self, h, f, k, x, r, s):
-        assert len(s) == 16
-        assert len(x) == 16
-        assert len(r) == 16
-        (a, b, c, d, e) = h
-        for word in range(16):
-            T = self.u32(a + f(b, c, d) + x[r[word]] + k)
-            T = self.u32(self.rol(s[word], T) + e)
-            (b, c, d, e, a) = (T, b, self.rol(10, c), d, e)
-        return (a, b, c, d, e)
-
-    def _compress(self, h, x):    # x is a list of 16 x 32-bit words
-        hl = hr = h
-
-        # Iterate through all 5 rounds of the compression function for each parallel pipeline
-        for round in range(5):
-            # left line
-            hl = self.box(hl, self.fl[round], self.KL[round], x, self.rl[round], self.sl[round])
-            # right line
-            hr = self.box(hr, self.fr[round], self.KR[round], x, self.rr[round], self.sr[round])
-
-        # Mix the two pipelines together
-        h = (self.u32(h[1] + hl[2] + hr[3]),
-            self.u32(h[2] + hl[3] + hr[4]),
-            self.u32(h[3] + hl[4] + hr[0]),
-            self.u32(h[4] + hl[0] + hr[1]),
-            self.u32(h[0] + hl[1] + hr[2]))
-
-        return h
+        return ((n << s) | (n >> (32-s))) & 0xFFFFFFFF
 
     def compress(self, h, s):
         """The RIPEMD-160 compression function"""
-        assert len(s) % 64 == 0
-        p = 0
-        while p < len(s):
-            x = s[p:p+64]  # chunk
-            x = [struct.unpack("<L", x[i:i+4])[0] for i in range(0, len(x), 4)]
-            h = self._compress(h, x)
-            p += 64
+        if len(s) % 64:
+            raise ValueError("A mensagem deve ter um número inteiro de blocos de 64 bytes.")
+        for p in range(0, len(s), 64):
+            h = _compress(h, s, p)
         return h
 
     def hsh(self, message):
         # Preprocessing: Add padding and append length of message
-        #message = message.encode('utf-8')  # Convert string to bytes
         length = len(message)
-        message += b'\x80'  # add padding byte
-        while len(message) % 64 != 56:
-            message += b'\x00'  # pad with zeros
-        message += struct.pack("<Q", 8 * length)  # append length
+        message = bytes(message) + b"\x80" + b"\x00" * ((55 - length) % 64) + struct.pack("<Q", 8 * length)
 
-        h = self.initial_h
         # 2. Compute the hash
-        h = self.compress(h, message)  # Use the bytes directly
-        return h
+        return self.compress(_INITIAL_H, message)
 
     def digest(self, message):
-        h = self.hsh(message)
-        return bytes(struct.pack("<5L", *h))
+        if len(message) == 32:
+            return _pack_state(*_compress(_INITIAL_H, bytes(message) + _DIGEST_PADDING))
+        return _pack_state(*self.hsh(message))
+
+    # Abaixo deste número de mensagens do mesmo tamanho, o caminho puro Python é mais rápido
+    MIN_NUMPY_LANES = 32
+
+    def digest_many(self, messages, batch_size=4096, use_numpy=None):
+        """
+        RIPEMD-160 de uma lista de mensagens, na ordem de entrada.
+
+        Com NumPy instalado, mensagens de mesmo tamanho (ex.: saídas de 32 bytes do
+        SHA256) são processadas em lotes de até batch_size mensagens. Sem NumPy (ou
+        com use_numpy=False), usa digest() para cada mensagem.
+        """
+        messages = [bytes(m) for m in messages]
+        if use_numpy is None:
+            use_numpy = _numpy() is not None
+        elif use_numpy and _numpy() is None:
+            raise ImportError("O backend em lote do RIPEMD-160 requer NumPy.")
+        if not use_numpy:
+            return [self.digest(m) for m in messages]
+
+        results = [None] * len(messages)
+        groups = {}
+        for index, message in enumerate(messages):
+            groups.setdefault(len(message), []).append(index)
+        for length, indexes in groups.items():
+            if len(indexes) < self.MIN_NUMPY_LANES:
+                for index in indexes:
+                    results[index] = self.digest(messages[index])
+                continue
+            for start in range(0, len(indexes), batch_size):
+                chunk = indexes[start:start + batch_size]
+                digests = _ripemd160_lanes([messages[index] for index in chunk], length)
+                for index, digest in zip(chunk, digests):
+                    results[index] = digest
+        return results
+
+    @staticmethod
+    def hash160_many(public_keys, batch_size=4096, use_numpy=None):
+        """Versão em lote de hash160: SHA256 e RIPEMD-160 vetorizados quando há NumPy."""
+        sha256_digests = SHA256.sha256_many(public_keys, batch_size, use_numpy)
+        return Ripemd160().digest_many(sha256_digests, batch_size, use_numpy)
+
+    @staticmethod
+    def hash160(public_key_bytes):
+        """RIPEMD160(SHA256(data)) sem objetos intermediários."""
+        sha256_digest = SHA256.sha256(bytes(public_key_bytes))
+        return _pack_state(*_compress(_INITIAL_H, sha256_digest + _DIGEST_PADDING))
 
 
 if __name__ == "__main__":
@@ -1,89 +1,319 @@
+import mmap
+import os
 import struct
 
-class SHA256:
-    _k = (
-        0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5,
-        0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
-        0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3,
-        0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
-        0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc,
-        0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
-        0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7,
-        0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967,
-        0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13,
-        0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85,
-        0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3,
-        0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
-        0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5,
-        0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
-        0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208,
-        0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2
+# NumPy é opcional (sem ele, os lotes usam o caminho puro Python) e só é
+# importado no primeiro lote, para não pesar no início de quem não usa lotes
+numpy = None
+_numpy_checked = False
+
+
+def _numpy():
+    """Importa NumPy na primeira chamada; retorna o módulo, ou None se não estiver instalado."""
+    global numpy, _numpy_checked
+    if not _numpy_checked:
+        try:
+            import numpy as module
+        except ImportError:
+            module = None
+        numpy = module
+        _numpy_checked = True
+    return numpy
+
+# Constantes de ronda (32 bits iniciais das partes fracionárias das raízes cúbicas dos 64 primeiros primos)
+_K = (
+    0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5,
+    0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
+    0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3,
+    0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
+    0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc,
+    0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
+    0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7,
+    0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967,
+    0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13,
+    0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85,
+    0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3,
+    0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
+    0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5,
+    0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
+    0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208,
+    0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2
+)
+
+# Valor inicial do estado
+_H = (
+    0x6a09e667, 0xbb67ae85, 0x3c6ef372, 0xa54ff53a,
+    0x510e527f, 0x9b05688c, 0x1f83d9ab, 0x5be0cd19
+)
+
+_unpack_block = struct.Struct(">16L").unpack_from
+_pack_state = struct.Struct(">8L").pack
+
+
+def _compress(state, data, offset=0):
+    """
+    Função de compressão: processa o bloco de 64 bytes em data[offset:offset + 64]
+    e retorna o novo estado (tupla de 8 palavras). As rondas são desenroladas de 8
+    em 8, sem chamadas de método dentro do laço.
+    """
+    k = _K
+    w = list(_unpack_block(data, offset))
+    for i in range(16, 64):
+        x = w[i - 15]
+        y = w[i - 2]
+        s0 = (((x >> 7) | (x << 25)) ^ ((x >> 18) | (x << 14)) ^ (x >> 3)) & 0xFFFFFFFF
+        s1 = (((y >> 17) | (y << 15)) ^ ((y >> 19) | (y << 13)) ^ (y >> 10)) & 0xFFFFFFFF
+        w.append((w[i - 16] + s0 + w[i - 7] + s1) & 0xFFFFFFFF)
+
+    a, b, c, d, e, f, g, h = state
+    for i in range(0, 64, 8):
+        t1 = h + ((((e >> 6) | (e << 26)) ^ ((e >> 11) | (e << 21)) ^ ((e >> 25) | (e << 7))) & 0xFFFFFFFF) + (g ^ (e & (f ^ g))) + k[i] + w[i]
+        d = (d + t1) & 0xFFFFFFFF
+        h = (t1 + ((((a >> 2) | (a << 30)) ^ ((a >> 13) | (a << 19)) ^ ((a >> 22) | (a << 10))) & 0xFFFFFFFF) + ((a & b) | (c & (a | b)))) & 0xFFFFFFFF
+        t1 = g + ((((d >> 6) | (d << 26)) ^ ((d >> 11) | (d << 21)) ^ ((d >> 25) | (d << 7))) & 0xFFFFFFFF) + (f ^ (d & (e ^ f))) + k[i + 1] + w[i + 1]
+        c = (c + t1) & 0xFFFFFFFF
+        g = (t1 + ((((h >> 2) | (h << 30)) ^ ((h >> 13) | (h << 19)) ^ ((h >> 22) | (h << 10))) & 0xFFFFFFFF) + ((h & a) | (b & (h | a)))) & 0xFFFFFFFF
+        t1 = f + ((((c >> 6) | (c << 26)) ^ ((c >> 11) | (c << 21)) ^ ((c >> 25) | (c << 7))) & 0xFFFFFFFF) + (e ^ (c & (d ^ e))) + k[i + 2] + w[i + 2]
+        b = (b + t1) & 0xFFFFFFFF
+        f = (t1 + ((((g >> 2) | (g << 30)) ^ ((g >> 13) | (g << 19)) ^ ((g >> 22) | (g << 10))) & 0xFFFFFFFF) + ((g & h) | (a & (g | h)))) & 0xFFFFFFFF
+        t1 = e + ((((b >> 6) | (b << 26)) ^ ((b >> 11) | (b << 21)) ^ ((b >> 25) | (b << 7))) & 0xFFFFFFFF) + (d ^ (b & (c ^ d))) + k[i + 3] + w[i + 3]
+        a = (a + t1) & 0xFFFFFFFF
+        e = (t1 + ((((f >> 2) | (f << 30)) ^ ((f >> 13) | (f << 19)) ^ ((f >> 22) | (f << 10))) & 0xFFFFFFFF) + ((f & g) | (h & (f | g)))) & 0xFFFFFFFF
+        t1 = d + ((((a >> 6) | (a << 26)) ^ ((a >> 11) | (a << 21)) ^ ((a >> 25) | (a << 7))) & 0xFFFFFFFF) + (c ^ (a & (b ^ c))) + k[i + 4] + w[i + 4]
+        h = (h + t1) & 0xFFFFFFFF
+        d = (t1 + ((((e >> 2) | (e << 30)) ^ ((e >> 13) | (e << 19)) ^ ((e >> 22) | (e << 10))) & 0xFFFFFFFF) + ((e & f) | (g & (e | f)))) & 0xFFFFFFFF
+        t1 = c + ((((h >> 6) | (h << 26)) ^ ((h >> 11) | (h << 21)) ^ ((h >> 25) | (h << 7))) & 0xFFFFFFFF) + (b ^ (h & (a ^ b))) + k[i + 5] + w[i + 5]
+        g = (g + t1) & 0xFFFFFFFF
+        c = (t1 + ((((d >> 2) | (d << 30)) ^ ((d >> 13) | (d << 19)) ^ ((d >> 22) | (d << 10))) & 0xFFFFFFFF) + ((d & e) | (f & (d | e)))) & 0xFFFFFFFF
+        t1 = b + ((((g >> 6) | (g << 26)) ^ ((g >> 11) | (g << 21)) ^ ((g >> 25) | (g << 7))) & 0xFFFFFFFF) + (a ^ (g & (h ^ a))) + k[i + 6] + w[i + 6]
+        f = (f + t1) & 0xFFFFFFFF
+        b = (t1 + ((((c >> 2) | (c << 30)) ^ ((c >> 13) | (c << 19)) ^ ((c >> 22) | (c << 10))) & 0xFFFFFFFF) + ((c & d) | (e & (c | d)))) & 0xFFFFFFFF
+        t1 = a + ((((f >> 6) | (f << 26)) ^ ((f >> 11) | (f << 21)) ^ ((f >> 25) | (f << 7))) & 0xFFFFFFFF) + (h ^ (f & (g ^ h))) + k[i + 7] + w[i + 7]
+        e = (e + t1) & 0xFFFFFFFF
+        a = (t1 + ((((b >> 2) | (b << 30)) ^ ((b >> 13) | (b << 19)) ^ ((b >> 22) | (b << 10))) & 0xFFFFFFFF) + ((b & c) | (d & (b | c)))) & 0xFFFFFFFF
+
+    return (
+        (state[0] + a) & 0xFFFFFFFF, (state[1] + b) & 0xFFFFFFFF,
+        (state[2] + c) & 0xFFFFFFFF, (state[3] + d) & 0xFFFFFFFF,
+        (state[4] + e) & 0xFFFFFFFF, (state[5] + f) & 0xFFFFFFFF,
+        (state[6] + g) & 0xFFFFFFFF, (state[7] + h) & 0xFFFFFFFF,
     )
-    _h = [
-        0x6a09e667, 0xbb67ae85, 0x3c6ef372, 0xa54ff53a,
-        0x510e527f, 0x9b05688c, 0x1f83d9ab, 0x5be0cd19
-    ]
+
+
+# Padding pré-calculado para mensagens de até 55 bytes, que cabem num único bloco:
+# 0x80 || zeros || tamanho em bits (64 bits big-endian)
+_SHORT_PADDING = tuple(
+    b"\x80" + b"\x00" * (55 - length) + struct.pack(">Q", length * 8)
+    for length in range(56)
+)
+_DIGEST_PADDING = _SHORT_PADDING[32]
+
+
+def _hash256_short(data):
+    """SHA256(SHA256(data)) para len(data) <= 55: exatamente duas compressões."""
+    state = _compress(_H, data + _SHORT_PADDING[len(data)])
+    return _compress(_H, _pack_state(*state) + _DIGEST_PADDING)
+
+
+def _sha256_lanes(messages, length):
+    """
+    SHA256 de N mensagens de mesmo tamanho em paralelo (NumPy): cada palavra de
+    32 bits do estado é um vetor uint32 com uma posição por mensagem, e as 64
+    rondas rodam sobre todas as mensagens de uma vez.
+    """
+    np = _numpy()
+    count = len(messages)
+    padding = b"\x80" + b"\x00" * ((55 - length) % 64) + struct.pack(">Q", length * 8)
+    padded = b"".join(message + padding for message in messages)
+    # Leitura big-endian das palavras numa única view vetorizada: (palavras, mensagens)
+    words = np.frombuffer(padded, dtype=">u4").reshape(count, -1).astype(np.uint32).T
+
+    def rotr(x, n):
+        return (x >> np.uint32(n)) | (x << np.uint32(32 - n))
+
+    state = [np.full(count, h, dtype=np.uint32) for h in _H]
+    k = [np.uint32(c) for c in _K]
+    with np.errstate(over="ignore"):
+        for block in range(0, words.shape[0], 16):
+            w = list(words[block:block + 16])
+            for i in range(16, 64):
+                x = w[i - 15]
+                y = w[i - 2]
+                s0 = rotr(x, 7) ^ rotr(x, 18) ^ (x >> np.uint32(3))
+                s1 = rotr(y, 17) ^ rotr(y, 19) ^ (y >> np.uint32(10))
+                w.append(w[i - 16] + s0 + w[i - 7] + s1)
+            a, b, c, d, e, f, g, h = state
+            for i in range(64):
+                t1 = h + (rotr(e, 6) ^ rotr(e, 11) ^ rotr(e, 25)) + (g ^ (e & (f ^ g))) + k[i] + w[i]
+                t2 = (rotr(a, 2) ^ rotr(a, 13) ^ rotr(a, 22)) + ((a & b) | (c & (a | b)))
+                h, g, f, e, d, c, b, a = g, f, e, d + t1, c, b, a, t1 + t2
+            state = [x + y for x, y in zip(state, (a, b, c, d, e, f, g, h))]
+    digests = np.stack(state, axis=1).astype(">u4").tobytes()
+    return [digests[i:i + 32] for i in range(0, 32 * count, 32)]
+
+
+class SHA256:
+    name = "sha256"
+    digest_size = 32
+    block_size = 64
+
+    _k = _K
+    _h = _H
+
+    # Arquivos a partir deste tamanho são lidos via mmap em hash_file()
+    MMAP_THRESHOLD = 1 << 20
 
     def __init__(self, message=None):
-        self._buffer = b""
+        self._buffer = bytearray()
         self._counter = 0
-        self._digest = list(self._h)
+        self._digest = _H
         if message:
             self.update(message)
 
-    def _rotr(self, x, n):
-        return ((x >> n) | (x << (32 - n))) & 0xFFFFFFFF
-
     def _process_block(self, chunk):
-        w = list(struct.unpack("!16L", chunk)) + [0] * 48
-        for i in range(16, 64):
-            s0 = self._rotr(w[i - 15], 7) ^ self._rotr(w[i - 15], 18) ^ (w[i - 15] >> 3)
-            s1 = self._rotr(w[i - 2], 17) ^ self._rotr(w[i - 2], 19) ^ (w[i - 2] >> 10)
-            w[i] = (w[i - 16] + s0 + w[i - 7] + s1) & 0xFFFFFFFF
-
-        a, b, c, d, e, f, g, h = self._digest
-        for i in range(64):
-            s1 = self._rotr(e, 6) ^ self._rotr(e, 11) ^ self._rotr(e, 25)
-            ch = (e & f) ^ (~e & g)
-            temp1 = (h + s1 + ch + self._k[i] + w[i]) & 0xFFFFFFFF
-            s0 = self._rotr(a, 2) ^ self._rotr(a, 13) ^ self._rotr(a, 22)
-            maj = (a & b) ^ (a & c) ^ (b & c)
-            temp2 = (s0 + maj) & 0xFFFFFFFF
-
-            h = g
-            g = f
-            f = e
-            e = (d + temp1) & 0xFFFFFFFF
-            d = c
-            c = b
-            b = a
-            a = (temp1 + temp2) & 0xFFFFFFFF
-
-        self._digest = [(x + y) & 0xFFFFFFFF for x, y in zip(self._digest, [a, b, c, d, e, f, g, h])]
+        self._digest = _compress(self._digest, chunk)
 
     def update(self, message):
         if isinstance(message, str):
             message = message.encode("utf-8")
-        self._buffer += message
-        self._counter += len(message)
-        while len(self._buffer) >= 64:
-            self._process_block(self._buffer[:64])
-            self._buffer = self._buffer[64:]
+        view = memoryview(message).cast("B")
+        length = len(view)
+        self._counter += length
+        buffer = self._buffer
+        state = self._digest
+        offset = 0
+
+        # Completa o bloco parcial que ficou do update anterior
+        if buffer:
+            offset = min(64 - len(buffer), length)
+            buffer += view[:offset]
+            if len(buffer) < 64:
+                return
+            state = _compress(state, buffer)
+            del buffer[:]
+
+        # Blocos inteiros são lidos diretamente da mensagem, sem cópias
+        end = length - (length - offset) % 64
+        for position in range(offset, end, 64):
+            state = _compress(state, view, position)
+        buffer += view[end:]
+        self._digest = state
 
     def digest(self):
-        padding = b"\x80" + b"\x00" * ((55 - self._counter % 64) % 64)
-        bit_length = struct.pack("!Q", self._counter * 8)
-        self.update(padding + bit_length)
-        return b"".join(struct.pack("!L", h) for h in self._digest)
+        """Retorna o digest sem alterar o estado (update() pode continuar depois)."""
+        tail = self._buffer + b"\x80" + b"\x00" * ((55 - self._counter) % 64)
+        tail += struct.pack(">Q", (self._counter * 8) & 0xFFFFFFFFFFFFFFFF)
+        state = self._digest
+        for position in range(0, len(tail), 64):
+            state = _compress(state, tail, position)
+        return _pack_state(*state)
 
     def hexdigest(self):
         return self.digest().hex()
 
+    def copy(self):
+        """Retorna uma cópia independente do estado atual (como hashlib)."""
+        clone = SHA256.__new__(SHA256)
+        clone._buffer = bytearray(self._buffer)
+        clone._counter = self._counter
+        clone._digest = self._digest
+        return clone
+
     @staticmethod
     def sha256(data):
         """Método estático para retornar o digest diretamente."""
+        if isinstance(data, bytes) and len(data) <= 55:
+            return _pack_state(*_compress(_H, data + _SHORT_PADDING[len(data)]))
         return SHA256(data).digest()
 
+    # Abaixo deste número de mensagens do mesmo tamanho, o caminho puro Python é mais rápido
+    MIN_NUMPY_LANES = 32
+
+    @staticmethod
+    def sha256_many(messages, batch_size=4096, use_numpy=None):
+        """
+        SHA256 de uma lista de mensagens, na ordem de entrada.
+
+        Com NumPy instalado, mensagens de mesmo tamanho (ex.: chaves públicas de 33 ou
+        65 bytes) são processadas em lotes de até batch_size mensagens, todas as rondas
+        em paralelo; batch_size limita o uso de memória. Sem NumPy (ou com
+        use_numpy=False), usa SHA256.sha256 para cada mensagem.
+        """
+        messages = [bytes(m) for m in messages]
+        if use_numpy is None:
+            use_numpy = _numpy() is not None
+        elif use_numpy and _numpy() is None:
+            raise ImportError("O backend em lote do SHA256 requer NumPy.")
+        if not use_numpy:
+            return [SHA256.sha256(m) for m in messages]
+
+        results = [None] * len(messages)
+        groups = {}
+        for index, message in enumerate(messages):
+            groups.setdefault(len(message), []).append(index)
+        for length, indexes in groups.items():
+            if len(indexes) < SHA256.MIN_NUMPY_LANES:
+                for index in indexes:
+                    results[index] = SHA256.sha256(messages[index])
+                continue
+            for start in range(0, len(indexes), batch_size):
+                chunk = indexes[start:start + batch_size]
+                digests = _sha256_lanes([messages[index] for index in chunk], length)
+                for index, digest in zip(chunk, digests):
+                    results[index] = digest
+        return results
+
+    @staticmethod
+    def hash256(data):
+        """SHA256 duplo (SHA256(SHA256(data))), com caminho rápido de bloco único."""
+        data = bytes(data)
+        if len(data) <= 55:
+            return _pack_state(*_hash256_short(data))
+        return _pack_state(*_compress(_H, SHA256(data).digest() + _DIGEST_PADDING))
+
+    @staticmethod
+    def checksum4(data):
+        """Checksum Base58Check: os 4 primeiros bytes de SHA256(SHA256(data))."""
+        data = bytes(data)
+        if len(data) <= 55:
+            return _hash256_short(data)[0].to_bytes(4, "big")
+        return SHA256.hash256(data)[:4]
+
+    @staticmethod
+    def checksum4_many(payloads):
+        """Versão em lote de checksum4: retorna os checksums na ordem de entrada."""
+        padding = _SHORT_PADDING
+        digest_padding = _DIGEST_PADDING
+        results = []
+        for data in payloads:
+            data = bytes(data)
+            if len(data) <= 55:
+                state = _compress(_H, data + padding[len(data)])
+                word = _compress(_H, _pack_state(*state) + digest_padding)[0]
+                results.append(word.to_bytes(4, "big"))
+            else:
+                results.append(SHA256.hash256(data)[:4])
+        return results
+
+    @staticmethod
+    def hash_file(path, chunk_size=1 << 20):
+        """
+        Calcula o SHA256 de um arquivo com memória constante: arquivos grandes são
+        mapeados em memória (mmap), os demais lidos em blocos de chunk_size bytes.
+        """
+        hasher = SHA256()
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size >= SHA256.MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    for position in range(0, size, chunk_size):
+                        with memoryview(mm)[position:position + chunk_size] as view:
+                            hasher.update(view)
+            else:
+                for chunk in iter(lambda: f.read(chunk_size), b""):
+                    hasher.update(chunk)
+        return hasher.digest()
+
 
 # Exemplo de uso
 if __name__ == "__main__":
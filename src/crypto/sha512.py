@@ -0,0 +1,138 @@
+import struct
+
+# Constantes de ronda (64 bits iniciais das partes fracionárias das raízes cúbicas dos 80 primeiros primos)
+_K = (
+    0x428a2f98d728ae22, 0x7137449123ef65cd, 0xb5c0fbcfec4d3b2f, 0xe9b5dba58189dbbc,
+    0x3956c25bf348b538, 0x59f111f1b605d019, 0x923f82a4af194f9b, 0xab1c5ed5da6d8118,
+    0xd807aa98a3030242, 0x12835b0145706fbe, 0x243185be4ee4b28c, 0x550c7dc3d5ffb4e2,
+    0x72be5d74f27b896f, 0x80deb1fe3b1696b1, 0x9bdc06a725c71235, 0xc19bf174cf692694,
+    0xe49b69c19ef14ad2, 0xefbe4786384f25e3, 0x0fc19dc68b8cd5b5, 0x240ca1cc77ac9c65,
+    0x2de92c6f592b0275, 0x4a7484aa6ea6e483, 0x5cb0a9dcbd41fbd4, 0x76f988da831153b5,
+    0x983e5152ee66dfab, 0xa831c66d2db43210, 0xb00327c898fb213f, 0xbf597fc7beef0ee4,
+    0xc6e00bf33da88fc2, 0xd5a79147930aa725, 0x06ca6351e003826f, 0x142929670a0e6e70,
+    0x27b70a8546d22ffc, 0x2e1b21385c26c926, 0x4d2c6dfc5ac42aed, 0x53380d139d95b3df,
+    0x650a73548baf63de, 0x766a0abb3c77b2a8, 0x81c2c92e47edaee6, 0x92722c851482353b,
+    0xa2bfe8a14cf10364, 0xa81a664bbc423001, 0xc24b8b70d0f89791, 0xc76c51a30654be30,
+    0xd192e819d6ef5218, 0xd69906245565a910, 0xf40e35855771202a, 0x106aa07032bbd1b8,
+    0x19a4c116b8d2d0c8, 0x1e376c085141ab53, 0x2748774cdf8eeb99, 0x34b0bcb5e19b48a8,
+    0x391c0cb3c5c95a63, 0x4ed8aa4ae3418acb, 0x5b9cca4f7763e373, 0x682e6ff3d6b2b8a3,
+    0x748f82ee5defb2fc, 0x78a5636f43172f60, 0x84c87814a1f0ab72, 0x8cc702081a6439ec,
+    0x90befffa23631e28, 0xa4506cebde82bde9, 0xbef9a3f7b2c67915, 0xc67178f2e372532b,
+    0xca273eceea26619c, 0xd186b8c721c0c207, 0xeada7dd6cde0eb1e, 0xf57d4f7fee6ed178,
+    0x06f067aa72176fba, 0x0a637dc5a2c898a6, 0x113f9804bef90dae, 0x1b710b35131c471b,
+    0x28db77f523047d84, 0x32caab7b40c72493, 0x3c9ebe0a15c9bebc, 0x431d67c49c100d4c,
+    0x4cc5d4becb3e42b6, 0x597f299cfc657e2a, 0x5fcb6fab3ad6faec, 0x6c44198c4a475817,
+)
+
+# Valor inicial do estado
+_H = (
+    0x6a09e667f3bcc908, 0xbb67ae8584caa73b, 0x3c6ef372fe94f82b, 0xa54ff53a5f1d36f1,
+    0x510e527fade682d1, 0x9b05688c2b3e6c1f, 0x1f83d9abfb41bd6b, 0x5be0cd19137e2179,
+)
+
+_MASK = 0xFFFFFFFFFFFFFFFF
+
+_unpack_block = struct.Struct(">16Q").unpack_from
+_pack_state = struct.Struct(">8Q").pack
+
+
+def _compress(state, data, offset=0):
+    """
+    Função de compressão: processa o bloco de 128 bytes em data[offset:offset + 128]
+    e retorna o novo estado (tupla de 8 palavras de 64 bits).
+    """
+    mask = _MASK
+    w = list(_unpack_block(data, offset))
+    for i in range(16, 80):
+        x = w[i - 15]
+        y = w[i - 2]
+        s0 = (((x >> 1) | (x << 63)) ^ ((x >> 8) | (x << 56)) ^ (x >> 7)) & mask
+        s1 = (((y >> 19) | (y << 45)) ^ ((y >> 61) | (y << 3)) ^ (y >> 6)) & mask
+        w.append((w[i - 16] + s0 + w[i - 7] + s1) & mask)
+
+    a, b, c, d, e, f, g, h = state
+    for k, wi in zip(_K, w):
+        t1 = h + ((((e >> 14) | (e << 50)) ^ ((e >> 18) | (e << 46)) ^ ((e >> 41) | (e << 23))) & mask) \
+            + (g ^ (e & (f ^ g))) + k + wi
+        t2 = ((((a >> 28) | (a << 36)) ^ ((a >> 34) | (a << 30)) ^ ((a >> 39) | (a << 25))) & mask) \
+            + ((a & b) | (c & (a | b)))
+        h, g, f, e, d, c, b, a = g, f, e, (d + t1) & mask, c, b, a, (t1 + t2) & mask
+
+    return (
+        (state[0] + a) & mask, (state[1] + b) & mask,
+        (state[2] + c) & mask, (state[3] + d) & mask,
+        (state[4] + e) & mask, (state[5] + f) & mask,
+        (state[6] + g) & mask, (state[7] + h) & mask,
+    )
+
+
+class SHA512:
+    name = "sha512"
+    digest_size = 64
+    block_size = 128
+
+    def __init__(self, message=None):
+        self._buffer = bytearray()
+        self._counter = 0
+        self._digest = _H
+        if message:
+            self.update(message)
+
+    def update(self, message):
+        if isinstance(message, str):
+            message = message.encode("utf-8")
+        view = memoryview(message).cast("B")
+        length = len(view)
+        self._counter += length
+        buffer = self._buffer
+        state = self._digest
+        offset = 0
+
+        # Completa o bloco parcial que ficou do update anterior
+        if buffer:
+            offset = min(128 - len(buffer), length)
+            buffer += view[:offset]
+            if len(buffer) < 128:
+                return
+            state = _compress(state, buffer)
+            del buffer[:]
+
+        # Blocos inteiros são lidos diretamente da mensagem, sem cópias
+        end = length - (length - offset) % 128
+        for position in range(offset, end, 128):
+            state = _compress(state, view, position)
+        buffer += view[end:]
+        self._digest = state
+
+    def digest(self):
+        """Retorna o digest sem alterar o estado (update() pode continuar depois)."""
+        tail = self._buffer + b"\x80" + b"\x00" * ((111 - self._counter) % 128)
+        tail += (self._counter * 8).to_bytes(16, "big")
+        state = self._digest
+        for position in range(0, len(tail), 128):
+            state = _compress(state, tail, position)
+        return _pack_state(*state)
+
+    def hexdigest(self):
+        return self.digest().hex()
+
+    def copy(self):
+        """Retorna uma cópia independente do estado atual (como hashlib)."""
+        clone = SHA512.__new__(SHA512)
+        clone._buffer = bytearray(self._buffer)
+        clone._counter = self._counter
+        clone._digest = self._digest
+        return clone
+
+    @staticmethod
+    def sha512(data):
+        """Método estático para retornar o digest diretamente."""
+        return SHA512(data).digest()
+
+
+if __name__ == "__main__":
+    message = b"hello world"
+
+    digest = SHA512.sha512(message)
+    print(digest.hex())
+    print(f"Valid? {digest.hex() == '309ecc489c12d6eb4cc40f50c902f2b4d0ed77ee511a7c7a9bcd3ca86d4cd86f989dd35bc5ff499670da34255b45b0cfd830e81f605dcf7dc5542e93ae9cd76f'}")
@@ -0,0 +1,146 @@
+from crypto.hmac import HMAC
+from crypto.sha256 import SHA256
+
+
+class ECDSA:
+    """
+    Assinatura e verificação ECDSA sobre uma EllipticCurveCryptography.
+
+    Os nonces são determinísticos (RFC 6979, HMAC-SHA256) e a verificação calcula
+    u1·G + u2·Q numa única passada de duplicações (Strauss/Shamir) em vez de duas
+    multiplicações escalares separadas.
+    """
+
+    # Janela wNAF maior para G: a tabela é calculada uma vez e fica no cache
+    GENERATOR_WNAF_WIDTH = 8
+
+    def __init__(self, ecc, hash_class=SHA256):
+        self.ecc = ecc
+        self.hash_class = hash_class
+        self.n_order = ecc.n_order
+        self._order_bytes = (self.n_order.bit_length() + 7) // 8
+
+    def _bits2int(self, data):
+        value = int.from_bytes(data, "big")
+        excess = len(data) * 8 - self.n_order.bit_length()
+        return value >> excess if excess > 0 else value
+
+    def deterministic_nonces(self, private_key, message_hash):
+        """Gera os candidatos a nonce k da RFC 6979, seção 3.2."""
+        n = self.n_order
+        size = self._order_bytes
+        hmac = lambda key, data: HMAC.hmac(key, data, self.hash_class)
+        x = private_key.to_bytes(size, "big")
+        h1 = (self._bits2int(message_hash) % n).to_bytes(size, "big")
+        V = b"\x01" * self.hash_class.digest_size
+        K = b"\x00" * self.hash_class.digest_size
+        K = hmac(K, V + b"\x00" + x + h1)
+        V = hmac(K, V)
+        K = hmac(K, V + b"\x01" + x + h1)
+        V = hmac(K, V)
+        while True:
+            T = b""
+            while len(T) < size:
+                V = hmac(K, V)
+                T += V
+            k = self._bits2int(T)
+            if 1 <= k < n:
+                yield k
+            K = hmac(K, V + b"\x00")
+            V = hmac(K, V)
+
+    def sign(self, private_key, message_hash, low_s=True):
+        """
+        Assina o hash da mensagem e retorna (r, s). Com low_s=True, s é normalizado
+        para a metade inferior da ordem (regra de padronização do Bitcoin).
+        """
+        n = self.n_order
+        if not self.ecc.is_valid_private_key(private_key):
+            raise ValueError("Chave privada inválida.")
+        z = self._bits2int(message_hash) % n
+        for k in self.deterministic_nonces(private_key, message_hash):
+            r = self.ecc.eccnP(k)[0] % n
+            if r == 0:
+                continue
+            s = self.ecc.inverse(k, n) * (z + r * private_key) % n
+            if s == 0:
+                continue
+            if low_s and s > n >> 1:
+                s = n - s
+            return r, s
+
+    def _verify_terms(self, public_key, z, r, s_inv, w):
+        ecc = self.ecc
+        n = self.n_order
+        u1 = z * s_inv % n
+        u2 = r * s_inv % n
+        terms = ecc._scalar_terms(ecc.Gx, ecc.Gy, u1, self.GENERATOR_WNAF_WIDTH) if u1 else []
+        if u2:
+            terms += ecc._scalar_terms(*public_key, u2, w)
+        return terms
+
+    def _check_r(self, X, Z, r):
+        """Compara x(R) com r sem converter R para afim: X ≡ r·Z² (mod p)."""
+        if Z == 0:
+            return False
+        p = self.ecc.p
+        ZZ = Z * Z % p
+        candidate = r
+        while candidate < p:
+            if X == candidate * ZZ % p:
+                return True
+            candidate += self.n_order
+        return False
+
+    def _valid_inputs(self, public_key, signature):
+        r, s = signature
+        n = self.n_order
+        if not (1 <= r < n and 1 <= s < n):
+            return False
+        if public_key == self.ecc.pointNULL:
+            return False
+        return self.ecc.in_curve(*public_key)
+
+    def verify(self, public_key, message_hash, signature, w=None):
+        """Verifica a assinatura (r, s) do hash com a chave pública (x, y)."""
+        if not self._valid_inputs(public_key, signature):
+            return False
+        r, s = signature
+        z = self._bits2int(message_hash) % self.n_order
+        s_inv = self.ecc.inverse(s, self.n_order)
+        X, _, Z = self.ecc._interleaved_wnaf(self._verify_terms(public_key, z, r, s_inv, w))
+        return self._check_r(X, Z, r)
+
+    def verify_batch(self, items, w=None):
+        """
+        Verifica uma lista de (chave pública, hash, (r, s)) e retorna uma lista de bool
+        na mesma ordem. Os inversos de s são calculados juntos (truque de Montgomery)
+        e as tabelas de G e das chaves repetidas são reaproveitadas pelo cache.
+        """
+        items = list(items)
+        results = [False] * len(items)
+        valid = [i for i, (public_key, _, signature) in enumerate(items) if self._valid_inputs(public_key, signature)]
+        s_invs = self.ecc.batch_inverse([items[i][2][1] for i in valid], self.n_order)
+        for i, s_inv in zip(valid, s_invs):
+            public_key, message_hash, (r, _) = items[i]
+            z = self._bits2int(message_hash) % self.n_order
+            X, _, Z = self.ecc._interleaved_wnaf(self._verify_terms(public_key, z, r, s_inv, w))
+            results[i] = self._check_r(X, Z, r)
+        return results
+
+
+if __name__ == "__main__":
+    from bitcoin.secp256k1 import Secp256k1
+
+    secp256k1 = Secp256k1()
+    ecdsa = secp256k1.ecdsa
+
+    private_key = 1
+    public_key = secp256k1.ecc.eccnP(private_key)
+    message_hash = SHA256.sha256(b"Satoshi Nakamoto")
+
+    r, s = ecdsa.sign(private_key, message_hash)
+
+    print(f"r: {r:064x}")
+    print(f"s: {s:064x}")
+    print(f"Valid? {ecdsa.verify(public_key, message_hash, (r, s))}")
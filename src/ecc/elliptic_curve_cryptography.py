@@ -1,4 +1,11 @@
+from collections import OrderedDict
+
+
 class EllipticCurveCryptography:
+    # Largura padrão da janela wNAF e tamanho do cache de pré-cálculo por ponto
+    WNAF_WIDTH = 5
+    PRECOMPUTATION_CACHE_SIZE = 128
+
     def __init__(self, p, n_order, Gx, Gy, A, B):
         self.p = p
         self.n_order = n_order
@@ -7,11 +14,23 @@ class EllipticCurveCryptography:
         self.A = A
         self.B = B
         self.pointNULL = (0, 0)
+        self.jacobianNULL = (1, 1, 0)
+        # Tabela opcional de múltiplos pré-calculados de G (ver FixedBaseTable)
+        self.generator_table = None
+        # Endomorfismo GLV opcional (ver GLVEndomorphism), usado por multiply()
+        self.endomorphism = None
+        # Backend opcional de aritmética em F_p (ver ecc.field): inversão e raiz quadrada rápidas
+        self.field = None
+        # Cache LRU: (x, y, w) -> múltiplos ímpares [P, 3P, 5P, ...] em coordenadas afins
+        self._precomputation_cache = OrderedDict()
 
     def modp(self, n, p1):
         return n % p1
 
     def inverse(self, r, p):
+        field = self.field
+        if field is not None and p == field.p:
+            return field.inverse(r)
         t, newt = 1, 0
         r, newr = r, p
         while newr != 0:
@@ -21,31 +40,362 @@ class EllipticCurveCryptography:
         return t % p
 
     def doublep(self, x, y):
+        if y == 0:
+            # Tangente vertical (ou ponto no infinito): 2P = O
+            return self.pointNULL
         m = self.modp((3 * x**2 + self.A) * self.inverse(2 * y, self.p), self.p)
         x_r = self.modp(m**2 - 2 * x, self.p)
         y_r = self.modp(m * (x - x_r) - y, self.p)
         return x_r, y_r
 
     def addp(self, x1, y1, x2, y2):
-        if x1 == x2 and y1 == y2:
+        # O ponto no infinito é o elemento neutro da soma
+        if (x1, y1) == self.pointNULL:
+            return x2, y2
+        if (x2, y2) == self.pointNULL:
+            return x1, y1
+        if x1 == x2:
+            # P + P = 2P, P + (-P) = O
+            if (y1 + y2) % self.p == 0:
+                return self.pointNULL
             return self.doublep(x1, y1)
         m = self.modp((y2 - y1) * self.inverse(x2 - x1, self.p), self.p)
         x_r = self.modp(m**2 - x1 - x2, self.p)
         y_r = self.modp(m * (x1 - x_r) - y1, self.p)
         return x_r, y_r
 
+    # Coordenadas Jacobianas: (X, Y, Z) representa o ponto afim (X/Z², Y/Z³).
+    # Soma e duplicação não precisam de inversões; só a conversão final para
+    # coordenadas afins paga um único inverse().
+
+    def to_jacobian(self, x, y):
+        if (x, y) == self.pointNULL:
+            return self.jacobianNULL
+        return x, y, 1
+
+    def to_affine(self, X, Y, Z):
+        if Z == 0:
+            return self.pointNULL
+        p = self.p
+        z_inv = self.inverse(Z, p)
+        z_inv2 = z_inv * z_inv % p
+        return X * z_inv2 % p, Y * z_inv2 * z_inv % p
+
+    def batch_inverse(self, values, p=None):
+        """
+        Inverte vários valores mod p com um único inverse() (truque de Montgomery):
+        1 inversão + 3(n-1) multiplicações. Valores nulos (mod p) retornam 0.
+        """
+        p = p or self.p
+        prefix = []
+        acc = 1
+        for v in values:
+            prefix.append(acc)
+            v %= p
+            if v:
+                acc = acc * v % p
+        inv = self.inverse(acc, p)
+        result = [0] * len(prefix)
+        for i in range(len(prefix) - 1, -1, -1):
+            v = values[i] % p
+            if v:
+                result[i] = inv * prefix[i] % p
+                inv = inv * v % p
+        return result
+
+    def batch_to_affine(self, points):
+        """Converte uma lista de pontos Jacobianos para afins com uma única inversão."""
+        p = self.p
+        z_invs = self.batch_inverse([Z for _, _, Z in points])
+        result = []
+        for (X, Y, Z), z_inv in zip(points, z_invs):
+            if Z % p == 0:
+                result.append(self.pointNULL)
+                continue
+            z_inv2 = z_inv * z_inv % p
+            result.append((X * z_inv2 % p, Y * z_inv2 * z_inv % p))
+        return result
+
+    def jacobian_double(self, X, Y, Z):
+        if Z == 0 or Y == 0:
+            return self.jacobianNULL
+        p = self.p
+        YY = Y * Y % p
+        S = 4 * X * YY % p
+        M = 3 * X * X
+        if self.A:
+            ZZ = Z * Z % p
+            M += self.A * ZZ * ZZ
+        M %= p
+        X3 = (M * M - 2 * S) % p
+        Y3 = (M * (S - X3) - 8 * YY * YY) % p
+        Z3 = 2 * Y * Z % p
+        return X3, Y3, Z3
+
+    def jacobian_add_mixed(self, X1, Y1, Z1, x2, y2):
+        """Soma mista: (X1, Y1, Z1) em Jacobianas + (x2, y2) em afins."""
+        if (x2, y2) == self.pointNULL:
+            return X1, Y1, Z1
+        if Z1 == 0:
+            return x2, y2, 1
+        p = self.p
+        ZZ = Z1 * Z1 % p
+        H = (x2 * ZZ - X1) % p
+        r = (y2 * ZZ * Z1 - Y1) % p
+        if H == 0:
+            if r == 0:
+                return self.jacobian_double(X1, Y1, Z1)
+            return self.jacobianNULL
+        HH = H * H % p
+        HHH = H * HH % p
+        V = X1 * HH % p
+        X3 = (r * r - HHH - 2 * V) % p
+        Y3 = (r * (V - X3) - Y1 * HHH) % p
+        Z3 = Z1 * H % p
+        return X3, Y3, Z3
+
+    def jacobian_add(self, X1, Y1, Z1, X2, Y2, Z2):
+        if Z1 == 0:
+            return X2, Y2, Z2
+        if Z2 == 0:
+            return X1, Y1, Z1
+        p = self.p
+        Z1Z1 = Z1 * Z1 % p
+        Z2Z2 = Z2 * Z2 % p
+        U1 = X1 * Z2Z2 % p
+        U2 = X2 * Z1Z1 % p
+        S1 = Y1 * Z2 * Z2Z2 % p
+        S2 = Y2 * Z1 * Z1Z1 % p
+        H = (U2 - U1) % p
+        r = (S2 - S1) % p
+        if H == 0:
+            if r == 0:
+                return self.jacobian_double(X1, Y1, Z1)
+            return self.jacobianNULL
+        HH = H * H % p
+        HHH = H * HH % p
+        V = U1 * HH % p
+        X3 = (r * r - HHH - 2 * V) % p
+        Y3 = (r * (V - X3) - S1 * HHH) % p
+        Z3 = Z1 * Z2 * H % p
+        return X3, Y3, Z3
+
+    def eccnP_jacobian(self, n):
+        """Calcula n*G em coordenadas Jacobianas (double-and-add da esquerda para a direita)."""
+        if n == 0:
+            return self.jacobianNULL
+        table = self.generator_table
+        if table is not None and 0 < n and n.bit_length() <= table.bits:
+            return table.multiply_jacobian(n)
+        gx, gy = self.Gx, self.Gy
+        if n < 0:
+            n, gy = -n, -gy % self.p
+        X, Y, Z = gx, gy, 1
+        for bit in bin(n)[3:]:
+            X, Y, Z = self.jacobian_double(X, Y, Z)
+            if bit == "1":
+                X, Y, Z = self.jacobian_add_mixed(X, Y, Z, gx, gy)
+        return X, Y, Z
+
     def eccnP(self, n):
-        qx, qy = self.Gx, self.Gy
-        resx, resy = self.pointNULL
-        while n:
-            if n & 1:
-                resx, resy = self.addp(resx, resy, qx, qy) if resx != 0 else (qx, qy)
-            qx, qy = self.doublep(qx, qy)
-            n >>= 1
-        return resx, resy
+        return self.to_affine(*self.eccnP_jacobian(n))
+
+    def eccnP_batch(self, keys):
+        """
+        Calcula k*G para uma lista de chaves, retornando os pontos afins na mesma ordem.
+
+        Com a tabela de base fixa, todas as chaves avançam juntas, janela por janela,
+        com somas afins cujas inversões são compartilhadas pelo lote (Montgomery):
+        uma única inversão por janela para o lote inteiro.
+        """
+        table = self.generator_table
+        if table is None:
+            return self.batch_to_affine([self.eccnP_jacobian(k) for k in keys])
+        if not table.is_loaded:
+            table.build()
+
+        p = self.p
+        results = [self.pointNULL] * len(keys)
+        lanes = []
+        for idx, k in enumerate(keys):
+            if 0 < k and k.bit_length() <= table.bits:
+                lanes.append(idx)
+            else:
+                results[idx] = self.eccnP(k)
+
+        acc_x = [None] * len(keys)
+        acc_y = [None] * len(keys)
+        w = table.window
+        mask = (1 << w) - 1
+        for i in range(table.windows):
+            shift = w * i
+            pending = []
+            denominators = []
+            for idx in lanes:
+                d = (keys[idx] >> shift) & mask
+                if not d:
+                    continue
+                x2, y2 = table.point(i, d)
+                x1 = acc_x[idx]
+                if x1 is None:
+                    acc_x[idx], acc_y[idx] = x2, y2
+                elif x1 == x2:
+                    # P + P ou P + (-P): caso raro, resolvido fora do lote
+                    x3, y3 = self.addp(x1, acc_y[idx], x2, y2)
+                    if (x3, y3) == self.pointNULL:
+                        acc_x[idx], acc_y[idx] = None, None
+                    else:
+                        acc_x[idx], acc_y[idx] = x3, y3
+                else:
+                    pending.append((idx, x2, y2))
+                    denominators.append(x2 - x1)
+            for (idx, x2, y2), inv in zip(pending, self.batch_inverse(denominators)):
+                x1, y1 = acc_x[idx], acc_y[idx]
+                m = (y2 - y1) * inv % p
+                x3 = (m * m - x1 - x2) % p
+                acc_y[idx] = (m * (x1 - x3) - y1) % p
+                acc_x[idx] = x3
+
+        for idx in lanes:
+            if acc_x[idx] is not None:
+                results[idx] = (acc_x[idx], acc_y[idx])
+        return results
+
+    def wnaf(self, k, w):
+        """Recodificação NAF de largura w (dígitos ímpares |d| < 2^(w-1), do menos significativo)."""
+        digits = []
+        modulus = 1 << w
+        half = modulus >> 1
+        while k:
+            if k & 1:
+                d = k & (modulus - 1)
+                if d >= half:
+                    d -= modulus
+                k -= d
+            else:
+                d = 0
+            digits.append(d)
+            k >>= 1
+        return digits
+
+    def precompute(self, x, y, w=None):
+        """
+        Retorna os múltiplos ímpares [P, 3P, ..., (2^(w-1) - 1)P] em coordenadas afins,
+        guardados num cache LRU para pontos multiplicados repetidamente.
+        """
+        w = w or self.WNAF_WIDTH
+        key = (x, y, w)
+        cache = self._precomputation_cache
+        table = cache.get(key)
+        if table is not None:
+            cache.move_to_end(key)
+            return table
+        count = 1 << (w - 2)
+        twice = self.doublep(x, y)
+        points = [(x, y, 1)]
+        for _ in range(count - 1):
+            points.append(self.jacobian_add_mixed(*points[-1], *twice))
+        table = self.batch_to_affine(points)
+        cache[key] = table
+        if len(cache) > self.PRECOMPUTATION_CACHE_SIZE:
+            cache.popitem(last=False)
+        return table
+
+    def _interleaved_wnaf(self, terms):
+        """
+        Soma de k_i * P_i (Strauss/Shamir): uma única sequência de duplicações
+        compartilhada por todos os termos (tabela de múltiplos ímpares, dígitos wNAF).
+        """
+        p = self.p
+        X, Y, Z = self.jacobianNULL
+        length = max((len(digits) for _, digits in terms), default=0)
+        for i in range(length - 1, -1, -1):
+            X, Y, Z = self.jacobian_double(X, Y, Z)
+            for table, digits in terms:
+                if i < len(digits):
+                    d = digits[i]
+                    if d > 0:
+                        X, Y, Z = self.jacobian_add_mixed(X, Y, Z, *table[d >> 1])
+                    elif d < 0:
+                        tx, ty = table[(-d) >> 1]
+                        X, Y, Z = self.jacobian_add_mixed(X, Y, Z, tx, p - ty)
+        return X, Y, Z
+
+    def _scalar_terms(self, x, y, k, w):
+        """Termos (tabela, dígitos) de k*P, divididos em dois via GLV quando disponível."""
+        p = self.p
+        w = w or self.WNAF_WIDTH
+        table = self.precompute(x, y, w)
+        if self.endomorphism is None:
+            if k < 0:
+                k = -k
+                table = [(tx, p - ty) for tx, ty in table]
+            return [(table, self.wnaf(k, w))]
+        glv = self.endomorphism
+        k1, k2 = glv.split(k)
+        # φ(jP) = (β·x_j, y_j): a tabela de φ(P) sai da tabela de P sem somas de pontos
+        table2 = [glv.apply(tx, ty) for tx, ty in table]
+        if k1 < 0:
+            k1 = -k1
+            table = [(tx, p - ty) for tx, ty in table]
+        if k2 < 0:
+            k2 = -k2
+            table2 = [(tx, p - ty) for tx, ty in table2]
+        return [(table, self.wnaf(k1, w)), (table2, self.wnaf(k2, w))]
+
+    def multiply_jacobian(self, point, k, w=None):
+        x, y = point
+        if (x, y) == self.pointNULL or k == 0:
+            return self.jacobianNULL
+        return self._interleaved_wnaf(self._scalar_terms(x, y, k, w))
+
+    def multiply(self, point, k, w=None):
+        """Calcula k*Q para um ponto afim Q qualquer (wNAF, e GLV quando configurado)."""
+        return self.to_affine(*self.multiply_jacobian(point, k, w))
 
     def in_curve(self, x, y):
         return (y * y) % self.p == (x**3 + self.A * x + self.B) % self.p
+
+    def sqrt_mod(self, a):
+        """Raiz quadrada de a mod p, ou None se a não for resíduo quadrático."""
+        if self.field is not None:
+            return self.field.sqrt(a)
+        p = self.p
+        a %= p
+        if a == 0:
+            return 0
+        if p % 4 == 3:
+            # Atalho para p ≡ 3 (mod 4): a^((p+1)/4)
+            y = pow(a, (p + 1) >> 2, p)
+            return y if y * y % p == a else None
+        if pow(a, (p - 1) >> 1, p) != 1:
+            return None
+        # Tonelli-Shanks
+        q, s = p - 1, 0
+        while q % 2 == 0:
+            q, s = q >> 1, s + 1
+        z = 2
+        while pow(z, (p - 1) >> 1, p) != p - 1:
+            z += 1
+        m, c, t, r = s, pow(z, q, p), pow(a, q, p), pow(a, (q + 1) >> 1, p)
+        while t != 1:
+            i, t2 = 0, t
+            while t2 != 1:
+                t2, i = t2 * t2 % p, i + 1
+            b = pow(c, 1 << (m - i - 1), p)
+            m, c, t, r = i, b * b % p, t * b * b % p, r * b % p
+        return r
+
+    def decompress(self, x, odd):
+        """Recupera (x, y) a partir de x e da paridade de y."""
+        if not 0 <= x < self.p:
+            raise ValueError("Coordenada x fora do corpo.")
+        y = self.sqrt_mod(x * x * x + self.A * x + self.B)
+        if y is None:
+            raise ValueError("Não existe ponto da curva com essa coordenada x.")
+        if (y & 1) != bool(odd):
+            y = self.p - y
+        return x, y
     
     def is_valid_private_key(self, k):
         return 1 <= k < self.n_order
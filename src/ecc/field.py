@@ -0,0 +1,164 @@
+import os
+import random
+import warnings
+
+try:
+    import gmpy2
+except ImportError:  # gmpy2 é opcional: só acelera inversão e raiz quadrada
+    gmpy2 = None
+
+# Primo do corpo da secp256k1: p = 2^256 - 2^32 - 977
+SECP256K1_P = 2 ** 256 - 2 ** 32 - 977
+
+# Variável de ambiente que força um backend ("python" ou "gmpy2")
+BACKEND_ENV = "PURECRYPTOTOOLS_FIELD"
+
+
+class PrimeField:
+    """
+    Aritmética no corpo F_p em puro Python.
+
+    A inversão usa pow(x, -1, p), feito em C pelo CPython (bem mais rápido que o
+    algoritmo de Euclides estendido interpretado), e a raiz quadrada usa o atalho
+    a^((p+1)/4) quando p ≡ 3 (mod 4), com o expoente pré-calculado.
+    """
+
+    name = "python"
+
+    def __init__(self, p):
+        self.p = p
+        self._sqrt_exponent = (p + 1) >> 2 if p % 4 == 3 else None
+
+    def inverse(self, x):
+        """Inverso de x mod p; 0 não tem inverso e retorna 0 (como o caminho genérico)."""
+        try:
+            return pow(x, -1, self.p)
+        except ValueError:
+            return 0
+
+    def sqrt(self, a):
+        """Raiz quadrada de a mod p, ou None se a não for resíduo quadrático."""
+        p = self.p
+        a %= p
+        if a == 0:
+            return 0
+        if self._sqrt_exponent is None:
+            return _tonelli_shanks(a, p)
+        y = pow(a, self._sqrt_exponent, p)
+        return y if y * y % p == a else None
+
+
+class Gmpy2Field(PrimeField):
+    """Inversão e exponenciação modular pelo GMP (requer gmpy2); resultados em int."""
+
+    name = "gmpy2"
+
+    def __init__(self, p):
+        if gmpy2 is None:
+            raise ImportError("O backend gmpy2 requer o pacote gmpy2.")
+        super().__init__(p)
+        self._p = gmpy2.mpz(p)
+
+    def inverse(self, x):
+        try:
+            return int(gmpy2.invert(x, self._p))
+        except ZeroDivisionError:
+            return 0
+
+    def sqrt(self, a):
+        p = self.p
+        a %= p
+        if a == 0:
+            return 0
+        if self._sqrt_exponent is None:
+            return _tonelli_shanks(a, p)
+        y = int(gmpy2.powmod(a, self._sqrt_exponent, self._p))
+        return y if y * y % p == a else None
+
+
+def _tonelli_shanks(a, p):
+    """Raiz quadrada genérica mod p (p ímpar), ou None se a não for resíduo quadrático."""
+    if pow(a, (p - 1) >> 1, p) != 1:
+        return None
+    q, s = p - 1, 0
+    while q % 2 == 0:
+        q, s = q >> 1, s + 1
+    z = 2
+    while pow(z, (p - 1) >> 1, p) != p - 1:
+        z += 1
+    m, c, t, r = s, pow(z, q, p), pow(a, q, p), pow(a, (q + 1) >> 1, p)
+    while t != 1:
+        i, t2 = 0, t
+        while t2 != 1:
+            t2, i = t2 * t2 % p, i + 1
+        b = pow(c, 1 << (m - i - 1), p)
+        m, c, t, r = i, b * b % p, t * b * b % p, r * b % p
+    return r
+
+
+def _reference_inverse(r, p):
+    """Euclides estendido, exatamente como EllipticCurveCryptography.inverse."""
+    t, newt = 1, 0
+    r, newr = r, p
+    while newr != 0:
+        quotient = r // newr
+        t, newt = newt, t - quotient * newt
+        r, newr = newr, r - quotient * newr
+    return t % p
+
+
+def self_test(field, rounds=4):
+    """Confere o backend contra o caminho genérico (Euclides e quadrado da raiz)."""
+    p = field.p
+    rng = random.Random(p)
+    values = [0, 1, 2, p - 1, p, p + 1, 2 ** 256 - 1, (p - 1) ** 2, 2 ** 512 - 1]
+    values += [rng.randrange(p * p) for _ in range(rounds)]
+    for x in values:
+        a = x % p
+        if field.inverse(a) != _reference_inverse(a, p):
+            return False
+        root = field.sqrt(a)
+        if root is None:
+            if a and pow(a, (p - 1) >> 1, p) == 1:
+                return False
+        elif root * root % p != a:
+            return False
+    return True
+
+
+def available_backends(p):
+    """Backends instanciáveis para o primo p, do mais genérico ao mais específico."""
+    backends = [PrimeField(p)]
+    if gmpy2 is not None:
+        backends.append(Gmpy2Field(p))
+    return backends
+
+
+def select_backend(p, backend=None):
+    """
+    Backend de F_p para p: gmpy2 se estiver instalado, senão o de puro Python. A
+    escolha é fixa (não depende de medições); um nome em `backend` (ou na variável
+    de ambiente PURECRYPTOTOOLS_FIELD) força outro. Um nome desconhecido, um backend
+    indisponível ou reprovado no self_test() volta ao padrão com um aviso.
+    """
+    backends = {field.name: field for field in available_backends(p)}
+    default = backends.get("gmpy2") or backends["python"]
+    backend = backend or os.environ.get(BACKEND_ENV)
+    field = backends.get(backend, default) if backend else default
+    if backend and field is default and backend != default.name:
+        warnings.warn(f"Backend de corpo indisponível: {backend!r}; usando {default.name!r}.", RuntimeWarning)
+    # O backend Python é a própria referência; os demais são conferidos uma vez
+    if field.name != "python" and not self_test(field):
+        warnings.warn(f"Backend de corpo {field.name!r} reprovado no self-test; usando 'python'.", RuntimeWarning)
+        field = backends["python"]
+    return field
+
+
+# Backend da secp256k1, escolhido uma vez na importação
+SECP256K1_FIELD = select_backend(SECP256K1_P)
+
+
+if __name__ == "__main__":
+    for field in available_backends(SECP256K1_P):
+        print(f"{field.name:<10} self-test: {self_test(field)}")
+    print(f"Selecionado: {SECP256K1_FIELD.name} (medições: benchmark/benchmark.py run --filter field)")
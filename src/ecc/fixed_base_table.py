@@ -0,0 +1,141 @@
+import mmap
+import struct
+
+
+class FixedBaseTable:
+    """
+    Tabela de múltiplos pré-calculados de um ponto base fixo (método de janelas).
+
+    Para uma janela de w bits, a linha i guarda d * 2^(w*i) * P para d = 1 .. 2^w - 1,
+    em coordenadas afins. Assim n*P vira a soma de um ponto por janela de n:
+    ~64 somas mistas para w=4 (ou ~32 para w=8) e nenhuma duplicação.
+
+    A tabela é construída sob demanda na primeira multiplicação e pode ser salva
+    num arquivo binário compacto e mapeada em memória (mmap) por outros processos.
+    """
+
+    MAGIC = b"FBT1"
+    # magic, janela, número de janelas, bytes por coordenada
+    HEADER = struct.Struct(">4sHHH")
+
+    def __init__(self, ecc, x, y, window=4):
+        if not 1 <= window <= 16:
+            raise ValueError("A janela deve ter entre 1 e 16 bits.")
+        self.ecc = ecc
+        self.x = x
+        self.y = y
+        self.window = window
+        self.windows = -(-ecc.n_order.bit_length() // window)
+        self.bits = self.windows * window
+        self.coordinate_size = (ecc.p.bit_length() + 7) // 8
+        self._rows = None
+        self._mmap = None
+
+    @property
+    def is_loaded(self):
+        return self._rows is not None or self._mmap is not None
+
+    def build(self):
+        """
+        Calcula todas as linhas da tabela (uma vez por processo). Se a tabela já está
+        construída ou mapeada de um arquivo, não faz nada (close() descarta a atual).
+        """
+        if self.is_loaded:
+            return self
+        ecc = self.ecc
+        count = (1 << self.window) - 1
+        rows = []
+        bx, by = self.x, self.y
+        for _ in range(self.windows):
+            row = [(bx, by, 1)]
+            for _ in range(count - 1):
+                row.append(ecc.jacobian_add_mixed(*row[-1], bx, by))
+            # Uma única inversão por linha
+            row = ecc.batch_to_affine(row)
+            rows.append(row)
+            # Próxima base: (2^w - 1) * B + B = 2^w * B
+            bx, by = ecc.addp(*row[-1], bx, by)
+        self._rows = rows
+        return self
+
+    def point(self, i, d):
+        """Retorna d * 2^(w*i) * P em coordenadas afins (1 <= d < 2^w)."""
+        if self._rows is not None:
+            return self._rows[i][d - 1]
+        size = self.coordinate_size
+        offset = self.HEADER.size + ((i * ((1 << self.window) - 1)) + d - 1) * 2 * size
+        mm = self._mmap
+        return (
+            int.from_bytes(mm[offset:offset + size], "big"),
+            int.from_bytes(mm[offset + size:offset + 2 * size], "big"),
+        )
+
+    def digits(self, n):
+        """Decompõe n nos dígitos de w bits de cada janela (do menos significativo)."""
+        mask = (1 << self.window) - 1
+        w = self.window
+        return [(n >> (w * i)) & mask for i in range(self.windows)]
+
+    def multiply_jacobian(self, n):
+        """Calcula n*P em coordenadas Jacobianas, 0 <= n < 2^bits."""
+        if not self.is_loaded:
+            self.build()
+        ecc = self.ecc
+        X, Y, Z = ecc.jacobianNULL
+        for i, d in enumerate(self.digits(n)):
+            if d:
+                X, Y, Z = ecc.jacobian_add_mixed(X, Y, Z, *self.point(i, d))
+        return X, Y, Z
+
+    def multiply(self, n):
+        return self.ecc.to_affine(*self.multiply_jacobian(n))
+
+    def save(self, path):
+        """Grava a tabela num arquivo binário: cabeçalho + (x || y) big-endian por ponto."""
+        if not self.is_loaded:
+            self.build()
+        size = self.coordinate_size
+        count = (1 << self.window) - 1
+        with open(path, "wb") as f:
+            f.write(self.HEADER.pack(self.MAGIC, self.window, self.windows, size))
+            for i in range(self.windows):
+                f.write(b"".join(
+                    x.to_bytes(size, "big") + y.to_bytes(size, "big")
+                    for x, y in (self.point(i, d) for d in range(1, count + 1))
+                ))
+
+    def load(self, path):
+        """Mapeia em memória uma tabela gravada por save(); os pontos são lidos sob demanda."""
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, window, windows, size = self.HEADER.unpack_from(mm, 0)
+            if magic != self.MAGIC or size != self.coordinate_size:
+                raise ValueError("Arquivo de tabela de base fixa inválido.")
+            expected = self.HEADER.size + windows * ((1 << window) - 1) * 2 * size
+            if len(mm) != expected or window * windows < self.ecc.n_order.bit_length():
+                raise ValueError("Arquivo de tabela de base fixa truncado ou incompatível.")
+            first = (
+                int.from_bytes(mm[self.HEADER.size:self.HEADER.size + size], "big"),
+                int.from_bytes(mm[self.HEADER.size + size:self.HEADER.size + 2 * size], "big"),
+            )
+            if first != (self.x, self.y):
+                raise ValueError("A tabela gravada não corresponde ao ponto base.")
+        except struct.error:
+            mm.close()
+            raise ValueError("Arquivo de tabela de base fixa inválido.")
+        except ValueError:
+            mm.close()
+            raise
+        self.close()
+        self.window = window
+        self.windows = windows
+        self.bits = window * windows
+        self._mmap = mm
+        return self
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+        self._rows = None
+        self._mmap = None
@@ -0,0 +1,31 @@
+class GLVEndomorphism:
+    """
+    Endomorfismo eficiente φ(x, y) = (β·x, y) = λ·(x, y) de curvas com j-invariante 0
+    (como a secp256k1), usado no método GLV.
+
+    Qualquer escalar k é decomposto em k ≡ k1 + k2·λ (mod n) com |k1|, |k2| ~ √n,
+    então k·P = k1·P + k2·φ(P) precisa só de metade das duplicações.
+    """
+
+    def __init__(self, p, n_order, beta, lam, a1, b1, a2, b2):
+        self.p = p
+        self.n_order = n_order
+        self.beta = beta
+        self.lam = lam
+        # Base reduzida do reticulado {(a, b) : a + b·λ ≡ 0 (mod n)}
+        self.a1, self.b1 = a1, b1
+        self.a2, self.b2 = a2, b2
+
+    def apply(self, x, y):
+        return self.beta * x % self.p, y
+
+    def split(self, k):
+        """Retorna (k1, k2), possivelmente negativos, com k1 + k2·λ ≡ k (mod n)."""
+        n = self.n_order
+        k %= n
+        # c1 = round(b2·k / n), c2 = round(-b1·k / n)
+        c1 = (2 * self.b2 * k + n) // (2 * n)
+        c2 = (-2 * self.b1 * k + n) // (2 * n)
+        k1 = k - c1 * self.a1 - c2 * self.a2
+        k2 = -c1 * self.b1 - c2 * self.b2
+        return k1, k2
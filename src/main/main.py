@@ -1,14 +1,34 @@
-from bitcoin.address import Address
-from bitcoin.wif import WIF
+import argparse
+import os
+import sys
 
 
 class Main:
-    def __init__(self):
+    """
+    Fachada sobre WIF e Address. Os objetos (e seus imports) são criados só no
+    primeiro uso, para a CLI começar rápido.
+    """
+
+    def __init__(self, cache_size=1024):
+        self.cache_size = cache_size
+        self._wif = None
+        self._address = None
+
+    @property
+    def wif(self):
         # Instanciar WIF
-        self.wif = WIF()
+        if self._wif is None:
+            from bitcoin.wif import WIF
+            self._wif = WIF()
+        return self._wif
 
-        # Instanciar Address
-        self.address = Address()
+    @property
+    def address(self):
+        # Instanciar Address (com cache: a mesma chave não recalcula o ponto)
+        if self._address is None:
+            from bitcoin.address import Address
+            self._address = Address(cache_size=self.cache_size)
+        return self._address
 
     def private_key_to_wif(self, private_key, compressed=False, testnet=False):
         return self.wif.private_key_to_WIF(private_key, compressed, testnet)
@@ -25,6 +45,9 @@ class Main:
     def public_key_to_address(self, public_key):
         return self.address.public_to_address(public_key)
 
+    def derive_all(self, private_key, testnet=False):
+        return self.address.derive_all(private_key, testnet)
+
     def is_in_curve(self, public_key_x, public_key_y):
         return self.address.secp256k1.ecc.in_curve(public_key_x, public_key_y)
 
@@ -32,9 +55,147 @@ class Main:
         return self.address.secp256k1.ecc.is_valid_private_key(private_key)
 
 
-if __name__ == "__main__":
-    main = Main()
+def _read_values(values, input_paths):
+    """Valores dos argumentos, depois dos arquivos (-i); sem nenhum dos dois, lê da entrada padrão."""
+    if values or input_paths:
+        for value in values:
+            if value == "-":
+                yield from _read_lines(sys.stdin)
+            else:
+                yield value
+        for path in input_paths:
+            with open(path, "r", encoding="utf-8") as f:
+                yield from _read_lines(f)
+    else:
+        yield from _read_lines(sys.stdin)
+
+
+def _read_lines(stream):
+    # Linhas em branco são mantidas (vazias) para que os números de linha nos erros
+    # correspondam à entrada; cada comando as pula ao processar
+    for line in stream:
+        yield line.strip()
+
+
+def _derive(args):
+    from bitcoin.bulk import BulkDerivation
+    from bitcoin.secp256k1 import Secp256k1
+
+    if args.table and not os.path.exists(args.table):
+        # Primeira execução: grava a tabela de G para as próximas a mapearem via mmap
+        Secp256k1.save_generator_table(args.table)
+    bulk = BulkDerivation(jobs=args.jobs, chunk_size=args.chunk_size, key_format=args.key_format,
+                          testnet=args.testnet, table_path=args.table, all_formats=args.all_formats)
+    # Chaves inválidas vão para stderr e não interrompem a derivação das demais
+    bulk.write(bulk.derive(_read_values(args.values, args.input), errors=sys.stderr), sys.stdout,
+               args.output_format)
+    return 1 if bulk.invalid else 0
+
+
+def _wif_encode(args):
+    from bitcoin.wif import STATUS_OK
+
+    wif = Main().wif
+    invalid = 0
+    # Chaves inválidas vão para stderr, como em derive e wif-decode, e não interrompem as demais
+    results = wif.encode_many(_read_values(args.values, args.input), args.key_format, not args.uncompressed,
+                              args.testnet, errors=sys.stderr, jobs=args.jobs)
+    for encoded, status in results:
+        if status != STATUS_OK:
+            invalid += 1
+            continue
+        print(encoded)
+    return 1 if invalid else 0
+
+
+def _wif_decode(args):
+    from bitcoin.wif import STATUS_OK
+
+    wif = Main().wif
+    invalid = 0
+    results = wif.decode_many(_read_values(args.values, args.input), integer=args.key_format == "int",
+                              errors=sys.stderr, jobs=args.jobs)
+    for key, compressed, network, status in results:
+        if status != STATUS_OK:
+            invalid += 1
+            continue
+        key = str(key) if args.key_format == "int" else key.hex()
+        print(f"{key}\t{'compressed' if compressed else 'uncompressed'}\t{network}")
+    return 1 if invalid else 0
 
+
+def _address(args):
+    from bitcoin.wif import STATUS_OK
+
+    address = Main().address
+    invalid = 0
+    # Valida cada chave (33 ou 65 bytes, ponto na curva); as inválidas vão para stderr
+    results = address.addresses_many(_read_values(args.values, args.input), args.testnet, errors=sys.stderr,
+                                     jobs=args.jobs)
+    for encoded, status in results:
+        if status != STATUS_OK:
+            invalid += 1
+            continue
+        print(encoded)
+    return 1 if invalid else 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="main.py",
+        description="Ferramentas de chaves Bitcoin. Sem subcomando, abre o modo interativo.",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    def add_command(name, handler, help_text, key_format=False):
+        command = subparsers.add_parser(name, help=help_text)
+        command.add_argument("values", nargs="*", help="Valores de entrada (\"-\" lê da entrada padrão).")
+        command.add_argument("-i", "--input", action="append", default=[], help="Arquivo com um valor por linha.")
+        command.add_argument("-j", "--jobs", type=int, default=1, help="Número de processos.")
+        if key_format:
+            command.add_argument("--int", dest="key_format", action="store_const", const="int", default="hex",
+                                 help="Chaves privadas em decimal (padrão: hexadecimal).")
+        command.set_defaults(handler=handler)
+        return command
+
+    derive = add_command("derive", _derive, "Chave privada -> chaves públicas, endereços e WIFs.",
+                         key_format=True)
+    derive.add_argument("--format", dest="output_format", choices=("jsonl", "csv"), default="jsonl")
+    derive.add_argument("--testnet", action="store_true")
+    derive.add_argument("--all-formats", action="store_true",
+                        help="Inclui P2PKH, P2WPKH (bech32) e P2SH-P2WPKH de mainnet e testnet em cada registro.")
+    derive.add_argument("--chunk-size", type=int, default=1024, help="Chaves por bloco enviado a cada processo.")
+    derive.add_argument("--table", help="Arquivo da tabela de G (criado na primeira execução, depois mapeado via mmap).")
+
+    wif_encode = add_command("wif-encode", _wif_encode, "Chave privada -> WIF.", key_format=True)
+    wif_encode.add_argument("--uncompressed", action="store_true")
+    wif_encode.add_argument("--testnet", action="store_true")
+
+    add_command("wif-decode", _wif_decode, "WIF -> chave privada (inválidos vão para stderr).", key_format=True)
+
+    address = add_command("address", _address, "Chave pública (hex) -> endereço.")
+    address.add_argument("--testnet", action="store_true")
+    return parser
+
+
+def run(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command is None:
+        interactive(Main())
+        return 0
+    try:
+        return args.handler(args)
+    except ValueError as error:
+        print(f"Erro: {error}", file=sys.stderr)
+        return 2
+    except BrokenPipeError:
+        # Saída redirecionada para um comando que já terminou (ex.: head)
+        sys.stderr.close()
+        return 0
+
+
+def interactive(main):
+    """Modo interativo original: pede uma chave e exibe todas as conversões."""
     # Input private key
     hex_or_int = int(input("Informe qual o formato da chave privada [Hex=1/Int=2]: "))
 
@@ -95,3 +256,6 @@ if __name__ == "__main__":
     print(f"in_curve? =>                             {in_curve}")
     print(f"is_valid_private_key? =>                 {is_valid_private_key}")
 
+
+if __name__ == "__main__":
+    sys.exit(run())
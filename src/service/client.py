@@ -0,0 +1,146 @@
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import time
+
+
+class ServiceClient:
+    """
+    Cliente assíncrono do DerivationService. Várias requisições podem estar em voo
+    na mesma conexão: cada resposta é entregue à requisição de mesmo "id".
+    """
+
+    def __init__(self, reader, writer):
+        self._reader = reader
+        self._writer = writer
+        self._ids = itertools.count(1)
+        self._waiting = {}
+        self._receiver = asyncio.ensure_future(self._receive())
+
+    @classmethod
+    async def connect(cls, host="127.0.0.1", port=8765, unix_path=None):
+        if unix_path:
+            reader, writer = await asyncio.open_unix_connection(unix_path, limit=1 << 20)
+        else:
+            reader, writer = await asyncio.open_connection(host, port, limit=1 << 20)
+        return cls(reader, writer)
+
+    async def _receive(self):
+        try:
+            while True:
+                line = await self._reader.readline()
+                if not line:
+                    break
+                response = json.loads(line)
+                future = self._waiting.pop(response.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        finally:
+            for future in self._waiting.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Conexão com o serviço encerrada."))
+
+    async def request(self, op, **params):
+        """Envia uma requisição e retorna a resposta {"id", "ok", "result"|"error"}."""
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._waiting[request_id] = future
+        self._writer.write(json.dumps({"id": request_id, "op": op, **params}).encode() + b"\n")
+        await self._writer.drain()
+        return await future
+
+    async def derive(self, key, testnet=False):
+        return await self.request("derive", key=key, testnet=testnet)
+
+    async def address(self, public_key, testnet=False):
+        return await self.request("address", public_key=public_key, testnet=testnet)
+
+    async def wif_encode(self, key, compressed=True, testnet=False):
+        return await self.request("wif_encode", key=key, compressed=compressed, testnet=testnet)
+
+    async def wif_decode(self, wif):
+        return await self.request("wif_decode", wif=wif)
+
+    async def metrics(self):
+        return (await self.request("metrics"))["result"]
+
+    async def close(self):
+        self._writer.close()
+        await self._writer.wait_closed()
+        self._receiver.cancel()
+
+
+def _random_key():
+    return f"{random.randrange(1, 1 << 255):064x}"
+
+
+async def load_test(op="derive", requests=10000, concurrency=256, connections=4,
+                    host="127.0.0.1", port=8765, unix_path=None):
+    """
+    Gera carga: `concurrency` requisições em voo, distribuídas em `connections`
+    conexões. Retorna vazão, percentis de latência e as métricas do servidor.
+    """
+    clients = [await ServiceClient.connect(host, port, unix_path) for _ in range(connections)]
+    remaining = iter(range(requests))
+    latencies = []
+    errors = 0
+
+    async def make_request(client):
+        if op == "derive":
+            return await client.derive(_random_key())
+        if op == "wif_encode":
+            return await client.wif_encode(_random_key())
+        if op == "wif_decode":
+            return await client.wif_decode("KwDiBf89QgGbjEhKnhXJuH7LrciVrZi3qYjgd9M7rFU73sVHnoWn")
+        if op == "address":
+            return await client.address("0279be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798")
+        raise ValueError(f"Operação desconhecida: {op!r}")
+
+    async def worker(client):
+        nonlocal errors
+        for _ in remaining:
+            start = time.perf_counter()
+            response = await make_request(client)
+            latencies.append(time.perf_counter() - start)
+            errors += not response["ok"]
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(clients[i % connections]) for i in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    server_metrics = await clients[0].metrics()
+    for client in clients:
+        await client.close()
+
+    latencies.sort()
+    return {
+        "op": op,
+        "requests": len(latencies),
+        "errors": errors,
+        "seconds": elapsed,
+        "requests_per_sec": len(latencies) / elapsed if elapsed else 0.0,
+        "latency_ms": {name: latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] * 1000
+                       for name, fraction in (("p50", 0.50), ("p90", 0.90), ("p99", 0.99))} if latencies else {},
+        "server": server_metrics,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gerador de carga para o serviço de derivação.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="Caminho do socket Unix (em vez de TCP).")
+    parser.add_argument("--op", choices=("derive", "address", "wif_encode", "wif_decode"), default="derive")
+    parser.add_argument("-n", "--requests", type=int, default=10000)
+    parser.add_argument("-c", "--concurrency", type=int, default=256, help="Requisições em voo.")
+    parser.add_argument("--connections", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(load_test(args.op, args.requests, args.concurrency, args.connections,
+                                   args.host, args.port, args.unix))
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
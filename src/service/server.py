@@ -0,0 +1,402 @@
+import argparse
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from bitcoin.address import Address
+from bitcoin.bulk import BulkDerivation, derive_rows
+from bitcoin.keys import parse_private_key
+from bitcoin.public_key import PublicKey
+from bitcoin.secp256k1 import Secp256k1
+from bitcoin.wif import STATUS_OK, WIF
+
+# Estado de cada processo do executor, criado uma única vez em _worker_init()
+_worker = {}
+
+# Tamanho máximo de uma linha (requisição) no leitor de cada conexão
+LINE_LIMIT = 1 << 20
+
+
+def _worker_init(table_path=None):
+    """Prepara Secp256k1, tabela de G e objetos de derivação uma vez por processo."""
+    Secp256k1.prepare_generator_table(table_path)
+    _worker["address"] = Address()
+    _worker["wif"] = WIF()
+    _worker["public_key"] = PublicKey()
+
+
+def _private_key(request, n_order):
+    private_key = parse_private_key(request["key"], request.get("key_format", "hex"))
+    if not 1 <= private_key < n_order:
+        raise ValueError(f"Chave privada fora do intervalo válido: {request['key']!r}")
+    return private_key
+
+
+def _derive_batch(requests):
+    """{"key", "key_format"?, "testnet"?} -> dict com chaves públicas, endereços e WIFs."""
+    address = _worker["address"]
+    n_order = address.secp256k1.n_order
+    results = [None] * len(requests)
+    groups = {False: ([], []), True: ([], [])}
+    for index, request in enumerate(requests):
+        try:
+            private_key = _private_key(request, n_order)
+        except (AttributeError, KeyError, TypeError, ValueError) as error:
+            results[index] = (False, str(error))
+            continue
+        indexes, keys = groups[bool(request.get("testnet"))]
+        indexes.append(index)
+        keys.append(private_key)
+    # Um lote por rede: pontos, hash160 e checksums calculados juntos
+    for testnet, (indexes, keys) in groups.items():
+        if keys:
+            rows = derive_rows(keys, address, _worker["wif"], testnet)
+            for index, row in zip(indexes, rows):
+                results[index] = (True, dict(zip(BulkDerivation.FIELDS, row)))
+    return results
+
+
+def _address_batch(requests):
+    """{"public_key" (hex), "testnet"?} -> endereço."""
+    address = _worker["address"]
+    public_keys = [request.get("public_key") if isinstance(request.get("public_key"), str) else "" for request in requests]
+    points = _worker["public_key"].parse_many(public_keys, strict=False)
+    results = [None] * len(requests)
+    valid = []
+    for index, point in enumerate(points):
+        if point is None:
+            results[index] = (False, "Chave pública inválida.")
+        else:
+            valid.append(index)
+    hashes = address.ripemd160.hash160_many(bytes.fromhex(public_keys[index]) for index in valid)
+    payloads = [(b"\x6f" if requests[index].get("testnet") else b"\x00") + h for index, h in zip(valid, hashes)]
+    for index, encoded in zip(valid, address.base58.encode_check_many(payloads)):
+        results[index] = (True, encoded)
+    return results
+
+
+def _wif_encode_batch(requests):
+    """{"key", "key_format"?, "compressed"? (padrão True), "testnet"?} -> WIF."""
+    wif = _worker["wif"]
+    results = [None] * len(requests)
+    valid = []
+    payloads = []
+    for index, request in enumerate(requests):
+        try:
+            private_key = _private_key(request, wif.n_order)
+        except (AttributeError, KeyError, TypeError, ValueError) as error:
+            results[index] = (False, str(error))
+            continue
+        payload = (b"\xef" if request.get("testnet") else b"\x80") + private_key.to_bytes(32, "big")
+        if request.get("compressed", True):
+            payload += b"\x01"
+        valid.append(index)
+        payloads.append(payload)
+    for index, encoded in zip(valid, wif.base58.encode_check_many(payloads)):
+        results[index] = (True, encoded)
+    return results
+
+
+def _wif_decode_batch(requests):
+    """{"wif"} -> {"private_key" (hex), "compressed", "network"}."""
+    decoded = _worker["wif"].decode_batch([str(request.get("wif", "")) for request in requests])
+    results = []
+    for key, compressed, network, status in decoded:
+        if status == STATUS_OK:
+            results.append((True, {"private_key": key.hex(), "compressed": compressed, "network": network}))
+        else:
+            results.append((False, status))
+    return results
+
+
+BATCH_HANDLERS = {
+    "derive": _derive_batch,
+    "address": _address_batch,
+    "wif_encode": _wif_encode_batch,
+    "wif_decode": _wif_decode_batch,
+}
+
+
+def run_batch(op, requests):
+    """Executa um micro-lote de uma operação; retorna (ok, resultado ou erro) por requisição."""
+    if not _worker:
+        _worker_init()
+    return BATCH_HANDLERS[op](requests)
+
+
+class Metrics:
+    """Contadores por operação e percentis de latência das últimas `window` requisições."""
+
+    def __init__(self, window=4096):
+        self.window = window
+        self.started = time.time()
+        self.operations = {}
+
+    def _operation(self, op):
+        operation = self.operations.get(op)
+        if operation is None:
+            operation = self.operations[op] = {
+                "requests": 0, "errors": 0, "batches": 0, "batched_requests": 0,
+                "latencies": deque(maxlen=self.window),
+            }
+        return operation
+
+    def record_batch(self, op, size):
+        operation = self._operation(op)
+        operation["batches"] += 1
+        operation["batched_requests"] += size
+
+    def record_request(self, op, latency, ok):
+        operation = self._operation(op)
+        operation["requests"] += 1
+        operation["errors"] += not ok
+        operation["latencies"].append(latency)
+
+    def snapshot(self, queue_depths):
+        operations = {}
+        for op, operation in self.operations.items():
+            latencies = sorted(operation["latencies"])
+
+            def percentile(fraction):
+                return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] if latencies else 0.0
+
+            operations[op] = {
+                "requests": operation["requests"],
+                "errors": operation["errors"],
+                "batches": operation["batches"],
+                "mean_batch_size": operation["batched_requests"] / operation["batches"] if operation["batches"] else 0.0,
+                "queue_depth": queue_depths.get(op, 0),
+                "latency_ms": {name: percentile(fraction) * 1000
+                               for name, fraction in (("p50", 0.50), ("p90", 0.90), ("p99", 0.99))},
+            }
+        return {"uptime": time.time() - self.started, "queue_depth": sum(queue_depths.values()), "operations": operations}
+
+
+class MicroBatcher:
+    """
+    Agrupa requisições concorrentes de uma operação. Um lote sai quando chega a
+    max_batch requisições ou quando a primeira delas esperou max_delay segundos, e
+    só é enviado ao executor quando há um processo livre (slots): enquanto todos
+    estão ocupados, o lote continua crescendo, e as inversões e hashes são
+    amortizados sobre mais requisições justamente sob carga.
+    """
+
+    def __init__(self, op, executor, metrics, slots, max_batch=256, max_delay=0.002):
+        self.op = op
+        self.executor = executor
+        self.metrics = metrics
+        self.slots = slots
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._pending = []
+        self._ready = asyncio.Event()
+        self._full = asyncio.Event()
+        # Requisições aguardando: no lote em formação e nos lotes em execução
+        self.depth = 0
+
+    def submit(self, request):
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((request, future))
+        self.depth += 1
+        self._ready.set()
+        if len(self._pending) >= self.max_batch:
+            self._full.set()
+        return future
+
+    async def run(self):
+        """Laço de despacho dos lotes (uma tarefa por operação)."""
+        while True:
+            await self._ready.wait()
+            if len(self._pending) < self.max_batch:
+                try:
+                    await asyncio.wait_for(self._full.wait(), self.max_delay)
+                except asyncio.TimeoutError:
+                    pass
+            await self.slots.acquire()
+            batch = self._pending[:self.max_batch]
+            del self._pending[:self.max_batch]
+            if not self._pending:
+                self._ready.clear()
+            if len(self._pending) < self.max_batch:
+                self._full.clear()
+            asyncio.ensure_future(self._execute(batch))
+
+    async def _execute(self, batch):
+        loop = asyncio.get_running_loop()
+        self.metrics.record_batch(self.op, len(batch))
+        try:
+            results = await loop.run_in_executor(self.executor, run_batch, self.op, [request for request, _ in batch])
+        except Exception as error:
+            results = [(False, f"Erro interno: {error}")] * len(batch)
+        finally:
+            self.slots.release()
+            self.depth -= len(batch)
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+class DerivationService:
+    """
+    Servidor asyncio de derivação (derive, address, wif_encode, wif_decode, metrics)
+    em TCP local ou socket Unix, com protocolo JSON lines: uma requisição
+    {"id", "op", ...parâmetros} por linha, uma resposta {"id", "ok", "result"|"error"}
+    por linha. As respostas de uma conexão podem sair fora de ordem (use o "id").
+
+    O trabalho de CPU roda num pool de processos (cada um monta a tabela de G uma
+    vez), então o loop de eventos nunca bloqueia. Cada conexão tem no máximo
+    max_in_flight requisições em andamento; acima disso, o servidor para de ler
+    a conexão até alguma terminar.
+    """
+
+    def __init__(self, workers=None, max_batch=256, max_delay=0.002, table_path=None, max_in_flight=1024):
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = ProcessPoolExecutor(self.workers, initializer=_worker_init, initargs=(table_path,))
+        self.metrics = Metrics()
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.max_in_flight = max_in_flight
+        self.batchers = {}
+        self.server = None
+        self._tasks = []
+
+    def queue_depths(self):
+        return {op: batcher.depth for op, batcher in self.batchers.items()}
+
+    async def handle_request(self, request):
+        op = request.get("op")
+        if not isinstance(op, str):
+            return {"id": request.get("id"), "ok": False, "error": "O campo \"op\" deve ser uma string."}
+        if op == "metrics":
+            return {"id": request.get("id"), "ok": True, "result": self.metrics.snapshot(self.queue_depths())}
+        batcher = self.batchers.get(op)
+        if batcher is None:
+            return {"id": request.get("id"), "ok": False, "error": f"Operação desconhecida: {op!r}"}
+        start = time.perf_counter()
+        ok, result = await batcher.submit(request)
+        self.metrics.record_request(op, time.perf_counter() - start, ok)
+        response = {"id": request.get("id"), "ok": ok}
+        response["result" if ok else "error"] = result
+        return response
+
+    async def _respond(self, line, writer):
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError
+        except ValueError:
+            response = {"id": None, "ok": False, "error": "Requisição JSON inválida."}
+        else:
+            try:
+                response = await self.handle_request(request)
+            except Exception as error:
+                # Toda requisição recebe resposta: o cliente não pode ficar esperando o "id"
+                response = {"id": request.get("id"), "ok": False, "error": f"Erro interno: {error}"}
+        self._write(writer, response)
+
+    @staticmethod
+    def _write(writer, response):
+        writer.write(json.dumps(response).encode() + b"\n")
+
+    async def _handle_connection(self, reader, writer):
+        tasks = set()
+        in_flight = asyncio.Semaphore(self.max_in_flight)
+
+        def finished(task):
+            tasks.discard(task)
+            in_flight.release()
+
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    # Linha acima de LINE_LIMIT: o resto dela chegaria como uma requisição
+                    # nova, então responde com erro e encerra depois das que estão em andamento
+                    self._write(writer, {"id": None, "ok": False,
+                                         "error": f"Requisição maior que o limite de {LINE_LIMIT} bytes."})
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                # Cada linha vira uma tarefa: requisições da mesma conexão entram no mesmo lote
+                await in_flight.acquire()
+                task = asyncio.ensure_future(self._respond(line, writer))
+                tasks.add(task)
+                task.add_done_callback(finished)
+                if writer.transport.get_write_buffer_size() > 1 << 20:
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        except asyncio.CancelledError:
+            # Servidor encerrando: as requisições em andamento não terão resposta
+            for task in tasks:
+                task.cancel()
+            raise
+        finally:
+            # As respostas pendentes são escritas antes de fechar a conexão
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            try:
+                await writer.drain()
+            except ConnectionError:
+                pass
+            writer.close()
+
+    async def start(self, host="127.0.0.1", port=8765, unix_path=None):
+        # Um lote em execução por processo do executor, somando todas as operações
+        slots = asyncio.Semaphore(self.workers)
+        self.batchers = {op: MicroBatcher(op, self.executor, self.metrics, slots, self.max_batch, self.max_delay)
+                         for op in BATCH_HANDLERS}
+        self._tasks = [asyncio.ensure_future(batcher.run()) for batcher in self.batchers.values()]
+        if unix_path:
+            self.server = await asyncio.start_unix_server(self._handle_connection, unix_path, limit=LINE_LIMIT)
+        else:
+            self.server = await asyncio.start_server(self._handle_connection, host, port, limit=LINE_LIMIT)
+        # Aquece os processos do executor antes de aceitar carga
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self.executor, run_batch, "wif_encode", [{"key": "1"}])
+                               for _ in range(self.workers)))
+        return self.server
+
+    async def serve_forever(self, host="127.0.0.1", port=8765, unix_path=None):
+        server = await self.start(host, port, unix_path)
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        for task in self._tasks:
+            task.cancel()
+        if self.server is not None:
+            self.server.close()
+        self.executor.shutdown()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serviço local de derivação de chaves (JSON lines).")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="Caminho do socket Unix (em vez de TCP).")
+    parser.add_argument("--workers", type=int, help="Processos do executor (padrão: núcleos da CPU).")
+    parser.add_argument("--max-batch", type=int, default=256, help="Requisições por micro-lote.")
+    parser.add_argument("--max-delay-ms", type=float, default=2.0, help="Espera máxima para formar um lote.")
+    parser.add_argument("--table", help="Tabela de G gravada por Secp256k1.save_generator_table().")
+    parser.add_argument("--max-in-flight", type=int, default=1024, help="Requisições em andamento por conexão.")
+    args = parser.parse_args(argv)
+
+    service = DerivationService(args.workers, args.max_batch, args.max_delay_ms / 1000, args.table,
+                                args.max_in_flight)
+    try:
+        asyncio.run(service.serve_forever(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+
+
+if __name__ == "__main__":
+    main()
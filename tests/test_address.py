@@ -0,0 +1,79 @@
+import pytest
+
+from bitcoin.address import Address
+
+# Endereços e WIFs conhecidos da chave privada 1
+EXPECTED = {
+    "address_compressed": "1BgGZ9tcN4rm9KBzDn7KprQz87SZ26SAMH",
+    "address_uncompressed": "1EHNa6Q4Jz2uvNExL497mE43ikXhwF6kZm",
+    "wif_compressed": "KwDiBf89QgGbjEhKnhXJuH7LrciVrZi3qYjgd9M7rFU73sVHnoWn",
+    "wif_uncompressed": "5HpHagT65TZzG1PH3CSu63k8DbpvD8s5ip4nEB3kEsreAnchuDf",
+}
+
+ADDRESSES = {
+    "mainnet": {
+        "p2pkh_compressed": "1BgGZ9tcN4rm9KBzDn7KprQz87SZ26SAMH",
+        "p2pkh_uncompressed": "1EHNa6Q4Jz2uvNExL497mE43ikXhwF6kZm",
+        "p2wpkh": "bc1qw508d6qejxtdg4y5r3zarvary0c5xw7kv8f3t4",
+        "p2sh_p2wpkh": "3JvL6Ymt8MVWiCNHC7oWU6nLeHNJKLZGLN",
+    },
+    "testnet": {
+        "p2pkh_compressed": "mrCDrCybB6J1vRfbwM5hemdJz73FwDBC8r",
+        "p2wpkh": "tb1qw508d6qejxtdg4y5r3zarvary0c5xw7kxpjzsx",
+        "p2sh_p2wpkh": "2NAUYAHhujozruyzpsFRP63mbrdaU5wnEpN",
+    },
+}
+
+
+@pytest.mark.parametrize("cache_size", (0, 1024))
+def test_derive_all_known_key(cache_size):
+    address = Address(cache_size)
+    for _ in range(2):
+        result = address.derive_all(1)
+        for field, value in EXPECTED.items():
+            assert result[field] == value
+
+
+@pytest.mark.parametrize("cache_size", (0, 1024))
+def test_private_to_addresses(cache_size):
+    addresses = Address(cache_size).private_to_addresses(1)
+    for network, formats in ADDRESSES.items():
+        for address_format, value in formats.items():
+            assert addresses[network][address_format] == value
+
+
+def test_cache_does_not_change_results():
+    plain, cached = Address(), Address(64)
+    for key in list(range(1, 40)) + list(range(1, 40)):
+        assert cached.private_to_public(key, False) == plain.private_to_public(key, False)
+        assert cached.public_to_address(cached.private_to_public(key)) == \
+            plain.public_to_address(plain.private_to_public(key))
+
+
+def test_many_matches_single():
+    address = Address()
+    keys = list(range(1, 50)) + [2 ** 200 + 3]
+    assert address.private_to_public_many(keys) == [address.private_to_public(k) for k in keys]
+
+
+@pytest.mark.parametrize("cache_size", (0, 1024))
+def test_off_curve_point_is_rejected_with_or_without_cache(monkeypatch, cache_size):
+    address = Address(cache_size)
+    monkeypatch.setattr(address.secp256k1.ecc, "eccnP", lambda k: (1, 1))
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            address.private_to_public(5)
+    if address.cache is not None:
+        assert address.cache.points.get(5) is None
+
+
+def test_public_keys_to_addresses():
+    address = Address()
+    compressed = address.private_to_public(1, True)
+    uncompressed = address.private_to_public(1, False)
+    results = address.public_keys_to_addresses([compressed, "02ff", bytes.fromhex(uncompressed)])
+    assert results == [
+        (EXPECTED["address_compressed"], "ok"),
+        (None, "invalid_public_key"),
+        (EXPECTED["address_uncompressed"], "ok"),
+    ]
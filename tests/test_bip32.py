@@ -0,0 +1,90 @@
+import pytest
+
+from bitcoin.bip32 import BIP32, HARDENED, parse_path, parse_range
+
+SEED_1 = "000102030405060708090a0b0c0d0e0f"
+SEED_2 = (
+    "fffcf9f6f3f0edeae7e4e1dedbd8d5d2cfccc9c6c3c0bdbab7b4b1aeaba8a5a2"
+    "9f9c999693908d8a8784817e7b7875726f6c696663605d5a5754514e4b484542"
+)
+
+# Vetores de teste do BIP32: (seed, caminho, xprv ou xpub esperado)
+VECTORS = (
+    (SEED_1, "m", "xprv9s21ZrQH143K3QTDL4LXw2F7HEK3wJUD2nW2nRk4stbPy6cq3jPPqjiChkVvvNKmPGJxWUtg6LnF5kejMRNNU3TGtRBeJgk33yuGBxrMPHi"),
+    (SEED_1, "m", "xpub661MyMwAqRbcFtXgS5sYJABqqG9YLmC4Q1Rdap9gSE8NqtwybGhePY2gZ29ESFjqJoCu1Rupje8YtGqsefD265TMg7usUDFdp6W1EGMcet8"),
+    (SEED_1, "m/0H", "xprv9uHRZZhk6KAJC1avXpDAp4MDc3sQKNxDiPvvkX8Br5ngLNv1TxvUxt4cV1rGL5hj6KCesnDYUhd7oWgT11eZG7XnxHrnYeSvkzY7d2bhkJ7"),
+    (SEED_1, "m/0H/1/2H/2/1000000000", "xprvA41z7zogVVwxVSgdKUHDy1SKmdb533PjDz7J6N6mV6uS3ze1ai8FHa8kmHScGpWmj4WggLyQjgPie1rFSruoUihUZREPSL39UNdE3BBDu76"),
+    (SEED_2, "m/0", "xpub69H7F5d8KSRgmmdJg2KhpAK8SR3DjMwAdkxj3ZuxV27CprR9LgpeyGmXUbC6wb7ERfvrnKZjXoUmmDznezpbZb7ap6r1D3tgFxHmwMkQTPH"),
+)
+
+
+@pytest.fixture(scope="module")
+def bip32():
+    return BIP32()
+
+
+@pytest.mark.parametrize("cache_size", (0, 1024))
+@pytest.mark.parametrize("seed, path, expected", VECTORS)
+def test_vectors(seed, path, expected, cache_size):
+    bip32 = BIP32(cache_size)
+    node = bip32.derive(bip32.master_from_seed(seed), path)
+    assert node.serialize(private=expected.startswith("xprv")) == expected
+
+
+@pytest.mark.parametrize("seed, path, expected", VECTORS)
+def test_parse_round_trip(bip32, seed, path, expected):
+    assert bip32.parse(expected).serialize() == expected
+
+
+def test_public_derivation_matches_private(bip32):
+    account = bip32.derive(bip32.master_from_seed(SEED_1), "m/0'/1")
+    public = account.neuter()
+    for index in (0, 1, 2, 1000):
+        assert bip32.child(public, index).serialize() == bip32.child(account, index).serialize(private=False)
+
+
+def test_hardened_child_of_public_node_fails(bip32):
+    public = bip32.master_from_seed(SEED_1).neuter()
+    with pytest.raises(ValueError):
+        bip32.child(public, HARDENED)
+
+
+def test_cache_separates_networks():
+    bip32 = BIP32()
+    mainnet = bip32.derive(bip32.master_from_seed(SEED_1), "m/0'/1")
+    testnet = bip32.derive(bip32.master_from_seed(SEED_1, testnet=True), "m/0'/1")
+    assert mainnet.serialize().startswith("xprv")
+    assert testnet.serialize().startswith("tprv")
+    assert mainnet.chain_code == testnet.chain_code
+
+
+def test_cache_separates_private_and_public_roots():
+    bip32 = BIP32()
+    master = bip32.master_from_seed(SEED_1)
+    assert bip32.derive(master, "m/1/2").is_private
+    assert not bip32.derive(master.neuter(), "m/1/2").is_private
+
+
+def test_parse_path_and_range():
+    assert parse_path("m/44'/0h/0H/1") == (44 + HARDENED, HARDENED, HARDENED, 1)
+    assert parse_range("m/0'/5..9") == ((HARDENED,), 5, 9)
+    assert parse_range("m/0..3'") == ((), HARDENED, 3 + HARDENED)
+    with pytest.raises(ValueError):
+        parse_range("m/9..5")
+
+
+@pytest.mark.parametrize("path", ("m/0'/0..40", "m/0..20'"))
+def test_derive_range_matches_child(bip32, path):
+    master = bip32.master_from_seed(SEED_1)
+    prefix, start, stop = parse_range(path)
+    parent = bip32.derive(master, prefix)
+    expected = [bip32.child(parent, index).serialize() for index in range(start, stop + 1)]
+    assert [node.serialize() for node in bip32.derive_range(master, path, batch_size=7)] == expected
+    assert [node.serialize() for node in bip32.derive_range(master, path, jobs=2, batch_size=7)] == expected
+
+
+def test_derive_range_from_public_parent(bip32):
+    account = bip32.derive(bip32.master_from_seed(SEED_2), "m/0")
+    public = account.neuter()
+    expected = [bip32.child(account, index).serialize(private=False) for index in range(0, 30)]
+    assert [node.serialize() for node in bip32.derive_range(public, "m/0..29", batch_size=8)] == expected
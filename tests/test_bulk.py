@@ -0,0 +1,45 @@
+import io
+
+import pytest
+
+from bitcoin.bulk import BulkDerivation
+from bitcoin.keys import SECP256K1_ORDER, STATUS_INVALID_FORMAT, STATUS_OUT_OF_RANGE
+
+# Chave 1: endereços e WIFs conhecidos
+KEY_1 = {
+    "private_key": "0000000000000000000000000000000000000000000000000000000000000001",
+    "address_compressed": "1BgGZ9tcN4rm9KBzDn7KprQz87SZ26SAMH",
+    "address_uncompressed": "1EHNa6Q4Jz2uvNExL497mE43ikXhwF6kZm",
+    "wif_compressed": "KwDiBf89QgGbjEhKnhXJuH7LrciVrZi3qYjgd9M7rFU73sVHnoWn",
+    "wif_uncompressed": "5HpHagT65TZzG1PH3CSu63k8DbpvD8s5ip4nEB3kEsreAnchuDf",
+}
+
+
+def test_known_key():
+    bulk = BulkDerivation(jobs=1)
+    row = dict(zip(bulk.fields, next(bulk.derive(["1"]))))
+    for field, value in KEY_1.items():
+        assert row[field] == value
+
+
+@pytest.mark.parametrize("all_formats", (False, True))
+def test_parallel_matches_single_process(all_formats):
+    keys = [format(k, "x") for k in range(1, 60)]
+    single = list(BulkDerivation(jobs=1, chunk_size=8, all_formats=all_formats).derive(keys))
+    parallel = list(BulkDerivation(jobs=2, chunk_size=8, all_formats=all_formats).derive(keys))
+    assert parallel == single
+    assert len(single) == len(keys)
+
+
+def test_invalid_keys_are_reported_and_skipped():
+    lines = ["1\n", "zz\n", "\n", "0\n", format(SECP256K1_ORDER, "x") + "\n", "2\n"]
+    errors = io.StringIO()
+    bulk = BulkDerivation(jobs=1)
+    rows = list(bulk.derive(lines, errors))
+    assert len(rows) == 2
+    assert bulk.invalid == 3
+    assert errors.getvalue().splitlines() == [
+        f"2\t{STATUS_INVALID_FORMAT}\tzz",
+        f"4\t{STATUS_OUT_OF_RANGE}\t0",
+        f"5\t{STATUS_OUT_OF_RANGE}\t{SECP256K1_ORDER:x}",
+    ]
@@ -0,0 +1,132 @@
+import random
+
+import pytest
+
+from bitcoin.secp256k1 import Secp256k1
+from ecc.elliptic_curve_cryptography import EllipticCurveCryptography
+from ecc.fixed_base_table import FixedBaseTable
+
+
+@pytest.fixture(scope="module")
+def secp256k1():
+    return Secp256k1()
+
+
+@pytest.fixture(scope="module")
+def reference(secp256k1):
+    """A mesma curva sem tabela, GLV nem backend de corpo: só addp/doublep afins."""
+    ecc = secp256k1.ecc
+    return EllipticCurveCryptography(ecc.p, ecc.n_order, ecc.Gx, ecc.Gy, ecc.A, ecc.B)
+
+
+def _double_and_add(ecc, point, k):
+    result = ecc.pointNULL
+    for bit in bin(k)[2:]:
+        result = ecc.doublep(*result)
+        if bit == "1":
+            result = ecc.addp(*result, *point)
+    return result
+
+
+def _scalars(ecc, count, seed):
+    rng = random.Random(seed)
+    n = ecc.n_order
+    return [1, 2, 3, 15, 16, 17, n - 1, n - 2] + [rng.randrange(1, n) for _ in range(count)]
+
+
+def test_eccnP_table_matches_double_and_add(secp256k1, reference):
+    ecc = secp256k1.ecc
+    G = (ecc.Gx, ecc.Gy)
+    for k in _scalars(ecc, 20, 1):
+        assert ecc.eccnP(k) == _double_and_add(reference, G, k)
+
+
+def test_eccnP_batch_matches_eccnP(secp256k1, reference):
+    ecc = secp256k1.ecc
+    keys = _scalars(ecc, 100, 2)
+    # Chaves repetidas e fora do intervalo da tabela passam pelos casos especiais
+    keys += [keys[0], 0, ecc.n_order, 2 ** 256 + 5]
+    assert ecc.eccnP_batch(keys) == [reference.eccnP(k) for k in keys]
+
+
+def test_eccnP_batch_without_table(reference):
+    keys = _scalars(reference, 20, 3)
+    G = (reference.Gx, reference.Gy)
+    assert reference.eccnP_batch(keys) == [_double_and_add(reference, G, k) for k in keys]
+
+
+@pytest.mark.parametrize("w", (2, 4, 5, 6))
+def test_multiply_wnaf_glv_matches_double_and_add(secp256k1, reference, w):
+    ecc = secp256k1.ecc
+    rng = random.Random(w)
+    point = reference.eccnP(rng.randrange(1, ecc.n_order))
+    for k in _scalars(ecc, 10, w) + [0, -5, ecc.n_order]:
+        expected = _double_and_add(reference, point, k % ecc.n_order)
+        assert ecc.multiply(point, k, w) == expected
+        assert reference.multiply(point, k, w) == expected
+
+
+def test_glv_split_recombines(secp256k1):
+    glv = secp256k1.ecc.endomorphism
+    n = secp256k1.n_order
+    for k in _scalars(secp256k1.ecc, 200, 4):
+        k1, k2 = glv.split(k)
+        assert (k1 + k2 * glv.lam) % n == k % n
+        assert max(abs(k1), abs(k2)).bit_length() <= 129
+
+
+def test_endomorphism_is_lambda_multiplication(secp256k1, reference):
+    ecc = secp256k1.ecc
+    point = reference.eccnP(12345)
+    assert ecc.endomorphism.apply(*point) == _double_and_add(reference, point, secp256k1.lam)
+
+
+def test_batch_inverse_matches_inverse(reference):
+    p = reference.p
+    rng = random.Random(5)
+    values = [rng.randrange(p) for _ in range(50)] + [0, p, 1]
+    expected = [reference.inverse(v % p, p) if v % p else 0 for v in values]
+    assert reference.batch_inverse(values) == expected
+
+
+def test_batch_to_affine_matches_to_affine(reference):
+    points = [reference.eccnP_jacobian(k) for k in _scalars(reference, 20, 6)]
+    points.append(reference.jacobianNULL)
+    assert reference.batch_to_affine(points) == [reference.to_affine(*P) for P in points]
+
+
+def test_jacobian_formulas_match_affine(reference):
+    rng = random.Random(7)
+    for _ in range(20):
+        P = reference.eccnP(rng.randrange(1, reference.n_order))
+        Q = reference.eccnP(rng.randrange(1, reference.n_order))
+        JP, JQ = reference.to_jacobian(*P), reference.to_jacobian(*Q)
+        assert reference.to_affine(*reference.jacobian_double(*JP)) == reference.doublep(*P)
+        assert reference.to_affine(*reference.jacobian_add(*JP, *JQ)) == reference.addp(*P, *Q)
+        assert reference.to_affine(*reference.jacobian_add_mixed(*JP, *Q)) == reference.addp(*P, *Q)
+    P = reference.eccnP(3)
+    negative = (P[0], reference.p - P[1])
+    assert reference.to_affine(*reference.jacobian_add_mixed(*reference.to_jacobian(*P), *negative)) \
+        == reference.pointNULL
+
+
+def test_decompress_matches_point(secp256k1, reference):
+    ecc = secp256k1.ecc
+    for k in _scalars(ecc, 20, 8):
+        x, y = reference.eccnP(k)
+        assert ecc.decompress(x, y & 1) == (x, y)
+        assert reference.decompress(x, y & 1) == (x, y)
+        assert ecc.in_curve(x, y)
+
+
+def test_fixed_base_table_save_load(tmp_path, reference):
+    table = FixedBaseTable(reference, reference.Gx, reference.Gy, window=4).build()
+    path = str(tmp_path / "table.bin")
+    table.save(path)
+    loaded = FixedBaseTable(reference, reference.Gx, reference.Gy).load(path)
+    try:
+        G = (reference.Gx, reference.Gy)
+        for k in _scalars(reference, 10, 9):
+            assert loaded.multiply(k) == table.multiply(k) == _double_and_add(reference, G, k)
+    finally:
+        loaded.close()
@@ -0,0 +1,74 @@
+import random
+
+import pytest
+
+from ecc import field
+from ecc.field import (
+    SECP256K1_P, Gmpy2Field, PrimeField, _reference_inverse, available_backends,
+    select_backend, self_test,
+)
+
+requires_gmpy2 = pytest.mark.skipif(field.gmpy2 is None, reason="gmpy2 não instalado")
+
+# secp256k1 (p ≡ 3 mod 4) e um primo p ≡ 1 (mod 4), que passa pelo Tonelli-Shanks
+PRIMES = (SECP256K1_P, 2 ** 255 - 19)
+
+BACKENDS = (PrimeField, pytest.param(Gmpy2Field, marks=requires_gmpy2))
+
+
+def _values(p, count=200):
+    rng = random.Random(p)
+    return [0, 1, 2, p - 1] + [rng.randrange(p) for _ in range(count)]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("p", PRIMES)
+def test_inverse_matches_reference(backend, p):
+    prime_field = backend(p)
+    for x in _values(p):
+        assert prime_field.inverse(x) == _reference_inverse(x, p)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("p", PRIMES)
+def test_sqrt_squares_back(backend, p):
+    prime_field = backend(p)
+    for x in _values(p):
+        root = prime_field.sqrt(x)
+        if root is None:
+            assert pow(x, (p - 1) >> 1, p) == p - 1
+        else:
+            assert root * root % p == x
+
+
+@requires_gmpy2
+@pytest.mark.parametrize("p", PRIMES)
+def test_gmpy2_matches_python_backend(p):
+    python_field, gmpy2_field = PrimeField(p), Gmpy2Field(p)
+    for x in _values(p):
+        assert gmpy2_field.inverse(x) == python_field.inverse(x)
+        assert gmpy2_field.sqrt(x) == python_field.sqrt(x)
+        assert type(gmpy2_field.inverse(x)) is int
+
+
+@pytest.mark.parametrize("p", PRIMES)
+def test_available_backends_pass_self_test(p):
+    for backend in available_backends(p):
+        assert self_test(backend, rounds=32)
+
+
+def test_self_test_rejects_broken_backend():
+    class Broken(PrimeField):
+        def inverse(self, x):
+            return 1
+    assert not self_test(Broken(SECP256K1_P))
+
+
+def test_select_backend_override_and_fallback(monkeypatch):
+    monkeypatch.delenv(field.BACKEND_ENV, raising=False)
+    assert select_backend(SECP256K1_P, "python").name == "python"
+    with pytest.warns(RuntimeWarning):
+        chosen = select_backend(SECP256K1_P, "inexistente")
+    assert chosen.name == ("gmpy2" if field.gmpy2 is not None else "python")
+    monkeypatch.setenv(field.BACKEND_ENV, "python")
+    assert select_backend(SECP256K1_P).name == "python"
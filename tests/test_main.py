@@ -0,0 +1,45 @@
+import io
+
+import pytest
+
+from main.main import run
+
+PUBLIC_KEY = "0279be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798"
+
+
+def _run(capsys, monkeypatch, argv, stdin=""):
+    monkeypatch.setattr("sys.stdin", io.StringIO(stdin))
+    code = run(argv)
+    out, err = capsys.readouterr()
+    return code, out.splitlines(), err.splitlines()
+
+
+@pytest.mark.parametrize("jobs", ("1", "2"))
+def test_wif_encode_reports_invalid_keys_and_continues(capsys, monkeypatch, jobs):
+    code, out, err = _run(capsys, monkeypatch, ["wif-encode", "-j", jobs], "1\nzz\n\n0\n1\n")
+    assert code == 1
+    assert out == ["KwDiBf89QgGbjEhKnhXJuH7LrciVrZi3qYjgd9M7rFU73sVHnoWn"] * 2
+    assert err == ["2\tinvalid_format\tzz", "4\tout_of_range\t0"]
+
+
+def test_wif_encode_options(capsys, monkeypatch):
+    code, out, err = _run(capsys, monkeypatch, ["wif-encode", "--int", "--uncompressed", "1"])
+    assert (code, out, err) == (0, ["5HpHagT65TZzG1PH3CSu63k8DbpvD8s5ip4nEB3kEsreAnchuDf"], [])
+
+
+@pytest.mark.parametrize("jobs", ("1", "2"))
+def test_address_reports_invalid_keys_and_continues(capsys, monkeypatch, jobs):
+    code, out, err = _run(capsys, monkeypatch, ["address", "-j", jobs, PUBLIC_KEY, "02ff", PUBLIC_KEY])
+    assert code == 1
+    assert out == ["1BgGZ9tcN4rm9KBzDn7KprQz87SZ26SAMH"] * 2
+    assert err == ["2\tinvalid_public_key\t02ff"]
+
+
+def test_derive_and_wif_decode_report_invalid_lines(capsys, monkeypatch):
+    code, out, err = _run(capsys, monkeypatch, ["derive", "--format", "csv"], "1\nzz\n")
+    assert code == 1
+    assert len(out) == 2 and err == ["2\tinvalid_format\tzz"]
+    code, out, err = _run(capsys, monkeypatch, ["wif-decode"], "KwDiBf89QgGbjEhKnhXJuH7LrciVrZi3qYjgd9M7rFU73sVHnoWn\nzz0\n")
+    assert code == 1
+    assert out == ["0000000000000000000000000000000000000000000000000000000000000001\tcompressed\tmainnet"]
+    assert err == ["2\tinvalid_base58\tzz0"]
@@ -0,0 +1,25 @@
+from bitcoin.parallel import ordered_map
+
+
+def _square_all(chunk):
+    return [x * x for x in chunk]
+
+
+def test_ordered_map_keeps_input_order():
+    chunks = [list(range(start, start + 7)) for start in range(0, 200, 7)]
+    assert list(ordered_map(_square_all, chunks, 2)) == [_square_all(c) for c in chunks]
+
+
+def test_ordered_map_bounds_pending_chunks():
+    read = []
+
+    def chunks():
+        for start in range(0, 100, 10):
+            read.append(start)
+            yield list(range(start, start + 10))
+
+    results = ordered_map(_square_all, chunks(), 2, max_pending=3)
+    assert next(results) == _square_all(range(10))
+    # Só os blocos em voo (max_pending) foram lidos antes do primeiro resultado
+    assert len(read) == 3
+    assert len(list(results)) == 9
@@ -0,0 +1,79 @@
+import hashlib
+import random
+
+import pytest
+
+from crypto.ripemd160 import Ripemd160
+from crypto.sha256 import SHA256, _numpy
+
+requires_numpy = pytest.mark.skipif(_numpy() is None, reason="NumPy não instalado")
+
+# Vetores do artigo original do RIPEMD-160
+VECTORS = (
+    (b"", "9c1185a5c5e9fc54612808977ee8f548b2258d31"),
+    (b"a", "0bdc9d2d256b3ee9daae347be6f4dc835a467ffe"),
+    (b"abc", "8eb208f7e05d987a9b044a8e98c6b087f15a0bfc"),
+    (b"message digest", "5d0689ef49d2fae572b881b123a85ffa21595f36"),
+    (b"abcdefghijklmnopqrstuvwxyz", "f71c27109c692c1b56bbdceb5b9d2865b3708dbc"),
+    (b"abcdbcdecdefdefgefghfghighijhijkijkljklmklmnlmnomnopnopq",
+     "12a053384a9c0c88e405a06c27dcf49ada62eb2b"),
+    (b"1234567890" * 8, "9b752e45573d4b39f4dbd3323cab82bf63326bfb"),
+)
+
+SIZES = (0, 1, 20, 32, 33, 55, 56, 63, 64, 65, 119, 120, 1000)
+
+
+def _hashlib_ripemd160():
+    try:
+        return hashlib.new("ripemd160")
+    except ValueError:
+        return None
+
+
+def _random_messages(rng, count, sizes):
+    return [rng.randbytes(rng.choice(sizes)) for _ in range(count)]
+
+
+@pytest.mark.parametrize("message, expected", VECTORS)
+def test_digest_vectors(message, expected):
+    assert Ripemd160().digest(message).hex() == expected
+
+
+@pytest.mark.skipif(_hashlib_ripemd160() is None, reason="hashlib sem RIPEMD-160")
+@pytest.mark.parametrize("size", SIZES)
+def test_digest_matches_hashlib(size):
+    message = random.Random(size).randbytes(size)
+    assert Ripemd160().digest(message) == hashlib.new("ripemd160", message).digest()
+
+
+def test_digest_many_pure_python():
+    ripemd160 = Ripemd160()
+    messages = _random_messages(random.Random(1), 100, SIZES)
+    assert ripemd160.digest_many(messages, use_numpy=False) == \
+        [ripemd160.digest(m) for m in messages]
+
+
+@requires_numpy
+@pytest.mark.parametrize("batch_size", (7, 64, 4096))
+def test_digest_many_numpy_lanes_match_scalar(batch_size):
+    ripemd160 = Ripemd160()
+    rng = random.Random(batch_size)
+    messages = _random_messages(rng, 300, (32, 20, 33, 55, 56, 64, 100))
+    assert ripemd160.digest_many(messages, batch_size, use_numpy=True) == \
+        [ripemd160.digest(m) for m in messages]
+
+
+def test_hash160_matches_composition():
+    rng = random.Random(2)
+    for size in (33, 65):
+        data = rng.randbytes(size)
+        assert Ripemd160.hash160(data) == Ripemd160().digest(SHA256.sha256(data))
+
+
+@pytest.mark.parametrize("use_numpy", (
+    False, pytest.param(True, marks=requires_numpy),
+))
+def test_hash160_many_matches_hash160(use_numpy):
+    public_keys = _random_messages(random.Random(3), 200, (33, 65))
+    assert Ripemd160.hash160_many(public_keys, 50, use_numpy) == \
+        [Ripemd160.hash160(k) for k in public_keys]
@@ -0,0 +1,53 @@
+import asyncio
+import json
+
+import pytest
+
+from service.server import LINE_LIMIT, DerivationService
+
+
+async def _exchange(path, payload):
+    """Envia payload, fecha a escrita e lê as respostas até o servidor encerrar a conexão."""
+    reader, writer = await asyncio.open_unix_connection(path)
+    writer.write(payload)
+    await writer.drain()
+    writer.write_eof()
+    responses = [json.loads(line) async for line in reader]
+    writer.close()
+    return responses
+
+
+@pytest.fixture(scope="module")
+def service_path(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("service") / "service.sock")
+    loop = asyncio.new_event_loop()
+    service = DerivationService(workers=1)
+    loop.run_until_complete(service.start(unix_path=path))
+    yield loop, path
+    service.close()
+    loop.run_until_complete(asyncio.sleep(0))
+    loop.close()
+
+
+def test_requests_get_responses(service_path):
+    loop, path = service_path
+    payload = b"".join(json.dumps(request).encode() + b"\n" for request in (
+        {"id": 1, "op": "wif_encode", "key": "1", "compressed": True},
+        {"id": 2, "op": "derive", "key": "zz"},
+        {"id": 3, "op": "unknown"},
+    )) + b"not json\n"
+    responses = {response["id"]: response for response in loop.run_until_complete(_exchange(path, payload))}
+    assert responses[1]["ok"]
+    assert not responses[2]["ok"]
+    assert not responses[3]["ok"]
+    assert not responses[None]["ok"]
+
+
+def test_oversized_line_gets_error_and_pending_responses(service_path):
+    loop, path = service_path
+    payload = b'{"id": 1, "op": "wif_encode", "key": "1"}\n' + b"x" * (LINE_LIMIT + 10) + b"\n"
+    responses = loop.run_until_complete(_exchange(path, payload))
+    by_id = {response["id"]: response for response in responses}
+    assert len(responses) == 2
+    assert by_id[1]["ok"]
+    assert not by_id[None]["ok"] and str(LINE_LIMIT) in by_id[None]["error"]
@@ -0,0 +1,90 @@
+import hashlib
+import random
+
+import pytest
+
+from crypto.sha256 import SHA256, _numpy
+
+requires_numpy = pytest.mark.skipif(_numpy() is None, reason="NumPy não instalado")
+
+# Tamanhos nas bordas do preenchimento: 55/56 bytes e múltiplos de 64
+SIZES = (0, 1, 32, 33, 55, 56, 63, 64, 65, 119, 120, 128, 1000)
+
+
+def _random_messages(rng, count, sizes):
+    return [rng.randbytes(rng.choice(sizes)) for _ in range(count)]
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_sha256_matches_hashlib(size):
+    message = random.Random(size).randbytes(size)
+    assert SHA256.sha256(message) == hashlib.sha256(message).digest()
+
+
+def test_streaming_updates_match_one_shot():
+    rng = random.Random(1)
+    message = rng.randbytes(1000)
+    hasher = SHA256()
+    position = 0
+    while position < len(message):
+        step = rng.randint(0, 130)
+        hasher.update(message[position:position + step])
+        position += step
+    assert hasher.digest() == hashlib.sha256(message).digest()
+
+
+def test_copy_is_independent():
+    hasher = SHA256(b"hello ")
+    clone = hasher.copy()
+    clone.update(b"world")
+    assert hasher.digest() == hashlib.sha256(b"hello ").digest()
+    assert clone.digest() == hashlib.sha256(b"hello world").digest()
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_hash256_and_checksum4(size):
+    data = random.Random(size).randbytes(size)
+    expected = hashlib.sha256(hashlib.sha256(data).digest()).digest()
+    assert SHA256.hash256(data) == expected
+    assert SHA256.checksum4(data) == expected[:4]
+
+
+def test_checksum4_many_matches_checksum4():
+    payloads = _random_messages(random.Random(2), 200, SIZES)
+    assert SHA256.checksum4_many(payloads) == [SHA256.checksum4(p) for p in payloads]
+
+
+def test_sha256_many_pure_python():
+    messages = _random_messages(random.Random(3), 100, SIZES)
+    assert SHA256.sha256_many(messages, use_numpy=False) == [SHA256.sha256(m) for m in messages]
+
+
+@requires_numpy
+@pytest.mark.parametrize("batch_size", (7, 64, 4096))
+def test_sha256_many_numpy_lanes_match_scalar(batch_size):
+    # Grupos grandes o suficiente (>= MIN_NUMPY_LANES) para passar pelo caminho vetorizado
+    rng = random.Random(batch_size)
+    messages = _random_messages(rng, 300, (33, 65, 32, 55, 56, 64, 100))
+    assert SHA256.sha256_many(messages, batch_size, use_numpy=True) == \
+        [SHA256.sha256(m) for m in messages]
+
+
+@requires_numpy
+def test_sha256_many_numpy_small_groups_fall_back():
+    messages = _random_messages(random.Random(4), 40, SIZES)
+    assert SHA256.sha256_many(messages, use_numpy=True) == [SHA256.sha256(m) for m in messages]
+
+
+def test_sha256_many_requires_numpy_when_forced(monkeypatch):
+    import crypto.sha256 as module
+    monkeypatch.setattr(module, "_numpy", lambda: None)
+    with pytest.raises(ImportError):
+        SHA256.sha256_many([b"a"], use_numpy=True)
+
+
+@pytest.mark.parametrize("size", (0, 1000, SHA256.MMAP_THRESHOLD + 7))
+def test_hash_file(tmp_path, size):
+    data = random.Random(size).randbytes(size)
+    path = tmp_path / "data.bin"
+    path.write_bytes(data)
+    assert SHA256.hash_file(str(path), chunk_size=1 << 16) == hashlib.sha256(data).digest()
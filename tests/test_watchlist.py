@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+import bitcoin.watchlist as watchlist_module
+from bitcoin.address import Address
+from bitcoin.watchlist import Hash160Watchlist
+from crypto.sha256 import _numpy
+
+ADDRESS = "1BgGZ9tcN4rm9KBzDn7KprQz87SZ26SAMH"
+
+
+def _hash160s(seed, count):
+    rng = random.Random(seed)
+    values = [rng.randbytes(20) for _ in range(count)]
+    return values + values[:10]
+
+
+@pytest.mark.parametrize("use_numpy", (
+    False, pytest.param(True, marks=pytest.mark.skipif(_numpy() is None, reason="NumPy não instalado")),
+))
+def test_build_and_lookup(tmp_path, monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(watchlist_module, "_numpy", lambda: None)
+    hash160s = _hash160s(1, 500)
+    path = tmp_path / "watchlist.bin"
+    watchlist = Hash160Watchlist.build(str(path), hash160s, addresses=[ADDRESS])
+    try:
+        assert len(watchlist) == 501
+        assert all(h in watchlist for h in hash160s)
+        assert watchlist.contains_address(ADDRESS)
+        assert not any(h in watchlist for h in _hash160s(2, 200))
+    finally:
+        watchlist.close()
+
+
+def test_numpy_and_pure_python_indexes_match(tmp_path, monkeypatch):
+    if _numpy() is None:
+        pytest.skip("NumPy não instalado")
+    hash160s = _hash160s(3, 300)
+    Hash160Watchlist.build(str(tmp_path / "numpy.bin"), hash160s).close()
+    monkeypatch.setattr(watchlist_module, "_numpy", lambda: None)
+    Hash160Watchlist.build(str(tmp_path / "python.bin"), hash160s).close()
+    assert (tmp_path / "numpy.bin").read_bytes() == (tmp_path / "python.bin").read_bytes()
+
+
+def test_empty_watchlist(tmp_path):
+    watchlist = Hash160Watchlist.build(str(tmp_path / "empty.bin"))
+    try:
+        assert len(watchlist) == 0
+        assert Address().ripemd160.hash160(b"\x02" * 33) not in watchlist
+    finally:
+        watchlist.close()
@@ -0,0 +1,110 @@
+import io
+
+import pytest
+
+from base.base58 import Base58
+from bitcoin.keys import SECP256K1_ORDER
+from bitcoin.records import FLAG_TESTNET, FLAG_WIF_COMPRESSED, RecordReader
+from bitcoin.wif import (
+    STATUS_INVALID_BASE58, STATUS_INVALID_CHECKSUM, STATUS_INVALID_KEY, STATUS_INVALID_LENGTH,
+    STATUS_INVALID_NETWORK, STATUS_OK, WIF,
+)
+
+WIF_COMPRESSED = "KwDiBf89QgGbjEhKnhXJuH7LrciVrZi3qYjgd9M7rFU73sVHnoWn"
+WIF_UNCOMPRESSED = "5HpHagT65TZzG1PH3CSu63k8DbpvD8s5ip4nEB3kEsreAnchuDf"
+
+KEY_1 = (1).to_bytes(32, "big")
+
+
+def _check(payload):
+    return Base58().encode_check(payload)
+
+
+# (WIF, status esperado)
+CASES = (
+    (WIF_COMPRESSED, STATUS_OK),
+    (WIF_UNCOMPRESSED, STATUS_OK),
+    (_check(b"\xef" + KEY_1 + b"\x01"), STATUS_OK),
+    ("5HpHagT65TZzG1PH3CSu63k8DbpvD8s5ip4nEB3kEsreAnch0Df", STATUS_INVALID_BASE58),
+    (_check(b"\x80" + KEY_1[:20]), STATUS_INVALID_LENGTH),
+    (_check(b"\x80" + KEY_1 + b"\x02"), STATUS_INVALID_LENGTH),
+    (WIF_COMPRESSED[:-1] + ("o" if WIF_COMPRESSED[-1] != "o" else "p"), STATUS_INVALID_CHECKSUM),
+    (_check(b"\x81" + KEY_1), STATUS_INVALID_NETWORK),
+    (_check(b"\x80" + bytes(32)), STATUS_INVALID_KEY),
+    (_check(b"\x80" + SECP256K1_ORDER.to_bytes(32, "big") + b"\x01"), STATUS_INVALID_KEY),
+)
+
+
+def test_encode_known_vectors():
+    wif = WIF()
+    assert wif.private_key_to_WIF(1, compressed=True) == WIF_COMPRESSED
+    assert wif.private_key_to_WIF("1") == WIF_UNCOMPRESSED
+    assert wif.private_key_bytes_to_WIF(KEY_1, compressed=True) == WIF_COMPRESSED
+
+
+def test_decode_round_trip():
+    wif = WIF()
+    assert wif.WIF_to_privatekey(WIF_COMPRESSED, integer=True) == (1, True)
+    assert wif.WIF_to_private_key_bytes(WIF_UNCOMPRESSED) == (KEY_1, False)
+
+
+@pytest.mark.parametrize("value", ("", "1", "5Hp", _check(b"\x80" + KEY_1[:20])))
+def test_short_input_raises_value_error(value):
+    with pytest.raises(ValueError):
+        WIF().WIF_to_private_key_bytes(value)
+
+
+@pytest.mark.parametrize("value, status", CASES)
+def test_decode_batch_status(value, status):
+    assert WIF().decode_batch([value])[0][3] == status
+
+
+def test_decode_batch_results():
+    key, compressed, network, status = WIF().decode_batch([CASES[2][0]], integer=True)[0]
+    assert (key, compressed, network, status) == (1, True, "testnet", STATUS_OK)
+
+
+@pytest.mark.parametrize("jobs", (1, 2))
+def test_decode_many_reports_line_numbers(jobs):
+    lines = [value + "\n" for value, _ in CASES] + ["\n", WIF_COMPRESSED + "\n"]
+    errors = io.StringIO()
+    results = list(WIF().decode_many(lines, integer=True, errors=errors, batch_size=3, jobs=jobs))
+    assert [status for *_, status in results] == [status for _, status in CASES] + [STATUS_OK]
+    # Os números contam as linhas em branco
+    expected = [
+        f"{number}\t{status}\t{value}"
+        for number, (value, status) in enumerate(CASES, 1) if status != STATUS_OK
+    ]
+    assert errors.getvalue().splitlines() == expected
+
+
+@pytest.mark.parametrize("jobs", (1, 2))
+def test_decode_file(tmp_path, jobs):
+    source = tmp_path / "wifs.txt"
+    source.write_text("".join(value + "\n" for value, _ in CASES), encoding="utf-8")
+    output, errors = tmp_path / "keys.bin", tmp_path / "errors.txt"
+    written, invalid = WIF().decode_file(str(source), str(output), str(errors), jobs=jobs, chunk_size=2)
+    assert written == sum(status == STATUS_OK for _, status in CASES)
+    assert invalid == len(CASES) - written
+    assert len(errors.read_text(encoding="utf-8").splitlines()) == invalid
+    with RecordReader(str(output)) as reader:
+        mask = FLAG_WIF_COMPRESSED | FLAG_TESTNET
+        records = [(bytes(record.private_key), record.flags & mask) for record in reader]
+    assert records == [
+        (KEY_1, FLAG_WIF_COMPRESSED),
+        (KEY_1, 0),
+        (KEY_1, FLAG_WIF_COMPRESSED | FLAG_TESTNET),
+    ]
+
+
+def test_encode_batch_matches_private_key_to_WIF():
+    wif = WIF()
+    values = ["1", "ff", "zz", "0", format(SECP256K1_ORDER, "x"), "0x2"]
+    results = wif.encode_batch(values, compressed=False, testnet=True)
+    assert [status for _, status in results] == [
+        STATUS_OK, STATUS_OK, "invalid_format", "out_of_range", "out_of_range", STATUS_OK,
+    ]
+    assert [encoded for encoded, _ in results] == [
+        wif.private_key_to_WIF(1, False, True), wif.private_key_to_WIF(255, False, True), None, None, None,
+        wif.private_key_to_WIF(2, False, True),
+    ]